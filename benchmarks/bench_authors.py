@@ -0,0 +1,84 @@
+"""Parsing author names with and without the split_name cache
+
+Converts a record with 1000 authors given only as name strings, as in
+large collaboration papers, with HumanName called for every name, and with
+the split_name cache, both for the first record read (empty cache) and for
+further records with the same authors. Reports microseconds per author.
+
+Run from the repository root with: python -m benchmarks.bench_authors
+"""
+import time
+from unittest import mock
+
+from commonmeta import author_utils
+from commonmeta.author_utils import get_authors, split_name
+
+AUTHORS = 1000
+RECORDS = 10
+GIVEN_NAMES = ["Anna", "Bo", "Carlos", "Dmitri", "Elena", "Fatima", "Hiroshi", "Ines"]
+MIDDLE_NAMES = ["", "J. ", "K. L. ", "Maria ", "T. "]
+FAMILY_NAMES = [
+    "Smith",
+    "van der Berg",
+    "Garcia-Lopez",
+    "O'Brien",
+    "Nakamura",
+    "Kowalski",
+    "Okafor",
+    "Larsen",
+    "Dubois",
+    "Rossi",
+    "Novak",
+    "Haddad",
+    "Chen",
+    "Silva",
+    "Müller",
+    "Ivanova",
+    "Kaplan",
+    "Moreau",
+    "Singh",
+    "Andersson",
+    "Costa",
+    "Yilmaz",
+    "Nguyen",
+    "Schmidt",
+    "Popescu",
+]
+
+
+def authors() -> list:
+    """authors of a record, with name but without type, given and family
+    name, so that each name is checked with is_personal_name and split"""
+    return [
+        {"name": f"{given} {middle}{family}"}
+        for family in FAMILY_NAMES
+        for middle in MIDDLE_NAMES
+        for given in GIVEN_NAMES
+    ][:AUTHORS]
+
+
+def microseconds_per_author(records: list) -> float:
+    """time of get_authors for each record, per author in microseconds"""
+    start = time.perf_counter()
+    for record in records:
+        get_authors(record)
+    return (time.perf_counter() - start) / (len(records) * AUTHORS) * 1e6
+
+
+def main():
+    records = [authors() for _ in range(RECORDS)]
+    with mock.patch.object(author_utils, "split_name", split_name.__wrapped__):
+        uncached = microseconds_per_author(records)
+    split_name.cache_clear()
+    first = microseconds_per_author(records[:1])
+    further = microseconds_per_author(records[1:])
+    print(f"HumanName for every author: {uncached:.1f} µs/author")
+    print(f"split_name, first record: {first:.1f} µs/author")
+    print(
+        f"split_name, further records: {further:.1f} µs/author "
+        f"({uncached / further:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Reading Crossref XML with the xmltodict and lxml engines
+
+Reads the Crossref XML fixture many times, parsing the whole document with
+parse_xml or lxml, and streams a file with many copies of its query with
+read_crossref_xml_file, reporting records per second for each engine. Date
+parsing takes most of the time with both engines, so the benchmark is
+repeated with get_iso8601_date replaced by a no-op.
+
+Run from the repository root with: python -m benchmarks.bench_crossref_xml
+"""
+import os
+import tempfile
+import time
+from os import path
+from unittest import mock
+
+from lxml import etree
+
+from commonmeta.base_utils import parse_xml
+from commonmeta.http_utils import set_offline
+from commonmeta.readers import (
+    crossref_xml_reader,
+    read_crossref_xml,
+    read_crossref_xml_file,
+)
+
+FIXTURE = path.join(path.dirname(__file__), "..", "tests", "fixtures", "crossref.xml")
+RECORDS = 500
+
+
+def read_document(xml: str, engine: str):
+    """read a whole Crossref XML document"""
+    if engine == "lxml":
+        return read_crossref_xml(etree.fromstring(xml.encode("utf-8")))
+    return read_crossref_xml(parse_xml(xml, dialect="crossref"))
+
+
+def rate(function, count: int) -> float:
+    """records per second of count calls of function"""
+    start = time.perf_counter()
+    for _ in range(count):
+        function()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    set_offline()
+    with open(FIXTURE, encoding="utf-8") as file:
+        xml = file.read()
+    assert read_document(xml, "lxml") == read_document(xml, "xmltodict")
+    start = xml.index("<query ")
+    end = xml.index("</query>") + len("</query>")
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "crossref.xml")
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(xml[:start] + xml[start:end] * RECORDS + xml[end:])
+        print("with date parsing")
+        benchmark(xml, file_path)
+        with mock.patch.object(
+            crossref_xml_reader, "get_iso8601_date", lambda date: date
+        ):
+            print("without date parsing")
+            benchmark(xml, file_path)
+
+
+def benchmark(xml: str, file_path: str):
+    """print records per second of each engine"""
+    for engine in ["xmltodict", "lxml"]:
+        document = rate(lambda engine=engine: read_document(xml, engine), RECORDS)
+        start = time.perf_counter()
+        count = sum(1 for _ in read_crossref_xml_file(file_path, engine=engine))
+        stream = count / (time.perf_counter() - start)
+        print(
+            f"  {engine}: document {document:.0f} records/s, "
+            f"file of {count} records {stream:.0f} records/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Microbenchmark for identifier validation and normalization
+
+Compares matching with literal patterns via the re module (as done before
+patterns were precompiled), the precompiled patterns without memoization,
+and the memoized functions, on a workload where identifiers repeat across
+records as they do in a bulk DataCite or Crossref harvest.
+
+Run from the repository root with: python -m benchmarks.bench_identifiers
+"""
+import re
+import timeit
+
+from commonmeta import doi_utils, utils
+
+DOI_PATTERN = r"\A(?:(http|https):/(/)?(dx\.)?(doi\.org|handle\.stage\.datacite\.org|handle\.test\.datacite\.org)/)?(doi:)?(10\.\d{4,5}/.+)\Z"  # noqa: E501
+ORCID_PATTERN = r"\A(?:(?:http|https)://(?:(?:www|sandbox)?\.)?orcid\.org/)?(\d{4}[ -]\d{4}[ -]\d{4}[ -]\d{3}[0-9X]+)\Z"  # noqa: E501
+
+IDENTIFIERS = [
+    "https://doi.org/10.5438/4K3M-NYVG",
+    "10.7554/elife.01567",
+    "https://orcid.org/0000-0003-1419-2405",
+    "https://ror.org/04wxnsj81",
+    "https://blog.datacite.org/eating-your-own-dog-food",
+] * 200
+
+
+def literal_patterns():
+    """match with literal patterns, looked up in the re module cache"""
+    for pid in IDENTIFIERS:
+        re.search(DOI_PATTERN, pid)
+        re.search(ORCID_PATTERN, pid)
+
+
+def compiled_patterns():
+    """match with precompiled patterns"""
+    for pid in IDENTIFIERS:
+        doi_utils.DOI_REGEX.search(pid)
+        utils.ORCID_REGEX.search(pid)
+
+
+def memoized():
+    """memoized validation"""
+    for pid in IDENTIFIERS:
+        doi_utils.validate_doi(pid)
+        utils.validate_orcid(pid)
+
+
+def normalize_id_uncached():
+    """normalize_id with caches cleared before every call"""
+    for pid in IDENTIFIERS:
+        clear_caches()
+        utils.normalize_id(pid)
+
+
+def normalize_id_memoized():
+    """normalize_id with warm caches"""
+    for pid in IDENTIFIERS:
+        utils.normalize_id(pid)
+
+
+def clear_caches():
+    """clear all identifier caches"""
+    for func in [
+        doi_utils.validate_doi,
+        doi_utils._normalize_doi,  # pylint: disable=protected-access
+        utils._normalize_id,  # pylint: disable=protected-access
+    ]:
+        func.cache_clear()
+
+
+def main():
+    """run benchmarks and report time per identifier"""
+    for func in [
+        literal_patterns,
+        compiled_patterns,
+        memoized,
+        normalize_id_uncached,
+        normalize_id_memoized,
+    ]:
+        seconds = min(timeit.repeat(func, number=10, repeat=5)) / 10
+        print(f"{func.__name__:24} {seconds / len(IDENTIFIERS) * 1e6:8.3f} µs/id")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Memory use of many Metadata and CompactMetadata objects
+
+Reads the same Crossref and DataCite records many times, each from its own
+JSON string as in a bulk harvest, and reports the memory held by the
+resulting objects, measured with tracemalloc.
+
+Run from the repository root with: python -m benchmarks.bench_memory
+"""
+import gc
+import json
+import tracemalloc
+from os import path
+
+from commonmeta import Metadata, CompactMetadata
+from commonmeta.http_utils import set_offline
+
+FIXTURES = path.join(path.dirname(__file__), "..", "tests", "fixtures")
+RECORDS = 2000
+
+
+def load(file_name: str, via: str) -> str:
+    """fixture as a JSON string of the API payload"""
+    with open(path.join(FIXTURES, file_name), encoding="utf-8") as file:
+        data = json.load(file)
+    return json.dumps(data.get("message", data))
+
+
+def measure(strings, via, compact):
+    """memory held by objects read from strings, in bytes"""
+    gc.collect()
+    tracemalloc.start()
+    objects = []
+    for string in strings:
+        metadata = Metadata(string, via=via)
+        objects.append(CompactMetadata.from_metadata(metadata) if compact else metadata)
+        del metadata
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    set_offline()
+    for file_name, via in [("crossref.json", "crossref"), ("datacite.json", "datacite")]:
+        strings = [load(file_name, via) for _ in range(RECORDS)]
+        regular = measure(strings, via, compact=False)
+        compact = measure(strings, via, compact=True)
+        print(
+            f"{file_name}: {RECORDS} records, "
+            f"Metadata {regular / RECORDS / 1024:.1f} KiB/record, "
+            f"CompactMetadata {compact / RECORDS / 1024:.1f} KiB/record "
+            f"({1 - compact / regular:.0%} less)"
+        )
+
+
+if __name__ == "__main__":
+    main()
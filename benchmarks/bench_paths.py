@@ -0,0 +1,112 @@
+"""Path lookups with py_.get and get_path
+
+Times lookups of nested values by dotted path with py_.get, which parses
+the path on every call, and with get_path, which compiles each path once.
+Then times the readers using get_path, and the same readers with get_path
+replaced by py_.get. Some readers modify their input, so each record is
+read from a deep copy of the fixture, which takes the same time in both.
+
+Run from the repository root with: python -m benchmarks.bench_paths
+"""
+import json
+import time
+from contextlib import ExitStack
+from copy import deepcopy
+from os import path
+from unittest import mock
+
+from pydash import py_
+
+from commonmeta.base_utils import get_path, parse_xml
+from commonmeta.http_utils import set_offline
+from commonmeta.readers import (
+    crossref_reader,
+    crossref_xml_reader,
+    inveniordm_reader,
+    json_feed_reader,
+    kbase_reader,
+    schema_org_reader,
+)
+
+FIXTURES = path.join(path.dirname(__file__), "..", "tests", "fixtures")
+LOOKUPS = 200000
+RECORDS = 2000
+PATHS = [
+    "issued.date-time",
+    "resource.primary.URL",
+    "journal-issue.issue",
+    "title.0",
+    "missing.date-time",
+]
+
+
+def load(file_name: str):
+    """fixture parsed as done by Metadata"""
+    file_path = path.join(FIXTURES, file_name)
+    if file_name.endswith(".xml"):
+        return parse_xml(file_path, dialect="crossref")
+    with open(file_path, encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get("message", data) if file_name == "crossref.json" else data
+
+
+READERS = [
+    (crossref_reader, crossref_reader.read_crossref, "crossref.json"),
+    (crossref_xml_reader, crossref_xml_reader.read_crossref_xml, "crossref.xml"),
+    (inveniordm_reader, inveniordm_reader.read_inveniordm, "inveniordm-software.json"),
+    (json_feed_reader, json_feed_reader.read_json_feed_item, "json_feed.json"),
+    (schema_org_reader, schema_org_reader.read_schema_org, "schema_org.json"),
+    (
+        kbase_reader,
+        kbase_reader.read_kbase,
+        "JDP_5fa4fb4647675a20c852c60b_kbcms.json",
+    ),
+]
+
+
+def seconds(function, count: int) -> float:
+    """time of count calls of function, in seconds"""
+    start = time.perf_counter()
+    for _ in range(count):
+        function()
+    return time.perf_counter() - start
+
+
+def main():
+    set_offline()
+    meta = load("crossref.json")
+    for key in PATHS:
+        assert get_path(meta, key) == py_.get(meta, key)
+        pydash = seconds(lambda key=key: py_.get(meta, key), LOOKUPS)
+        compiled = seconds(lambda key=key: get_path(meta, key), LOOKUPS)
+        print(
+            f"{key}: py_.get {pydash / LOOKUPS * 1e6:.2f} µs, "
+            f"get_path {compiled / LOOKUPS * 1e6:.2f} µs "
+            f"({pydash / compiled:.1f}x)"
+        )
+    for module, read, file_name in READERS:
+        data = load(file_name)
+        expected = read(deepcopy(data))
+        compiled = seconds(lambda: read(deepcopy(data)), RECORDS)
+        with ExitStack() as stack:
+            stack.enter_context(mock.patch.object(module, "get_path", py_.get))
+            if module is crossref_xml_reader:
+                # get_path is also the default of the get and find arguments
+                stack.enter_context(
+                    mock.patch.object(
+                        module.read_crossref_xml_record,
+                        "__defaults__",
+                        (py_.get, py_.get),
+                    )
+                )
+            assert read(deepcopy(data)) == expected
+            pydash = seconds(lambda: read(deepcopy(data)), RECORDS)
+        print(
+            f"{read.__name__}: py_.get {RECORDS / pydash:.0f} records/s, "
+            f"get_path {RECORDS / compiled:.0f} records/s "
+            f"({pydash / compiled - 1:+.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
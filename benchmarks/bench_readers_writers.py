@@ -0,0 +1,233 @@
+"""Records per second and peak memory of every reader and writer
+
+Reads one record from each fixture in tests/fixtures, both from the parsed
+fixture and from the fixture string, and writes records read from Crossref,
+DataCite and InvenioRDM fixtures in every output format. Network calls are
+answered by a local stub, so that results only depend on the code being
+measured. Some readers modify their input, so every round gets a copy.
+
+Results can be saved, and compared with the saved results, failing if any
+reader or writer got slower by more than the threshold:
+
+    python -m benchmarks.bench_readers_writers --save
+    python -m benchmarks.bench_readers_writers --compare --threshold 0.1
+
+Run from the repository root with: python -m benchmarks.bench_readers_writers
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+from copy import deepcopy
+from os import path
+
+import requests
+import yaml
+from requests.adapters import BaseAdapter
+
+from commonmeta import Metadata
+from commonmeta.base_utils import parse_xml
+from commonmeta.http_utils import set_session
+from commonmeta.readers import (
+    read_cff,
+    read_codemeta,
+    read_commonmeta,
+    read_crossref,
+    read_crossref_xml,
+    read_csl,
+    read_datacite,
+    read_datacite_xml,
+    read_inveniordm,
+    read_json_feed_item,
+    read_kbase,
+    read_ris,
+    read_schema_org,
+)
+from commonmeta.writers import (
+    write_bibtex,
+    write_citation,
+    write_commonmeta,
+    write_crossref_xml,
+    write_csl,
+    write_datacite,
+    write_ris,
+    write_schema_org,
+)
+
+FIXTURES = path.join(path.dirname(__file__), "..", "tests", "fixtures")
+RESULTS = path.join(path.dirname(__file__), "..", ".benchmarks", "readers_writers.json")
+ROUNDS = 50
+
+
+def parse_crossref_xml(string):
+    """parse Crossref XML as done by Metadata"""
+    return parse_xml(string, dialect="crossref")
+
+
+READERS = [
+    ("commonmeta", read_commonmeta, "commonmeta.json", json.loads),
+    ("crossref", read_crossref, "crossref.json", json.loads),
+    ("crossref_xml", read_crossref_xml, "crossref.xml", parse_crossref_xml),
+    ("datacite", read_datacite, "datacite.json", json.loads),
+    ("datacite_xml", read_datacite_xml, "datacite.xml", parse_xml),
+    (
+        "datacite_xml_geo",
+        read_datacite_xml,
+        "datacite-example-polygon-v4.1.xml",
+        parse_xml,
+    ),
+    ("schema_org", read_schema_org, "schema_org_topmed.json", json.loads),
+    ("csl", read_csl, "citeproc.json", json.loads),
+    ("codemeta", read_codemeta, "codemeta.json", json.loads),
+    ("cff", read_cff, "CITATION.cff", yaml.safe_load),
+    ("inveniordm", read_inveniordm, "inveniordm-software.json", json.loads),
+    ("json_feed_item", read_json_feed_item, "json_feed.json", json.loads),
+    ("kbase", read_kbase, "10.25982_86723.65_1778009_kbcms.json", json.loads),
+    ("ris", read_ris, "crossref.ris", lambda string: string),
+]
+
+WRITERS = [
+    ("bibtex", write_bibtex),
+    ("citation", write_citation),
+    ("commonmeta", write_commonmeta),
+    ("crossref_xml", write_crossref_xml),
+    ("csl", write_csl),
+    ("datacite", write_datacite),
+    ("ris", write_ris),
+    ("schema_org", write_schema_org),
+]
+
+WRITER_FIXTURES = [
+    ("crossref", "crossref.json"),
+    ("datacite_xml", "datacite.xml"),
+    ("inveniordm", "inveniordm-software.json"),
+]
+
+
+class StubAdapter(BaseAdapter):
+    """Adapter answering DOI registration agency and Crossref member lookups
+    with canned responses, and all other requests with 404"""
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        # pylint: disable=protected-access
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.headers["Content-Type"] = "application/json"
+        ra = re.match(r"\Ahttps://doi\.org/ra/(.+)\Z", request.url)
+        member = re.match(r"\Ahttps://api\.crossref\.org/members/(.+)\Z", request.url)
+        if ra is not None:
+            body = [{"DOI": ra.group(1), "RA": "Crossref"}]
+        elif member is not None:
+            body = {"message": {"id": member.group(1), "primary-name": "Publisher"}}
+        else:
+            response.status_code = 404
+            response._content = b"{}"
+            return response
+        response.status_code = 200
+        response._content = json.dumps(body).encode("utf-8")
+        return response
+
+    def close(self):
+        pass
+
+
+def read_fixture(file_name: str) -> str:
+    """content of a file in tests/fixtures"""
+    with open(path.join(FIXTURES, file_name), encoding="utf-8") as file:
+        return file.read()
+
+
+def measure(function, *args) -> dict:
+    """records per second, with one record per call of function, and peak
+    memory in KiB of one call. Setup and copying args are not timed."""
+    function(*deepcopy(args))
+    elapsed = 0.0
+    for _ in range(ROUNDS):
+        copied = deepcopy(args)
+        start = time.perf_counter()
+        result = function(*copied)
+        elapsed += time.perf_counter() - start
+    assert result is not None
+    copied = deepcopy(args)
+    tracemalloc.start()
+    try:
+        function(*copied)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "records_per_second": round(ROUNDS / elapsed),
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+
+def run() -> dict:
+    """results of all readers and writers by name"""
+    results = {}
+    for name, reader, file_name, parse in READERS:
+        string = read_fixture(file_name)
+        results[f"read/{name}"] = measure(reader, parse(string))
+        results[f"parse_and_read/{name}"] = measure(
+            lambda string, reader=reader, parse=parse: reader(parse(string)), string
+        )
+    for fixture_name, file_name in WRITER_FIXTURES:
+        metadata = Metadata(path.join(FIXTURES, file_name))
+        for name, writer in WRITERS:
+            results[f"write/{name}/{fixture_name}"] = measure(writer, metadata)
+    return results
+
+
+def compare(results: dict, saved: dict, threshold: float) -> list:
+    """names of readers and writers slower than saved by more than threshold"""
+    slower = []
+    for name, result in results.items():
+        if name not in saved:
+            continue
+        change = result["records_per_second"] / saved[name]["records_per_second"] - 1
+        print(f"{name}: {change:+.0%} records/s compared with saved results")
+        if change < -threshold:
+            slower.append(name)
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help=f"save to {RESULTS}")
+    parser.add_argument(
+        "--compare", action="store_true", help="compare with saved results"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fail if records/s dropped by more than this fraction",
+    )
+    args = parser.parse_args()
+    session = requests.Session()
+    session.mount("https://", StubAdapter())
+    session.mount("http://", StubAdapter())
+    set_session(session)
+    results = run()
+    for name, result in results.items():
+        print(
+            f"{name}: {result['records_per_second']} records/s, "
+            f"peak memory {result['peak_memory_kib']} KiB"
+        )
+    if args.compare:
+        with open(RESULTS, encoding="utf-8") as file:
+            slower = compare(results, json.load(file), args.threshold)
+        if slower:
+            print(f"slower by more than {args.threshold:.0%}: {', '.join(slower)}")
+            sys.exit(1)
+    if args.save:
+        os.makedirs(path.dirname(RESULTS), exist_ok=True)
+        with open(RESULTS, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,7 @@ __version__ = "0.8.4"
 __author__ = "Martin Fenner"
 __license__ = "MIT"
 
-from .metadata import Metadata
+from .metadata import Metadata, CompactMetadata
 from .readers import (
     cff_reader,
     codemeta_reader,
@@ -1,6 +1,7 @@
 """Author utils module for commonmeta-py"""
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from nameparser import HumanName
 
 from .utils import (
@@ -18,6 +19,9 @@ from .constants import (
     COMMONMETA_CONTRIBUTOR_ROLES,
 )
 
+# number of parsed personal names kept by split_name
+NAME_CACHE_SIZE = 10000
+
 
 def get_one_author(author):
     """parse one author string into commonmeta format"""
@@ -85,16 +89,7 @@ def get_one_author(author):
 
     # split name for type Person into given/family name if not already provided
     if type_ == "Person" and name and not given_name and not family_name:
-        names = HumanName(name)
-
-        if names:
-            given_name = (
-                " ".join([names.first, names.middle]).strip() if names.first else None
-            )
-            family_name = names.last if names.last else None
-        else:
-            given_name = None
-            family_name = None
+        given_name, family_name = split_name(name)
 
     # return author in commonmeta format, using name vs. given/family name
     # depending on type
@@ -156,11 +151,18 @@ def is_personal_name(name):
         return True
 
     # check of name can be parsed into given/family name
-    names = HumanName(name)
-    if names and (names.first or names.last):
-        return True
+    given_name, family_name = split_name(name)
+    return given_name is not None or family_name is not None
+
 
-    return False
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def split_name(name: str) -> Tuple[Optional[str], Optional[str]]:
+    """Split a personal name into given and family name with HumanName.
+    Parsed names are cached, as the same names appear in many records."""
+    names = HumanName(name)
+    given_name = " ".join([names.first, names.middle]).strip() if names.first else None
+    family_name = names.last if names.last else None
+    return given_name, family_name
 
 
 def cleanup_author(author):
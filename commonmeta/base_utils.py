@@ -1,12 +1,29 @@
 """Base utilities for commonmeta-py"""
 import html
+from functools import lru_cache
 from os import path
 import re
+import sys
 import xmltodict
-from typing import Optional, Union
+from typing import Iterable, Optional, Tuple, Union
 import pydash as py_
 import nh3
 
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+# namespaces removed from names in the crossref dialect of parse_xml
+CROSSREF_XML_NAMESPACES = {
+    "http://www.crossref.org/qrschema/3.0": None,
+    "http://www.crossref.org/xschema/1.0": None,
+    "http://www.crossref.org/xschema/1.1": None,
+    "http://www.crossref.org/AccessIndicators.xsd": None,
+    "http://www.crossref.org/fundref.xsd": None,
+    "http://www.ncbi.nlm.nih.gov/JATS1": None,
+}
+# elements always parsed as list in the crossref dialect of parse_xml
+CROSSREF_XML_FORCE_LIST = frozenset(["contributors", "titles", "item", "citation"])
+# marks a key not found by get_path
+MISSING = object()
+
 
 def wrap(item) -> list:
     """Turn None, dict, or list into list"""
@@ -44,6 +61,64 @@ def compact(dict_or_list: Union[dict, list]) -> Optional[Union[dict, list]]:
     return None
 
 
+@lru_cache(maxsize=None)
+def compile_path(path: str) -> Tuple[Tuple[Union[str, int], Optional[int]], ...]:
+    """Split a py_.get path into keys, each with its integer value or None.
+    Compiled paths are cached, so each path is parsed once."""
+    steps = []
+    for key in py_.to_path(path):
+        try:
+            index = int(key)
+        except ValueError:
+            index = None
+        steps.append((key, index))
+    return tuple(steps)
+
+
+def get_path(obj, path: str, default=None):
+    """Get the value at path in nested dicts and lists, the same as py_.get
+    without attribute access, but with the path compiled once"""
+    for key, index in compile_path(path):
+        if isinstance(obj, dict):
+            value = obj.get(key, MISSING)
+            if value is MISSING and index is not None:
+                value = obj.get(index, MISSING)
+            obj = value
+        elif isinstance(obj, (list, tuple, str)) and index is not None:
+            obj = obj[index] if -len(obj) <= index < len(obj) else MISSING
+        else:
+            return default
+        if obj is MISSING:
+            return default
+    return obj
+
+
+def intern_keys(item, value_keys: Iterable[str] = ()):
+    """Copy of nested dicts and lists with interned dict keys, so that
+    records share one copy of each key. Values of value_keys are interned
+    as well, for keys with a small set of values such as types, including
+    the strings in lists such as contributor roles."""
+    if isinstance(item, dict):
+        return {
+            sys.intern(k): intern_value(v)
+            if k in value_keys
+            else intern_keys(v, value_keys)
+            for k, v in item.items()
+        }
+    if isinstance(item, list):
+        return [intern_keys(i, value_keys) for i in item]
+    return item
+
+
+def intern_value(value):
+    """Interned string, or list of strings"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [sys.intern(i) if isinstance(i, str) else i for i in value]
+    return value
+
+
 def parse_attributes(
     element: Union[str, dict, list], **kwargs
 ) -> Optional[Union[str, list]]:
@@ -73,18 +148,9 @@ def parse_xml(string: str, **kwargs) -> Optional[Union[dict, list]]:
 
     if kwargs.get("dialect", None) == "crossref":
         # remove namespaces from xml
-        namespaces = {
-            "http://www.crossref.org/qrschema/3.0": None,
-            "http://www.crossref.org/xschema/1.0": None,
-            "http://www.crossref.org/xschema/1.1": None,
-            "http://www.crossref.org/AccessIndicators.xsd": None,
-            "http://www.crossref.org/fundref.xsd": None,
-            "http://www.ncbi.nlm.nih.gov/JATS1": None,
-        }
-
         kwargs["process_namespaces"] = True
-        kwargs["namespaces"] = namespaces
-        kwargs["force_list"] = {"contributors", "titles", "item", "citation"}
+        kwargs["namespaces"] = CROSSREF_XML_NAMESPACES
+        kwargs["force_list"] = CROSSREF_XML_FORCE_LIST
 
     kwargs["attr_prefix"] = ""
     kwargs["dict_constructor"] = dict
@@ -92,6 +158,100 @@ def parse_xml(string: str, **kwargs) -> Optional[Union[dict, list]]:
     return xmltodict.parse(string, **kwargs)
 
 
+def etree_to_dict(element, parent_nsmap: Optional[dict] = None) -> dict:
+    """Convert an lxml element into a dict of the same shape as parse_xml
+    with default options: names with their prefix, namespace declarations
+    and attributes as keys, text as #text, repeated elements as list."""
+    return {qualified_name(element, element.tag): element_value(element, parent_nsmap)}
+
+
+def element_value(
+    element,
+    parent_nsmap: Optional[dict] = None,
+    dialect: Optional[str] = None,
+    declarations: Optional[dict] = None,
+):
+    """Value of an lxml element, see etree_to_dict. With dialect crossref,
+    the same value as parse_xml with dialect crossref: names with namespace
+    URI, or without namespace for Crossref namespaces, and some elements
+    always as list. Like xmltodict, namespace declarations are added as
+    xmlns dict to the next element with attributes, declarations collects
+    them until then."""
+    crossref = dialect == "crossref"
+    parent_nsmap = parent_nsmap or {}
+    declarations = {} if declarations is None else declarations
+    item: dict = {}
+    nsmap = element.nsmap
+    # namespaces declared on this element
+    for prefix, uri in nsmap.items():
+        if parent_nsmap.get(prefix, None) == uri:
+            continue
+        if crossref:
+            declarations[prefix or ""] = uri
+        else:
+            push_item(item, f"xmlns:{prefix}" if prefix else "xmlns", uri)
+    for name, value in element.attrib.items():
+        key = crossref_name(name) if crossref else qualified_name(element, name)
+        push_item(item, key, value)
+    if crossref and item and declarations:
+        item["xmlns"] = dict(declarations)
+        declarations.clear()
+    text = [element.text or ""]
+    for child in element:
+        if isinstance(child.tag, str):
+            value = element_value(child, nsmap, dialect, declarations)
+            key = (
+                crossref_name(child.tag)
+                if crossref
+                else qualified_name(child, child.tag)
+            )
+            if crossref and key in CROSSREF_XML_FORCE_LIST and key not in item:
+                item[key] = [value]
+            else:
+                push_item(item, key, value)
+        text.append(child.tail or "")
+    data = "".join(text).strip() or None
+    if not item:
+        return data
+    if data is not None:
+        push_item(item, "#text", data)
+    return item
+
+
+def push_item(item: dict, key: str, value) -> None:
+    """Add value to item, turning repeated keys into a list"""
+    if key not in item:
+        item[key] = value
+    elif isinstance(item[key], list):
+        item[key].append(value)
+    else:
+        item[key] = [item[key], value]
+
+
+def qualified_name(element, name: str) -> str:
+    """Element or attribute name with namespace prefix instead of URI"""
+    if not name.startswith("{"):
+        return name
+    uri, local = name[1:].split("}", 1)
+    if uri == XML_NAMESPACE:
+        return f"xml:{local}"
+    prefix = next(
+        (k for k, v in element.nsmap.items() if v == uri and k is not None), None
+    )
+    if prefix is None or (element.prefix is None and name == element.tag):
+        return local
+    return f"{prefix}:{local}"
+
+
+@lru_cache(maxsize=1024)
+def crossref_name(name: str) -> str:
+    """Element or attribute name as in the crossref dialect of parse_xml"""
+    if not name.startswith("{"):
+        return name
+    uri, local = name[1:].split("}", 1)
+    return local if uri in CROSSREF_XML_NAMESPACES else f"{uri}:{local}"
+
+
 def sanitize(text: str, **kwargs) -> str:
     """Sanitize text"""
     # default whitelisted HTML tags
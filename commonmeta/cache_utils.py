@@ -0,0 +1,115 @@
+"""Cache utils for commonmeta-py"""
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache with optional time-to-live (in seconds).
+    If path is given, entries are also written to a sqlite database at that
+    path, so that they survive restarts and can be shared between processes.
+    Entries missing in memory are looked up in the database and promoted.
+    Lookups are counted in hits and misses."""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        path: Optional[str] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value TEXT, timestamp REAL)"
+            )
+            self._db.commit()
+
+    def _expired(self, timestamp: float) -> bool:
+        return self.ttl is not None and time.time() - timestamp > self.ttl
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default"""
+        with self._lock:
+            item = self._data.get(key, None)
+            if item is not None and self._expired(item[1]):
+                del self._data[key]
+                item = None
+            if item is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, timestamp FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and not self._expired(row[1]):
+                    item = (json.loads(row[0]), row[1])
+                    self._store(key, item)
+            if item is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._data.move_to_end(key)
+            return item[0]
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache value for key"""
+        self.update({key: value})
+
+    def update(self, mapping: dict) -> None:
+        """Cache all key/value pairs in mapping, e.g. to pre-seed the cache"""
+        timestamp = time.time()
+        with self._lock:
+            for key, value in mapping.items():
+                self._store(key, (value, timestamp))
+            if self._db is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, timestamp) "
+                    "VALUES (?, ?, ?)",
+                    [(k, json.dumps(v), timestamp) for k, v in mapping.items()],
+                )
+                self._db.commit()
+
+    def load(self, path: str) -> None:
+        """Pre-seed the cache from a JSON file containing a key/value object"""
+        with open(path, encoding="utf-8") as file:
+            self.update(json.load(file))
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._data)}
+
+    def clear(self) -> None:
+        """Remove all entries, including from the database, and reset counters"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self._data.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM cache")
+                self._db.commit()
+
+    def _store(self, key: str, item: tuple) -> None:
+        self._data[key] = item
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+            found = self.get(key, None) is not None
+            self.hits, self.misses = hits, misses
+            return found
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,203 @@
+"""Command line interface for commonmeta-py"""
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Iterable, Iterator, Optional, Tuple
+
+import click
+from tqdm import tqdm
+
+from .metadata import Metadata
+from .file_utils import open_file
+
+WRITER_FORMATS = [
+    "commonmeta",
+    "csl",
+    "bibtex",
+    "ris",
+    "datacite",
+    "schema_org",
+    "crossref_xml",
+    "citation",
+]
+JSON_FORMATS = ["commonmeta", "csl", "datacite", "schema_org"]
+READER_FORMATS = [
+    "commonmeta",
+    "crossref",
+    "crossref_xml",
+    "datacite",
+    "datacite_xml",
+    "schema_org",
+    "csl",
+    "codemeta",
+    "cff",
+    "inveniordm",
+    "json_feed_item",
+    "kbase",
+    "ris",
+]
+LINE_EXTENSIONS = (".jsonl", ".jsonl.gz", ".txt", ".txt.gz")
+
+
+def iter_inputs(inputs: Iterable[str], stdin: IO[str]) -> Iterator[str]:
+    """Expand inputs into strings accepted by Metadata: files of DOIs or
+    JSON Lines (.jsonl, .txt, optionally gzipped) and stdin yield one input
+    per line, directories yield their files, other files are read whole,
+    gzipped files are decompressed and yielded as their content."""
+    for name in inputs or ["-"]:
+        if name == "-":
+            yield from iter_lines(stdin)
+        elif os.path.isdir(name):
+            for root, _, filenames in sorted(os.walk(name)):
+                for filename in sorted(filenames):
+                    yield from iter_inputs([os.path.join(root, filename)], stdin)
+        elif name.endswith(LINE_EXTENSIONS):
+            with open_file(name) as file:
+                yield from iter_lines(file)
+        elif os.path.isfile(name) and name.endswith(".gz"):
+            with open_file(name) as file:
+                yield file.read()
+        elif os.path.isfile(name):
+            yield name
+        else:
+            raise click.BadParameter(f"No such file or directory: {name}")
+
+
+def iter_lines(file: IO[str]) -> Iterator[str]:
+    """Non-empty lines of file, stripped"""
+    for line in iter(file.readline, ""):
+        line = line.strip()
+        if line:
+            yield line
+
+
+def convert_one(
+    string: str, to: str, via: Optional[str], jsonl: bool, offline: Optional[bool]
+) -> Tuple[Optional[str], Optional[str]]:
+    """Convert one input, returning the output and an error message. offline
+    None keeps the process-wide offline mode."""
+    try:
+        kwargs = {"via": via} if via else {}
+        metadata = Metadata(string, offline=offline, **kwargs)
+        output = getattr(metadata, to)()
+        if output is None:
+            return None, "no output"
+        if isinstance(output, bytes):
+            output = output.decode("utf-8")
+        if jsonl:
+            output = (
+                json.dumps(json.loads(output), ensure_ascii=False)
+                if to in JSON_FORMATS
+                else json.dumps(output, ensure_ascii=False)
+            )
+        return output, None
+    except Exception as error:  # pylint: disable=broad-except
+        return None, f"{type(error).__name__}: {error}"
+
+
+def convert_all(
+    strings: Iterable[str], workers: int, **kwargs
+) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+    """Convert inputs in a pool of worker processes, yielding input, output
+    and error message in input order. At most 2 * workers inputs are in
+    flight, so strings can be a lazy iterable of arbitrary length."""
+    if workers == 1:
+        for string in strings:
+            yield (string, *convert_one(string, **kwargs))
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque = deque()
+        for string in strings:
+            pending.append((string, executor.submit(convert_one, string, **kwargs)))
+            if len(pending) >= 2 * workers:
+                string, future = pending.popleft()
+                yield (string, *future.result())
+        while pending:
+            string, future = pending.popleft()
+            yield (string, *future.result())
+
+
+@click.group()
+@click.version_option(package_name="commonmeta-py")
+def cli():
+    """Convert scholarly metadata from and to commonmeta"""
+
+
+@cli.command()
+@click.argument("inputs", nargs=-1)
+@click.option(
+    "--to",
+    "-t",
+    "to",
+    type=click.Choice(WRITER_FORMATS),
+    default="commonmeta",
+    show_default=True,
+    help="Output format",
+)
+@click.option(
+    "--via",
+    type=click.Choice(READER_FORMATS),
+    default=None,
+    help="Input format, detected from the input if not given",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("w", encoding="utf-8"),
+    default="-",
+    help="Output file, default stdout",
+)
+@click.option(
+    "--jsonl/--concat",
+    default=None,
+    help="Write one JSON document per line, or concatenate the outputs. "
+    "Default is JSON Lines for JSON formats.",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    show_default="number of CPUs",
+    help="Number of worker processes",
+)
+@click.option("--offline", is_flag=True, help="Don't make any network requests")
+@click.option("--progress/--no-progress", default=True, help="Show a progress bar")
+def convert(
+    inputs, to, via, output, jsonl, workers, offline, progress
+):  # pylint: disable=too-many-arguments,too-many-locals
+    """Convert INPUTS to the --to format.
+
+    INPUTS are DOIs and URLs, one per line on stdin or in .txt files,
+    payloads in JSON Lines (.jsonl) files, or metadata files, e.g. Crossref
+    XML or CITATION.cff. Directories are read recursively, .gz files are
+    decompressed. Without INPUTS, reads stdin."""
+    if jsonl is None:
+        jsonl = to in JSON_FORMATS
+    separator = "\n" if jsonl else "\n\n"
+    strings = iter_inputs(inputs, click.get_text_stream("stdin"))
+    results = convert_all(
+        strings, workers, to=to, via=via, jsonl=jsonl, offline=offline or None
+    )
+    converted = errors = 0
+    start = time.perf_counter()
+    with tqdm(
+        results, unit=" records", disable=not progress, file=sys.stderr
+    ) as progress_bar:
+        for string, result, error in progress_bar:
+            if error is not None:
+                errors += 1
+                tqdm.write(f"Error converting {string[:100]}: {error}", file=sys.stderr)
+                continue
+            converted += 1
+            output.write(result.rstrip("\n") + separator)
+    seconds = time.perf_counter() - start
+    rate = converted / seconds if seconds > 0 else 0
+    click.echo(
+        f"Converted {converted} records ({errors} errors) in {seconds:.1f} s, "
+        f"{rate:.1f} records/s",
+        err=True,
+    )
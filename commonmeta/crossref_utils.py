@@ -1,4 +1,6 @@
 """Crossref utils module for commonmeta-py"""
+import os
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
 from lxml import etree
 from datetime import datetime
 from dateutil.parser import parse
@@ -9,21 +11,22 @@ from .constants import Commonmeta
 from .utils import wrap, compact, normalize_orcid, normalize_id
 from .doi_utils import doi_from_url, validate_doi, is_rogue_scholar_doi
 
+# Crossref recommends deposit files of at most 10 MB
+CROSSREF_MAX_BATCH_SIZE = 10 * 1024 * 1024
+# size of the closing </body> and </doi_batch> tags
+CROSSREF_BATCH_END_SIZE = len("</body>\n</doi_batch>\n")
+
 
 def generate_crossref_xml(metadata: Commonmeta) -> str:
     """Generate Crossref XML"""
     xml = crossref_root()
-    head = etree.SubElement(xml, "head")
-    # we use a uuid as batch_id
-    etree.SubElement(head, "doi_batch_id").text = str(uuid.uuid4())
-    etree.SubElement(head, "timestamp").text = datetime.now().strftime("%Y%m%d%H%M%S")
-    depositor = etree.SubElement(head, "depositor")
-    etree.SubElement(depositor, "depositor_name").text = metadata.depositor or "test"
-    etree.SubElement(depositor, "email_address").text = (
-        metadata.email or "info@example.org"
+    xml.append(
+        crossref_head(
+            depositor=metadata.depositor,
+            email=metadata.email,
+            registrant=metadata.registrant,
+        )
     )
-    etree.SubElement(head, "registrant").text = metadata.registrant or "test"
-
     body = etree.SubElement(xml, "body")
     body = insert_crossref_work(metadata, body)
     return etree.tostring(
@@ -34,6 +37,124 @@ def generate_crossref_xml(metadata: Commonmeta) -> str:
     )
 
 
+def generate_crossref_xml_batch(
+    metadata_list: Iterable[Optional[Commonmeta]], file: IO[bytes], **kwargs
+) -> int:
+    """Stream Crossref XML for many works as one doi_batch to a binary file.
+    Works are serialized one at a time, so memory use doesn't depend on the
+    number of works. depositor, email and registrant for the head are taken
+    from kwargs or the first work. Returns the number of works written."""
+    works = iter_crossref_works(metadata_list)
+    first = next(works, None)
+    if first is None:
+        return 0
+    count, _ = write_crossref_batch(first, works, file, **kwargs)
+    return count
+
+
+def generate_crossref_xml_batches(
+    metadata_list: Iterable[Optional[Commonmeta]],
+    file_path: str,
+    max_size: int = CROSSREF_MAX_BATCH_SIZE,
+    **kwargs,
+) -> List[str]:
+    """Stream Crossref XML for many works to doi_batch files of at most
+    max_size bytes, starting a new file when the next work doesn't fit.
+    Files are named after file_path with a counter, e.g. deposit-1.xml,
+    deposit-2.xml. Returns the file paths written."""
+    root, ext = os.path.splitext(file_path)
+    works = iter_crossref_works(metadata_list)
+    work = next(works, None)
+    file_paths: List[str] = []
+    while work is not None:
+        file_paths.append(f"{root}-{len(file_paths) + 1}{ext or '.xml'}")
+        with open(file_paths[-1], "wb") as file:
+            _, work = write_crossref_batch(
+                work, works, file, max_size=max_size, **kwargs
+            )
+    return file_paths
+
+
+def iter_crossref_works(
+    metadata_list: Iterable[Optional[Commonmeta]],
+) -> Iterator[Tuple[Commonmeta, etree._Element]]:
+    """Crossref XML body elements (journal or posted_content) of works,
+    skipping None and works without DOI"""
+    for metadata in metadata_list:
+        if metadata is None:
+            continue
+        body = etree.Element("body")
+        insert_crossref_work(metadata, body)
+        for work in body:
+            yield metadata, work
+
+
+def write_crossref_batch(
+    first: Tuple[Commonmeta, etree._Element],
+    works: Iterator[Tuple[Commonmeta, etree._Element]],
+    file: IO[bytes],
+    max_size: Optional[int] = None,
+    **kwargs,
+) -> Tuple[int, Optional[Tuple[Commonmeta, etree._Element]]]:
+    """Write first and the following works as one doi_batch to file. With
+    max_size, stops before the work that would make the file larger than
+    max_size bytes; the first work is always written. Returns the number of
+    works written and the work that didn't fit."""
+    metadata, _ = first
+    head = crossref_head(
+        depositor=kwargs.get("depositor", None) or metadata.depositor,
+        email=kwargs.get("email", None) or metadata.email,
+        registrant=kwargs.get("registrant", None) or metadata.registrant,
+    )
+    root = crossref_root()
+    count = 0
+    work: Optional[Tuple[Commonmeta, etree._Element]] = first
+    with etree.xmlfile(file, encoding="UTF-8") as xf:
+        xf.write_declaration()
+        with xf.element(root.tag, root.attrib, nsmap=root.nsmap):
+            xf.write("\n")
+            xf.write(head, pretty_print=True)
+            with xf.element("body"):
+                xf.write("\n")
+                while work is not None:
+                    # serialize each work once, to measure and write it
+                    data = etree.tostring(
+                        work[1],
+                        encoding="UTF-8",
+                        xml_declaration=False,
+                        pretty_print=True,
+                    )
+                    xf.flush()
+                    if (
+                        max_size is not None
+                        and count > 0
+                        and file.tell() + len(data) + CROSSREF_BATCH_END_SIZE
+                        > max_size
+                    ):
+                        break
+                    file.write(data)
+                    count += 1
+                    work = next(works, None)
+            xf.write("\n")
+    return count, work
+
+
+def crossref_head(
+    depositor: Optional[str] = None,
+    email: Optional[str] = None,
+    registrant: Optional[str] = None,
+):
+    """Crossref head with a uuid as batch id"""
+    head = etree.Element("head")
+    etree.SubElement(head, "doi_batch_id").text = str(uuid.uuid4())
+    etree.SubElement(head, "timestamp").text = datetime.now().strftime("%Y%m%d%H%M%S")
+    depositor_ = etree.SubElement(head, "depositor")
+    etree.SubElement(depositor_, "depositor_name").text = depositor or "test"
+    etree.SubElement(depositor_, "email_address").text = email or "info@example.org"
+    etree.SubElement(head, "registrant").text = registrant or "test"
+    return head
+
+
 def crossref_errors(xml: None):
     """Crossref errors"""
     if xml is None:
@@ -1,41 +1,61 @@
 """Doi utils for commonmeta-py"""
+import gzip
+import json
 import re
+from functools import lru_cache
 from typing import Optional
-import requests
 
+from .cache_utils import LRUCache
+from .http_utils import http_get, async_http_get, is_offline
 
+# the registration agency is a function of the DOI prefix, cache it for 30 days
+_ra_cache = LRUCache(maxsize=10000, ttl=30 * 24 * 60 * 60)
+# there are about 20k Crossref members, names rarely change
+_member_cache = LRUCache(maxsize=25000, ttl=7 * 24 * 60 * 60)
+
+# identifiers repeat a lot across records, memoize validation and normalization
+IDENTIFIER_CACHE_SIZE = 100000
+
+DOI_REGEX = re.compile(
+    r"\A(?:(http|https):/(/)?(dx\.)?(doi\.org|handle\.stage\.datacite\.org|handle\.test\.datacite\.org)/)?(doi:)?(10\.\d{4,5}/.+)\Z"  # noqa: E501
+)
+PREFIX_REGEX = re.compile(
+    r"\A(?:(http|https):/(/)?(dx\.)?(doi\.org|handle\.stage\.datacite\.org|handle\.test\.datacite\.org)/)?(doi:)?(10\.\d{4,5}).*\Z"  # noqa: E501
+)
+DOI_URL_REGEX = re.compile(
+    r"\A(?:(http|https)://(dx\.)?(doi\.org|handle\.stage\.datacite\.org|handle\.test\.datacite\.org)/)?(doi:)?(10\.\d{4,5}/.+)\Z"  # noqa: E501
+)
+SANDBOX_REGEX = re.compile(
+    r"\A(http|https):/(/)?handle\.stage\.datacite\.org", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
 def validate_doi(doi: Optional[str]) -> Optional[str]:
     """Validate a DOI"""
     if doi is None:
         return None
-    match = re.search(
-        r"\A(?:(http|https):/(/)?(dx\.)?(doi\.org|handle\.stage\.datacite\.org|handle\.test\.datacite\.org)/)?(doi:)?(10\.\d{4,5}/.+)\Z",  # noqa: E501
-        doi,
-    )
+    match = DOI_REGEX.search(doi)
     if match is None:
         return None
     return match.group(6)
 
 
+@lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
 def validate_prefix(doi: Optional[str]) -> Optional[str]:
     """Validate a DOI prefix for a given DOI"""
     if doi is None:
         return None
-    match = re.search(
-        r"\A(?:(http|https):/(/)?(dx\.)?(doi\.org|handle\.stage\.datacite\.org|handle\.test\.datacite\.org)/)?(doi:)?(10\.\d{4,5}).*\Z",  # noqa: E501
-        doi,
-    )
+    match = PREFIX_REGEX.search(doi)
     if match is None:
         return None
     return match.group(6)
 
 
+@lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
 def doi_from_url(url: str) -> Optional[str]:
     """Return a DOI from a URL"""
-    match = re.search(
-        r"\A(?:(http|https)://(dx\.)?(doi\.org|handle\.stage\.datacite\.org|handle\.test\.datacite\.org)/)?(doi:)?(10\.\d{4,5}/.+)\Z",
-        url,
-    )
+    match = DOI_URL_REGEX.search(url)
     if match is None:
         return None
     return match.group(5).lower()
@@ -50,19 +70,22 @@ def doi_as_url(doi: Optional[str]) -> Optional[str]:
 
 def normalize_doi(doi: Optional[str], **kwargs) -> Optional[str]:
     """Normalize a DOI"""
+    return _normalize_doi(doi, kwargs.get("sandbox", False))
+
+
+@lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
+def _normalize_doi(doi: Optional[str], sandbox: bool) -> Optional[str]:
     doi_str = validate_doi(doi)
     if not doi_str:
         return None
-    return doi_resolver(doi, **kwargs) + doi_str.lower()
+    return doi_resolver(doi, sandbox=sandbox) + doi_str.lower()
 
 
 def doi_resolver(doi, **kwargs):
     """Return a DOI resolver for a given DOI"""
     if doi is None:
         return None
-    match = re.match(
-        r"\A(http|https):/(/)?handle\.stage\.datacite\.org", doi, re.IGNORECASE
-    )
+    match = SANDBOX_REGEX.match(doi)
     if match is not None or kwargs.get("sandbox", False):
         return "https://handle.stage.datacite.org/"
     return "https://doi.org/"
@@ -73,22 +96,123 @@ def get_doi_ra(doi) -> Optional[str]:
     prefix = validate_prefix(doi)
     if prefix is None:
         return None
-    response = requests.get("https://doi.org/ra/" + prefix, timeout=10)
+    registration_agency = _ra_cache.get(prefix)
+    if registration_agency is not None:
+        return registration_agency
+    if is_offline():
+        return None
+    response = http_get("https://doi.org/ra/" + prefix)
     if response.status_code != 200:
         return None
-    return response.json()[0].get("RA", None)
+    registration_agency = response.json()[0].get("RA", None)
+    if registration_agency is not None:
+        _ra_cache.set(prefix, registration_agency)
+    return registration_agency
+
+
+async def aget_doi_ra(doi) -> Optional[str]:
+    """Return the DOI registration agency for a given DOI, async version"""
+    prefix = validate_prefix(doi)
+    if prefix is None:
+        return None
+    registration_agency = _ra_cache.get(prefix)
+    if registration_agency is not None:
+        return registration_agency
+    if is_offline():
+        return None
+    response = await async_http_get("https://doi.org/ra/" + prefix)
+    if response.status_code != 200:
+        return None
+    registration_agency = response.json()[0].get("RA", None)
+    if registration_agency is not None:
+        _ra_cache.set(prefix, registration_agency)
+    return registration_agency
+
+
+def get_ra_cache() -> LRUCache:
+    """Return the DOI prefix to registration agency cache, e.g. to pre-seed it
+    with update() or load()"""
+    return _ra_cache
+
+
+def set_ra_cache(cache: LRUCache) -> None:
+    """Replace the DOI prefix to registration agency cache, e.g. with a cache
+    persisted to disk"""
+    global _ra_cache  # pylint: disable=global-statement
+    _ra_cache = cache
 
 
 def get_crossref_member(member_id) -> Optional[dict]:
     """Return the Crossref member for a given member_id"""
-    response = requests.get("https://api.crossref.org/members/" + member_id, timeout=10)
+    member = _member_cache.get(member_id)
+    if member is not None:
+        return member
+    if is_offline():
+        return None
+    response = http_get("https://api.crossref.org/members/" + member_id)
+    if response.status_code != 200:
+        return None
+    data = response.json().get("message", None)
+    member = format_crossref_member(data)
+    _member_cache.set(member_id, member)
+    return member
+
+
+async def aget_crossref_member(member_id) -> Optional[dict]:
+    """Return the Crossref member for a given member_id, async version"""
+    member = _member_cache.get(member_id)
+    if member is not None:
+        return member
+    if is_offline():
+        return None
+    response = await async_http_get("https://api.crossref.org/members/" + member_id)
     if response.status_code != 200:
         return None
     data = response.json().get("message", None)
+    member = format_crossref_member(data)
+    _member_cache.set(member_id, member)
+    return member
+
+
+def format_crossref_member(data: dict) -> dict:
+    """Format a Crossref member as returned by the members API"""
+    member_id = str(data.get("id", None))
     name = data.get("primary-name", None)
     return {"id": "https://api.crossref.org/members/" + member_id, "name": name}
 
 
+def get_member_cache() -> LRUCache:
+    """Return the Crossref member cache, e.g. to check hits and misses"""
+    return _member_cache
+
+
+def set_member_cache(cache: LRUCache) -> None:
+    """Replace the Crossref member cache, e.g. with a cache persisted to disk"""
+    global _member_cache  # pylint: disable=global-statement
+    _member_cache = cache
+
+
+def load_crossref_members(path: str) -> int:
+    """Pre-load the Crossref member cache from a members dump file. Supports
+    a members API response (optionally gzipped), a JSON list of members, or
+    JSON Lines with one member per line. Returns the number of members loaded."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        text = file.read()
+    try:
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data = data.get("message", data)
+            data = data.get("items", [data])
+    except json.JSONDecodeError:
+        data = [json.loads(line) for line in text.splitlines() if line.strip()]
+    members = {
+        str(i["id"]): format_crossref_member(i) for i in data if i.get("id", None)
+    }
+    _member_cache.update(members)
+    return len(members)
+
+
 def crossref_api_url(doi: str) -> str:
     """Return the Crossref API URL for a given DOI"""
     return "https://api.crossref.org/works/" + doi
@@ -101,9 +225,7 @@ def crossref_xml_api_url(doi: str) -> str:
 
 def datacite_api_url(doi: str, **kwargs) -> str:
     """Return the DataCite API URL for a given DOI"""
-    match = re.match(
-        r"\A(http|https):/(/)?handle\.stage\.datacite\.org", doi, re.IGNORECASE
-    )
+    match = SANDBOX_REGEX.match(doi)
     if match is not None or kwargs.get("sandbox", False):
         return f"https://api.stage.datacite.org/dois/{doi_from_url(doi)}?include=media,client"
     return f"https://api.datacite.org/dois/{doi_from_url(doi)}?include=media,client"
@@ -0,0 +1,158 @@
+"""File utils for commonmeta-py"""
+import gzip
+import json
+from typing import IO, Iterable, Iterator, Optional
+
+JSON_CHUNK_SIZE = 1024 * 1024
+WHITESPACE = " \t\n\r"
+
+
+def open_file(file_path: str) -> IO[str]:
+    """Open a text file for reading, decompressing it if it ends with .gz"""
+    if file_path.endswith(".gz"):
+        return gzip.open(file_path, "rt", encoding="utf-8")
+    return open(file_path, encoding="utf-8")
+
+
+def open_binary_file(file_path: str) -> IO[bytes]:
+    """Open a file for reading bytes, decompressing it if it ends with .gz"""
+    if file_path.endswith(".gz"):
+        return gzip.open(file_path, "rb")
+    return open(file_path, "rb")
+
+
+def iter_json_lines(file: IO[str]) -> Iterator[dict]:
+    """Decode a JSON Lines file one line at a time, skipping empty lines"""
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_json_items(
+    file: IO[str], key: str = "items", chunk_size: int = JSON_CHUNK_SIZE
+) -> Iterator[dict]:
+    """Decode the items of a JSON array incrementally, reading the file in
+    chunks. The array is either the top-level value, or the value of key in
+    the top-level object, e.g. {"items": [...]}. Only the current chunk and
+    item, or the value of another key of the top-level object, are held in
+    memory."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def read_more() -> bool:
+        nonlocal buffer, pos, eof
+        chunk = file.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip(chars: str = WHITESPACE) -> str:
+        """skip chars, returning the next character or "" at the end"""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in chars:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                return ""
+
+    def decode():
+        """decode the next value, reading more chunks as needed"""
+        nonlocal pos
+        while True:
+            skip()
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # value continues in the next chunk
+                if not read_more():
+                    raise
+                continue
+            # a number at the end of the chunk may continue in the next one
+            if end == len(buffer) and not eof and read_more():
+                continue
+            pos = end
+            return value
+
+    # find the opening bracket of the array, decoding the keys of the
+    # top-level object and skipping the values of other keys
+    char = skip()
+    if char == "":
+        return
+    if char == "{":
+        pos += 1
+        while True:
+            char = skip(WHITESPACE + ",")
+            if char == "}":
+                return
+            if char != '"':
+                raise ValueError("Expected a key in JSON object")
+            name = decode()
+            if skip() != ":":
+                raise ValueError("Expected ':' after key in JSON object")
+            pos += 1
+            if name == key:
+                break
+            decode()
+        char = skip()
+    if char != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+
+    while True:
+        # skip whitespace and separators between items
+        char = skip(WHITESPACE + ",")
+        if char == "":
+            raise ValueError("Unexpected end of JSON array")
+        if char == "]":
+            return
+        yield decode()
+
+
+def write_json_lines(items: Iterable[Optional[dict]], file: IO[str]) -> int:
+    """Write items as JSON Lines to file, one at a time, skipping None.
+    Returns the number of items written."""
+    count = 0
+    for item in items:
+        if item is None:
+            continue
+        file.write(json.dumps(item, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def write_json_array(items: Iterable[Optional[dict]], file: IO[str]) -> int:
+    """Write items as a JSON array to file, one at a time, skipping None.
+    Returns the number of items written."""
+    count = 0
+    file.write("[")
+    for item in items:
+        if item is None:
+            continue
+        file.write(",\n" if count else "\n")
+        file.write(json.dumps(item, ensure_ascii=False))
+        count += 1
+    file.write("\n]\n" if count else "]\n")
+    return count
+
+
+def write_records(
+    records: Iterable[Optional[str]], file: IO[str], separator: str = "\n"
+) -> int:
+    """Write text records to file, one at a time, separated by separator and
+    skipping None. Returns the number of records written."""
+    count = 0
+    for record in records:
+        if record is None:
+            continue
+        if count:
+            file.write(separator)
+        file.write(record)
+        count += 1
+    return count
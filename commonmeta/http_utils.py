@@ -0,0 +1,214 @@
+"""HTTP utils for commonmeta-py"""
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Callable, Iterator, Optional
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_SIZE = 10
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+_session: Optional[requests.Session] = None
+_timeout: float = DEFAULT_TIMEOUT
+_lock = threading.Lock()
+# async clients hold connections bound to the event loop that created them
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# offline mode set process-wide, and per call via the offline context manager
+_offline_default = False
+_offline: ContextVar[Optional[bool]] = ContextVar("offline", default=None)
+
+
+class OfflineError(requests.exceptions.ConnectionError):
+    """Network request attempted in offline mode"""
+
+
+def set_offline(enabled: bool = True) -> None:
+    """Turn offline mode on or off for the whole process. In offline mode
+    readers only use the input and local caches, and all requests raise
+    OfflineError."""
+    global _offline_default  # pylint: disable=global-statement
+    _offline_default = enabled
+
+
+def is_offline() -> bool:
+    """Return True if offline mode is on for the current context"""
+    enabled = _offline.get()
+    return _offline_default if enabled is None else enabled
+
+
+@contextmanager
+def offline(enabled: Optional[bool] = True) -> Iterator[None]:
+    """Turn offline mode on or off for the code run in this context, e.g. a
+    single conversion. Passing None keeps the current mode. Jobs run in
+    threads need submit_in_context to inherit it."""
+    if enabled is None:
+        yield
+        return
+    token = _offline.set(enabled)
+    try:
+        yield
+    finally:
+        _offline.reset(token)
+
+
+def submit_in_context(
+    executor: Executor, function: Callable, *args, **kwargs
+) -> Future:
+    """Submit function to executor, run in a copy of the current context so
+    that it inherits offline mode set with the offline context manager"""
+    return executor.submit(copy_context().run, function, *args, **kwargs)
+
+
+def check_online(url: str) -> None:
+    """Raise OfflineError if offline mode is on"""
+    if is_offline():
+        raise OfflineError(f"Offline mode, not requesting {url}")
+
+
+def create_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    retries: int = DEFAULT_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+) -> requests.Session:
+    """Create a requests session with a keep-alive connection pool per host,
+    retrying idempotent requests with exponential backoff on 429 and 5xx"""
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the session shared by all readers, creating it on first use"""
+    global _session  # pylint: disable=global-statement
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def set_session(
+    session: Optional[requests.Session] = None, timeout: Optional[float] = None
+) -> None:
+    """Replace the shared session, e.g. with one created by create_session
+    using a larger pool, or with a mock for testing. Passing no session
+    resets to the default session on next use."""
+    global _session, _timeout  # pylint: disable=global-statement
+    with _lock:
+        _session = session
+        _timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+
+
+def http_get(url: str, params: Optional[dict] = None, **kwargs) -> requests.Response:
+    """GET request using the shared session"""
+    check_online(url)
+    kwargs.setdefault("timeout", _timeout)
+    return get_session().get(url, params=params, **kwargs)
+
+
+def http_head(url: str, **kwargs) -> requests.Response:
+    """HEAD request using the shared session"""
+    check_online(url)
+    kwargs.setdefault("timeout", _timeout)
+    return get_session().head(url, **kwargs)
+
+
+def create_async_client(
+    max_connections: int = 100,
+    retries: int = DEFAULT_RETRIES,
+) -> httpx.AsyncClient:
+    """Create an httpx client for async requests, with a connection pool
+    shared by up to max_connections concurrent requests. Connection errors
+    are retried by the transport, 429 and 5xx responses by async_http_get."""
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=min(max_connections, 20),
+    )
+    transport = httpx.AsyncHTTPTransport(retries=retries, limits=limits)
+    return httpx.AsyncClient(
+        transport=transport, timeout=_timeout, follow_redirects=True
+    )
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the async client shared by all async readers running on the
+    current event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop, None)
+    if client is None or client.is_closed:
+        client = create_async_client()
+        _async_clients[loop] = client
+    return client
+
+
+def set_async_client(client: Optional[httpx.AsyncClient] = None) -> None:
+    """Replace the async client for the current event loop, e.g. with one
+    created by create_async_client or with a mock transport for testing.
+    Passing no client resets to the default client on next use."""
+    loop = asyncio.get_running_loop()
+    if client is None:
+        _async_clients.pop(loop, None)
+    else:
+        _async_clients[loop] = client
+
+
+async def async_http_get(
+    url: str, params: Optional[dict] = None, **kwargs
+) -> httpx.Response:
+    """GET request using the shared async client, retrying with exponential
+    backoff on 429 and 5xx"""
+    check_online(url)
+    kwargs.setdefault("timeout", _timeout)
+    # merge rather than replace query parameters already in url, as requests does
+    if params:
+        url = str(httpx.URL(url).copy_merge_params(params))
+    client = get_async_client()
+    for attempt in range(DEFAULT_RETRIES + 1):
+        response = await client.get(url, **kwargs)
+        if (
+            response.status_code not in RETRY_STATUS_CODES
+            or attempt == DEFAULT_RETRIES
+        ):
+            return response
+        await asyncio.sleep(retry_delay(response, attempt))
+    return response
+
+
+async def async_http_head(url: str, **kwargs) -> httpx.Response:
+    """HEAD request using the shared async client"""
+    check_online(url)
+    kwargs.setdefault("timeout", _timeout)
+    kwargs.setdefault("follow_redirects", False)
+    return await get_async_client().head(url, **kwargs)
+
+
+def retry_delay(response, attempt: int) -> float:
+    """Seconds to wait before retrying, from the Retry-After header if given"""
+    retry_after = response.headers.get("Retry-After", None)
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+    return DEFAULT_BACKOFF_FACTOR * (2**attempt)
@@ -1,3 +1,4 @@
 # -*- coding: utf-8 -*-
 
 from .metadata import Metadata
+from .compact_metadata import CompactMetadata
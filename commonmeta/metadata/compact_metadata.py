@@ -0,0 +1,72 @@
+"""Compact Metadata"""
+import sys
+from typing import Optional
+
+from ..base_utils import intern_keys
+from .metadata import Metadata, METADATA_FIELDS
+
+# writer options of Metadata objects
+METADATA_OPTIONS = ["style", "locale", "depositor", "email", "registrant"]
+# properties with a small set of values, interned
+INTERNED_FIELDS = frozenset(
+    ["type", "additional_type", "language", "provider", "state", "schema_version"]
+)
+# keys of nested records with a small set of values, interned with the keys
+INTERNED_VALUE_KEYS = frozenset(
+    [
+        "type",
+        "contributorType",
+        "contributorRoles",
+        "identifierType",
+        "relationType",
+        "resourceTypeGeneral",
+        "titleType",
+        "descriptionType",
+        "funderIdentifierType",
+        "dateType",
+        "lang",
+    ]
+)
+
+
+class CompactMetadata:
+    """Metadata with __slots__ instead of a per-instance __dict__, and with
+    interned keys in nested records, for holding many records in memory.
+    Supports the validation and writer methods of Metadata."""
+
+    __slots__ = tuple(METADATA_FIELDS + METADATA_OPTIONS)
+
+    def __init__(self, meta: Optional[dict] = None, **kwargs):
+        meta = meta or {}
+        for field in METADATA_FIELDS:
+            value = meta.get(field, None)
+            if field in INTERNED_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            elif not isinstance(value, str):
+                value = intern_keys(value, INTERNED_VALUE_KEYS)
+            setattr(self, field, value)
+        self.style = kwargs.get("style", "apa")
+        self.locale = kwargs.get("locale", "en-US")
+        self.depositor = kwargs.get("depositor", None)
+        self.email = kwargs.get("email", None)
+        self.registrant = kwargs.get("registrant", None)
+
+    @classmethod
+    def from_metadata(cls, metadata: Metadata) -> "CompactMetadata":
+        """Compact copy of a Metadata object"""
+        return cls(
+            {field: getattr(metadata, field) for field in METADATA_FIELDS},
+            **{option: getattr(metadata, option) for option in METADATA_OPTIONS},
+        )
+
+    is_valid = Metadata.is_valid
+    validation_error = Metadata.validation_error
+    validate_many = staticmethod(Metadata.validate_many)
+    commonmeta = Metadata.commonmeta
+    bibtex = Metadata.bibtex
+    csl = Metadata.csl
+    citation = Metadata.citation
+    ris = Metadata.ris
+    schema_org = Metadata.schema_org
+    datacite = Metadata.datacite
+    crossref_xml = Metadata.crossref_xml
@@ -1,12 +1,22 @@
 """Metadata"""
 from os import path
+import asyncio
 import json
-from typing import Optional, Any
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Optional, Iterable, Iterator, List, Union
 from functools import cached_property
 import yaml
-from fastjsonschema import JsonSchemaException, compile
 
 from ..readers import (
+    aget_crossref,
+    aget_datacite,
+    aget_crossref_xml,
+    aget_schema_org,
+    aget_codemeta,
+    aget_cff,
+    aget_json_feed_item,
+    aget_inveniordm,
     get_crossref,
     read_crossref,
     get_datacite,
@@ -29,6 +39,8 @@ from ..readers import (
     read_commonmeta,
     read_ris,
 )
+from ..readers.crossref_reader import CROSSREF_FIELDS
+from ..readers.datacite_reader import DATACITE_FIELDS
 from ..writers import (
     write_datacite,
     write_bibtex,
@@ -38,93 +50,252 @@ from ..writers import (
     write_ris,
     write_schema_org,
     write_commonmeta,
+    to_commonmeta,
 )
-from ..utils import normalize_id, find_from_format
+from ..utils import (
+    normalize_id,
+    find_from_format,
+    afind_from_format_by_id,
+    sniff_format,
+)
+from ..doi_utils import validate_doi, aget_doi_ra, aget_crossref_member
 from ..base_utils import parse_xml
+from ..http_utils import offline, is_offline, submit_in_context
+from ..schema_utils import validate_commonmeta, validate_many
+
+# commonmeta properties of Metadata objects
+METADATA_FIELDS = [
+    "id",
+    "type",
+    "doi",
+    "url",
+    "contributors",
+    "titles",
+    "publisher",
+    "date",
+    "additional_type",
+    "subjects",
+    "language",
+    "alternate_identifiers",
+    "related_identifiers",
+    "sizes",
+    "formats",
+    "version",
+    "license",
+    "descriptions",
+    "geo_locations",
+    "funding_references",
+    "references",
+    "date_created",
+    "date_registered",
+    "date_published",
+    "date_updated",
+    "files",
+    "container",
+    "provider",
+    "state",
+    "schema_version",
+    "archive_locations",
+]
+# readers with functions reading one property each, used in lazy mode
+FIELD_READERS = {"crossref": CROSSREF_FIELDS, "datacite": DATACITE_FIELDS}
+
 
 # pylint: disable=R0902
 class Metadata:
     """Metadata"""
 
     def __init__(self, string: Optional[str], **kwargs):
-        if string is None or not isinstance(string, str):
-            raise ValueError("No input found")
-        pid = normalize_id(string)
-
-        if pid is not None:
-            via = kwargs.get("via", None) or find_from_format(pid=pid)
-            if via == "schema_org":
-                data = get_schema_org(pid)
-                meta = read_schema_org(data)
-            elif via == "datacite":
-                data = get_datacite(pid)
-                meta = read_datacite(data)
-            elif via == "crossref":
-                data = get_crossref(pid)
-                meta = read_crossref(data)
-            elif via == "crossref_xml":
-                data = get_crossref_xml(pid)
-                meta = read_crossref_xml(data)
-            elif via == "codemeta":
-                data = get_codemeta(pid)
-                meta = read_codemeta(data)
-            elif via == "cff":
-                data = get_cff(pid)
-                meta = read_cff(data)
-            elif via == "json_feed_item":
-                data = get_json_feed_item(pid)
-                meta = read_json_feed_item(data, **kwargs)
-            elif via == "inveniordm":
-                data = get_inveniordm(pid)
-                meta = read_inveniordm(data)
-        elif string:
-            if path.exists(string):
-                with open(string, encoding="utf-8") as file:
-                    string = file.read()
-            via = kwargs.get("via", None) or find_from_format(string=string)
-            if via == "commonmeta":
-                data = json.loads(string)
-                meta = read_commonmeta(data)
-            elif via == "schema_org":
-                data = json.loads(string)
-                meta = read_schema_org(data)
-            elif via == "datacite":
-                data = json.loads(string)
-                meta = read_datacite(data)
-            elif via == "crossref":
-                data = json.loads(string)
-                meta = read_crossref(data)
-            elif via == "datacite_xml":
-                data = parse_xml(string)
-                meta = read_datacite_xml(data)
-            elif via == "crossref_xml":
-                data = parse_xml(string, dialect="crossref")
-                meta = read_crossref_xml(data)
-            elif via == "csl":
-                data = json.loads(string)
-                meta = read_csl(data)
-            elif via == "codemeta":
-                data = json.loads(string)
-                meta = read_codemeta(data)
-            elif via == "cff":
-                data = yaml.safe_load(string)
-                meta = read_cff(data)
-            elif via == "inveniordm":
-                data = json.loads(string)
-                meta = read_inveniordm(data)
-            elif via == "kbase":
-                data = json.loads(string)
-                meta = read_kbase(data)
-            elif via == "ris":
-                meta = read_ris(string)
-            # elif via == "bibtex":
-            #     data = yaml.safe_load(string)
-            #     meta = read_bibtex(data)
+        lazy = kwargs.pop("lazy", False)
+        with offline(kwargs.pop("offline", None)):
+            if string is None or not isinstance(string, str):
+                raise ValueError("No input found")
+            pid = normalize_id(string)
+
+            if pid is not None:
+                via = kwargs.get("via", None) or find_from_format(pid=pid)
+                data = self.get_metadata(pid, via)
+            elif string:
+                if path.exists(string):
+                    with open(string, encoding="utf-8") as file:
+                        string = file.read()
+                via = kwargs.get("via", None)
+                data = None
+                if via is None:
+                    # reuse JSON or YAML parsed to find the format
+                    via, data = sniff_format(string)
+                if data is None:
+                    data = self.parse_metadata(string, via)
+            else:
+                raise ValueError("No metadata found")
+
+            if lazy:
+                self.set_payload(data, via, **kwargs)
+            else:
+                meta = self.read_metadata(data, via, **kwargs)
+                self.set_metadata(meta, **kwargs)
+
+    def __getattr__(self, name: str):
+        """Read a property from the retained payload on first access, in lazy
+        mode. Readers without field functions read all properties at once."""
+        payload = self.__dict__.get("_payload", None)
+        if payload is None or name not in METADATA_FIELDS:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        data, via, offline_, kwargs = payload
+        fields = FIELD_READERS.get(via, None)
+        with offline(offline_):
+            if fields is not None:
+                read_field = fields.get(name, None)
+                value = read_field(data) if read_field is not None else None
+                setattr(self, name, value)
+                return value
+            meta = self.read_metadata(data, via, **kwargs)
+        for field in METADATA_FIELDS:
+            if field not in self.__dict__:
+                setattr(self, field, meta.get(field))
+        return self.__dict__[name]
+
+    @staticmethod
+    def parse_metadata(string: str, via: str):
+        """Parse a metadata string in the format given by via"""
+        if via in [
+            "commonmeta",
+            "schema_org",
+            "datacite",
+            "crossref",
+            "csl",
+            "codemeta",
+            "inveniordm",
+            "kbase",
+        ]:
+            return json.loads(string)
+        if via == "datacite_xml":
+            return parse_xml(string)
+        if via == "crossref_xml":
+            return parse_xml(string, dialect="crossref")
+        if via == "cff":
+            return yaml.safe_load(string)
+        if via == "ris":
+            return string
+        # if via == "bibtex":
+        #     return yaml.safe_load(string)
+        raise ValueError("No input format found")
+
+    @staticmethod
+    def get_metadata(pid: str, via: str) -> dict:
+        """Fetch metadata for a PID from the source given by via"""
+        if via == "schema_org":
+            return get_schema_org(pid)
+        if via == "datacite":
+            return get_datacite(pid)
+        if via == "crossref":
+            return get_crossref(pid)
+        if via == "crossref_xml":
+            return get_crossref_xml(pid)
+        if via == "codemeta":
+            return get_codemeta(pid)
+        if via == "cff":
+            return get_cff(pid)
+        if via == "json_feed_item":
+            return get_json_feed_item(pid)
+        if via == "inveniordm":
+            return get_inveniordm(pid)
+        raise ValueError("No input format found")
+
+    @staticmethod
+    async def aget_metadata(pid: str, via: str) -> dict:
+        """Fetch metadata for a PID from the source given by via, async version"""
+        if via == "schema_org":
+            return await aget_schema_org(pid)
+        if via == "datacite":
+            return await aget_datacite(pid)
+        if via == "crossref":
+            return await aget_crossref(pid)
+        if via == "crossref_xml":
+            return await aget_crossref_xml(pid)
+        if via == "codemeta":
+            return await aget_codemeta(pid)
+        if via == "cff":
+            return await aget_cff(pid)
+        if via == "json_feed_item":
+            return await aget_json_feed_item(pid)
+        if via == "inveniordm":
+            return await aget_inveniordm(pid)
+        raise ValueError("No input format found")
+
+    @staticmethod
+    def read_metadata(data: dict, via: str, /, **kwargs) -> dict:
+        """Read metadata fetched for a PID into commonmeta"""
+        if via == "schema_org":
+            return read_schema_org(data)
+        if via == "datacite":
+            return read_datacite(data)
+        if via == "crossref":
+            return read_crossref(data)
+        if via == "crossref_xml":
+            return read_crossref_xml(data)
+        if via == "codemeta":
+            return read_codemeta(data)
+        if via == "cff":
+            return read_cff(data)
+        if via == "json_feed_item":
+            return read_json_feed_item(data, **kwargs)
+        if via == "inveniordm":
+            return read_inveniordm(data)
+        if via == "commonmeta":
+            return read_commonmeta(data)
+        if via == "datacite_xml":
+            return read_datacite_xml(data)
+        if via == "csl":
+            return read_csl(data)
+        if via == "kbase":
+            return read_kbase(data)
+        if via == "ris":
+            return read_ris(data)
+        raise ValueError("No input format found")
+
+    @classmethod
+    async def aload(cls, string: Optional[str], **kwargs) -> "Metadata":
+        """Async constructor: fetch metadata for a PID with a non-blocking
+        HTTP client, so that many lookups can be in flight on one event loop.
+        Reading runs in a worker thread, as readers may look up DOI
+        registration agencies and Crossref members. Strings that are not a
+        PID are read with the regular constructor in a worker thread."""
+        lazy = kwargs.pop("lazy", False)
+        with offline(kwargs.pop("offline", None)):
+            pid = normalize_id(string) if isinstance(string, str) else None
+            if pid is None:
+                return await asyncio.to_thread(cls, string, lazy=lazy, **kwargs)
+
+            via = kwargs.get("via", None) or await afind_from_format_by_id(pid)
+            data = await cls.aget_metadata(pid, via)
+
+            # warm the caches used by the readers, so that most reads don't
+            # need the network
+            if validate_doi(pid):
+                await aget_doi_ra(pid)
+            if via == "crossref" and data.get("member", None) is not None:
+                await aget_crossref_member(data["member"])
+            metadata = cls.__new__(cls)
+            if lazy:
+                metadata.set_payload(data, via, **kwargs)
             else:
-                raise ValueError("No input format found")
-        else:
-            raise ValueError("No metadata found")
+                # readers can still make blocking requests, e.g. for DOIs in
+                # the payload, to_thread runs them in a copy of the context
+                # with offline mode
+                meta = await asyncio.to_thread(cls.read_metadata, data, via, **kwargs)
+                metadata.set_metadata(meta, **kwargs)
+            return metadata
+
+    def set_payload(self, data, via: str, /, **kwargs) -> None:
+        """Retain the payload, read properties on first access"""
+        self._payload = (data, via, is_offline(), kwargs)
+        self.set_options(**kwargs)
 
+    def set_metadata(self, meta: dict, **kwargs) -> None:
+        """Set attributes from commonmeta dict and options"""
         # required properties
         self.id = meta.get("id")  # pylint: disable=C0103
         self.type = meta.get("type")
@@ -159,6 +330,10 @@ class Metadata:
         self.state = meta.get("state")
         self.schema_version = meta.get("schema_version")
         self.archive_locations = meta.get("archive_locations", None)
+        self.set_options(**kwargs)
+
+    def set_options(self, **kwargs) -> None:
+        """Set writer options"""
         # citation style language options
         self.style = kwargs.get("style", "apa")
         self.locale = kwargs.get("locale", "en-US")
@@ -168,18 +343,65 @@ class Metadata:
         self.email = kwargs.get("email", None)
         self.registrant = kwargs.get("registrant", None)
 
-    def is_valid(self) -> Any:
+    @classmethod
+    def from_many(
+        cls,
+        strings: Iterable[str],
+        max_workers: int = 8,
+        ordered: bool = True,
+        **kwargs,
+    ) -> Iterator[Union["Metadata", Exception]]:
+        """Convert many PIDs or strings, using a bounded pool of worker threads.
+
+        Yields a Metadata object per input, or the exception raised while
+        fetching or reading that input. Results are yielded in input order,
+        or in completion order if ordered is False. At most 2 * max_workers
+        inputs are in flight at any time, so strings can be a lazy iterable
+        of arbitrary length."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        def convert(string):
+            try:
+                return cls(string, **kwargs)
+            except Exception as error:  # pylint: disable=broad-except
+                return error
+
+        max_pending = 2 * max_workers
+        items = iter(strings)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if ordered:
+                pending: deque = deque()
+                for string in items:
+                    pending.append(submit_in_context(executor, convert, string))
+                    if len(pending) >= max_pending:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            else:
+                futures: set = set()
+                for string in items:
+                    futures.add(submit_in_context(executor, convert, string))
+                    if len(futures) >= max_pending:
+                        done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                for future in as_completed(futures):
+                    yield future.result()
+
+    def is_valid(self) -> bool:
         """validate against JSON schema"""
-        try:
-            file_path = path.join(
-                path.dirname(__file__), "resources/commonmeta_v0.10.6.json"
-            )
-            with open(file_path, encoding="utf-8") as file:
-                schema = json.load(file)
-            # validate = compile(schema)
-            return file_path
-        except JsonSchemaException as error:
-            return error
+        return self.validation_error() is None
+
+    def validation_error(self) -> Optional[str]:
+        """validate against JSON schema, returning the error message or None"""
+        return validate_commonmeta(to_commonmeta(self))
+
+    @staticmethod
+    def validate_many(metadata_list: Iterable["Metadata"]) -> List[Optional[str]]:
+        """validate many Metadata objects against JSON schema, reusing the
+        compiled validator. Returns the error message or None per object"""
+        return validate_many(to_commonmeta(i) for i in metadata_list)
 
     def commonmeta(self):
         """Commonmeta"""
@@ -1,14 +1,46 @@
 """Readers for different metadata formats"""
-from .crossref_reader import get_crossref, read_crossref
-from .datacite_reader import get_datacite, read_datacite
-from .schema_org_reader import get_schema_org, read_schema_org
+from .crossref_reader import (
+    get_crossref,
+    aget_crossref,
+    read_crossref,
+    get_crossref_works,
+    read_crossref_works,
+    get_crossref_file,
+    read_crossref_file,
+    read_crossref_files,
+)
+from .datacite_reader import (
+    get_datacite,
+    aget_datacite,
+    read_datacite,
+    get_datacite_dois,
+    read_datacite_dois,
+)
+from .schema_org_reader import get_schema_org, aget_schema_org, read_schema_org
 from .csl_reader import read_csl
-from .codemeta_reader import get_codemeta, read_codemeta
-from .cff_reader import get_cff, read_cff
-from .crossref_xml_reader import get_crossref_xml, read_crossref_xml
-from .datacite_xml_reader import get_datacite_xml, read_datacite_xml
-from .json_feed_reader import get_json_feed_item, read_json_feed_item
-from .inveniordm_reader import get_inveniordm, read_inveniordm
+from .codemeta_reader import get_codemeta, aget_codemeta, read_codemeta
+from .cff_reader import get_cff, aget_cff, read_cff
+from .crossref_xml_reader import (
+    get_crossref_xml,
+    aget_crossref_xml,
+    read_crossref_xml,
+    get_crossref_xml_file,
+    read_crossref_xml_file,
+)
+from .datacite_xml_reader import (
+    get_datacite_xml,
+    aget_datacite_xml,
+    read_datacite_xml,
+    get_datacite_oai_file,
+    get_datacite_oai_files,
+    read_datacite_oai_files,
+)
+from .json_feed_reader import (
+    get_json_feed_item,
+    aget_json_feed_item,
+    read_json_feed_item,
+)
+from .inveniordm_reader import get_inveniordm, aget_inveniordm, read_inveniordm
 from .kbase_reader import read_kbase
 from .commonmeta_reader import read_commonmeta
 from .ris_reader import read_ris
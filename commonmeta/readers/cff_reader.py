@@ -1,7 +1,6 @@
 """cff reader for commonmeta-py"""
 from typing import Optional
 from urllib.parse import urlparse
-import requests
 import yaml
 
 from ..utils import (
@@ -14,13 +13,14 @@ from ..utils import (
 )
 from ..base_utils import compact, wrap, presence, sanitize, parse_attributes
 from ..date_utils import get_iso8601_date
+from ..http_utils import http_get, async_http_get
 from ..constants import Commonmeta
 
 
 def get_cff(pid: str, **kwargs) -> dict:
     """get_cff"""
     url = github_as_cff_url(pid)
-    response = requests.get(url, kwargs, timeout=10)
+    response = http_get(url, kwargs)
     if response.status_code != 200:
         return {"state": "not_found"}
     text = response.text
@@ -34,6 +34,21 @@ def get_cff(pid: str, **kwargs) -> dict:
     return data
 
 
+async def aget_cff(pid: str, **kwargs) -> dict:
+    """get_cff, async version"""
+    url = github_as_cff_url(pid)
+    response = await async_http_get(url, kwargs)
+    if response.status_code != 200:
+        return {"state": "not_found"}
+    data = yaml.safe_load(response.text)
+
+    # collect metadata not included in the CFF file
+    if data.get("repository-code", None) is None:
+        data["repository-code"] = github_as_repo_url(url)
+
+    return data
+
+
 def read_cff(data: Optional[dict], **kwargs) -> Commonmeta:
     """read_cff"""
     if data is None:
@@ -1,7 +1,6 @@
 """codemeta reader for commonmeta-py"""
 from typing import Optional
 from collections import defaultdict
-import requests
 
 from ..utils import (
     normalize_id,
@@ -14,6 +13,7 @@ from ..utils import (
 )
 from ..base_utils import wrap, presence, compact, sanitize
 from ..author_utils import get_authors
+from ..http_utils import http_get, async_http_get
 from ..constants import (
     Commonmeta,
     SO_TO_CM_TRANSLATIONS,
@@ -23,7 +23,20 @@ from ..constants import (
 def get_codemeta(pid: str, **kwargs) -> dict:
     """get_codemeta"""
     url = str(github_as_codemeta_url(pid))
-    response = requests.get(url, kwargs, timeout=10)
+    response = http_get(url, kwargs)
+    if response.status_code != 200:
+        return {"state": "not_found"}
+    data = response.json()
+    if data.get("codeRepository", None) is None:
+        data["codeRepository"] = github_as_repo_url(url)
+
+    return data
+
+
+async def aget_codemeta(pid: str, **kwargs) -> dict:
+    """get_codemeta, async version"""
+    url = str(github_as_codemeta_url(pid))
+    response = await async_http_get(url, kwargs)
     if response.status_code != 200:
         return {"state": "not_found"}
     data = response.json()
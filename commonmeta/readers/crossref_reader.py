@@ -1,6 +1,8 @@
 """crossref reader for commonmeta-py"""
-from typing import Optional
-import requests
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional
 from pydash import py_
 
 from ..utils import (
@@ -11,22 +13,38 @@ from ..utils import (
     normalize_doi,
     normalize_issn,
 )
-from ..base_utils import wrap, compact, presence, sanitize, parse_attributes
+from ..base_utils import (
+    wrap,
+    compact,
+    presence,
+    sanitize,
+    parse_attributes,
+    get_path,
+)
 from ..author_utils import get_authors
 from ..date_utils import get_date_from_date_parts
 from ..doi_utils import (
     doi_as_url,
     doi_from_url,
     get_doi_ra,
+    get_ra_cache,
     get_crossref_member,
+    get_member_cache,
+    load_crossref_members,
     crossref_api_url,
+    validate_prefix,
 )
+from ..http_utils import http_get, async_http_get, offline
+from ..file_utils import open_file, iter_json_items, iter_json_lines
 from ..constants import (
     CR_TO_CM_TRANSLATIONS,
     CROSSREF_CONTAINER_TYPES,
     Commonmeta,
 )
 
+CROSSREF_WORKS_URL = "https://api.crossref.org/works"
+CROSSREF_ROWS = 1000
+
 
 def get_crossref(pid: str, **kwargs) -> dict:
     """get_crossref"""
@@ -34,27 +52,175 @@ def get_crossref(pid: str, **kwargs) -> dict:
     if doi is None:
         return {"state": "not_found"}
     url = crossref_api_url(doi)
-    response = requests.get(url, kwargs, timeout=10)
+    response = http_get(url, kwargs)
+    if response.status_code != 200:
+        return {"state": "not_found"}
+    return response.json().get("message", {})
+
+
+async def aget_crossref(pid: str, **kwargs) -> dict:
+    """get_crossref, async version"""
+    doi = doi_from_url(pid)
+    if doi is None:
+        return {"state": "not_found"}
+    url = crossref_api_url(doi)
+    response = await async_http_get(url, kwargs)
     if response.status_code != 200:
         return {"state": "not_found"}
     return response.json().get("message", {})
 
 
+def get_crossref_works(
+    member: Optional[str] = None,
+    prefix: Optional[str] = None,
+    from_update_date: Optional[str] = None,
+    rows: int = CROSSREF_ROWS,
+    url: str = CROSSREF_WORKS_URL,
+    **kwargs,
+) -> Iterator[dict]:
+    """Walk the Crossref works API with deep paging cursors and yield one work
+    at a time. Optional filters by member id, DOI prefix and update date
+    (YYYY-MM-DD), other kwargs (e.g. mailto or query) are passed as query
+    parameters. Only one page is held in memory."""
+    filters = compact(
+        {
+            "member": member,
+            "prefix": prefix,
+            "from-update-date": from_update_date,
+        }
+    )
+    params = compact(
+        {
+            "filter": ",".join(f"{k}:{v}" for k, v in filters.items()) or None,
+            "rows": rows,
+            "cursor": "*",
+        }
+    ) | kwargs
+    ra_cache = get_ra_cache()
+    while True:
+        response = http_get(url, params)
+        response.raise_for_status()
+        message = response.json().get("message", {})
+        items = message.get("items", [])
+        page_size = len(items)
+        next_cursor = message.get("next-cursor", None)
+
+        # release each work once it has been consumed
+        items.reverse()
+        while items:
+            item = items.pop()
+            # all works returned by the Crossref API are registered with Crossref
+            item_prefix = validate_prefix(item.get("DOI", None))
+            if item_prefix is not None and item_prefix not in ra_cache:
+                ra_cache.set(item_prefix, "Crossref")
+            yield item
+
+        if next_cursor is None or page_size < rows:
+            break
+        params["cursor"] = next_cursor
+
+
+def read_crossref_works(**kwargs) -> Iterator[Commonmeta]:
+    """Harvest works from the Crossref works API, see get_crossref_works for
+    options, and yield them converted with read_crossref one at a time"""
+    for item in get_crossref_works(**kwargs):
+        yield read_crossref(item)
+
+
+def get_crossref_file(file_path: str) -> Iterator[dict]:
+    """Stream the works in a Crossref public data file shard, either JSON with
+    an items array (.json or .json.gz) or JSON Lines (.jsonl or .jsonl.gz),
+    decoding one work at a time. Works wrapped in an API response are
+    unwrapped."""
+    with open_file(file_path) as file:
+        if file_path.endswith((".jsonl", ".jsonl.gz")):
+            items = iter_json_lines(file)
+        else:
+            items = iter_json_items(file)
+        for item in items:
+            if "message" in item and "DOI" not in item:
+                item = item["message"]
+            yield item
+
+
+def cache_crossref_work(item: dict) -> None:
+    """Seed the registration agency cache from a Crossref work, so that
+    read_crossref doesn't look it up over the network"""
+    prefix = validate_prefix(item.get("DOI", None))
+    ra_cache = get_ra_cache()
+    if prefix is not None and prefix not in ra_cache:
+        ra_cache.set(prefix, "Crossref")
+
+
+def read_crossref_file(file_path: str, **kwargs) -> Iterator[Commonmeta]:
+    """Read a Crossref public data file shard and yield its works converted
+    with read_crossref one at a time, without network requests. Members
+    cached, e.g. via load_crossref_members, are used for the publisher,
+    otherwise the publisher in the work."""
+    for item in get_crossref_file(file_path):
+        cache_crossref_work(item)
+        with offline():
+            meta = read_crossref(item, **kwargs)
+        yield meta
+
+
+def read_crossref_file_as_list(
+    file_path: str, members_path: Optional[str] = None
+) -> List[Commonmeta]:
+    """Read a Crossref public data file shard, used by read_crossref_files
+    in worker processes"""
+    if members_path is not None and len(get_member_cache()) == 0:
+        load_crossref_members(members_path)
+    return list(read_crossref_file(file_path))
+
+
+def read_crossref_files(
+    file_paths: Iterable[str],
+    max_workers: Optional[int] = None,
+    members_path: Optional[str] = None,
+) -> Iterator[Commonmeta]:
+    """Read Crossref public data file shards in a pool of max_workers
+    processes (default: number of CPUs), yielding works shard by shard in
+    the order of file_paths. Each process converts a whole shard, and one
+    shard per process is in flight while a shard is yielded, so at most
+    max_workers + 1 converted shards are held in memory.
+    members_path is an optional file of Crossref members loaded into the
+    member cache of each process, see load_crossref_members."""
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures: deque = deque()
+        for file_path in file_paths:
+            futures.append(
+                executor.submit(read_crossref_file_as_list, file_path, members_path)
+            )
+            if len(futures) > max_workers:
+                yield from futures.popleft().result()
+        while futures:
+            yield from futures.popleft().result()
+
+
 def read_crossref(data: Optional[dict], **kwargs) -> Commonmeta:
     """read_crossref"""
     if data is None:
         return {"state": "not_found"}
-    meta = data
     # read_options = ActiveSupport::HashWithIndifferentAccess.
     # new(options.except(:doi, :id, :url,
     # :sandbox, :validate, :ra))
     read_options = kwargs or {}
 
-    doi = meta.get("DOI", None)
-    id_ = doi_as_url(doi)
-    resource_type = meta.get("type", {}).title().replace("-", "")
-    type_ = CR_TO_CM_TRANSLATIONS.get(resource_type, "Other")
+    meta = {key: read_field(data) for key, read_field in CROSSREF_FIELDS.items()}
+    if read_options:
+        meta["state"] = "findable"
+    return meta | read_options
+
+
+def get_resource_type(meta: dict) -> str:
+    """Crossref resource type in title case, e.g. JournalArticle"""
+    return meta.get("type", {}).title().replace("-", "")
+
 
+def get_contributors(meta: dict) -> Optional[list]:
+    """Authors and editors from Crossref metadata"""
     if meta.get("author", None):
         contributors = get_authors(from_csl(wrap(meta.get("author"))))
     else:
@@ -67,84 +233,107 @@ def read_crossref(data: Optional[dict], **kwargs) -> Commonmeta:
     editors = [editor_type(i) for i in wrap(meta.get("editor", None))]
     if editors:
         contributors += get_authors(from_csl(editors))
+    return contributors
 
-    url = normalize_url(py_.get(meta, "resource.primary.URL"))
-    titles = get_titles(meta)
 
+def get_publisher(meta: dict) -> Optional[dict]:
+    """Publisher from Crossref member or metadata"""
     member_id = meta.get("member", None)
     # TODO: get publisher from member_id almost always return publisher name, but sometimes does not
     if member_id is not None:
         publisher = get_crossref_member(member_id)
     else:
         publisher = meta.get("publisher", None)
+    # member not cached in offline mode
+    if publisher is None and meta.get("publisher", None) is not None:
+        publisher = compact(
+            {
+                "id": "https://api.crossref.org/members/" + member_id
+                if member_id is not None
+                else None,
+                "name": meta.get("publisher"),
+            }
+        )
+    return publisher
+
 
+def get_date(meta: dict) -> dict:
+    """Dates from Crossref metadata"""
     date: dict = {}
     date["submitted"] = None
-    date["accepted"] = py_.get(meta, "accepted.date-time")
+    date["accepted"] = get_path(meta, "accepted.date-time")
     date["published"] = (
-        py_.get(meta, "issued.date-time")
+        get_path(meta, "issued.date-time")
         or get_date_from_date_parts(meta.get("issued", None))
-        or py_.get(meta, "created.date-time")
+        or get_path(meta, "created.date-time")
     )
-    date["updated"] = py_.get(meta, "updated.date-time") or py_.get(
+    date["updated"] = get_path(meta, "updated.date-time") or get_path(
         meta, "deposited.date-time"
     )
+    return compact(date)
+
 
+def get_license(meta: dict) -> Optional[dict]:
+    """License from Crossref metadata"""
     license_ = meta.get("license", None)
     if license_ is not None:
         license_ = normalize_cc_url(license_[0].get("URL", None))
         license_ = dict_to_spdx({"url": license_}) if license_ else None
+    return license_
 
-    container = get_container(meta, resource_type=resource_type)
-
-    references = [
-        get_reference(i) for i in wrap(meta.get("reference", None))
-    ]
-    funding_references = from_crossref_funding(wrap(meta.get("funder", None)))
 
+def get_descriptions(meta: dict) -> Optional[list]:
+    """Abstract from Crossref metadata"""
     description = meta.get("abstract", None)
     if description is not None:
-        descriptions = [
-            {"description": sanitize(description), "descriptionType": "Abstract"}
+        return [{"description": sanitize(description), "descriptionType": "Abstract"}]
+    return None
+
+
+# functions reading one commonmeta property each from Crossref metadata, so
+# that properties can also be read on demand
+CROSSREF_FIELDS = {
+    # required properties
+    "id": lambda meta: doi_as_url(meta.get("DOI", None)),
+    "type": lambda meta: CR_TO_CM_TRANSLATIONS.get(get_resource_type(meta), "Other"),
+    "url": lambda meta: normalize_url(get_path(meta, "resource.primary.URL")),
+    "contributors": get_contributors,
+    "titles": lambda meta: presence(get_titles(meta)),
+    "publisher": get_publisher,
+    "date": get_date,
+    # recommended and optional properties
+    "subjects": lambda meta: presence(
+        [{"subject": i} for i in wrap(meta.get("subject", []))]
+    ),
+    "language": lambda meta: meta.get("language", None),
+    "alternate_identifiers": lambda meta: None,
+    "sizes": lambda meta: None,
+    "formats": lambda meta: None,
+    "version": lambda meta: meta.get("version", None),
+    "license": get_license,
+    "descriptions": get_descriptions,
+    "geo_locations": lambda meta: None,
+    "funding_references": lambda meta: presence(
+        from_crossref_funding(wrap(meta.get("funder", None)))
+    ),
+    "references": lambda meta: [
+        get_reference(i) for i in wrap(meta.get("reference", None))
+    ],
+    # other properties
+    "files": lambda meta: presence(
+        [
+            get_file(i)
+            for i in wrap(meta.get("link", None))
+            if i["content-type"] != "unspecified"
         ]
-    else:
-        descriptions = None
-
-    subjects = [{"subject": i} for i in wrap(meta.get("subject", []))]
-    files = [
-        get_file(i) for i in wrap(meta.get("link", None)) if i["content-type"] != "unspecified"
-    ]
-
-    state = "findable" if meta or read_options else "not_found"
-    
-    return {
-        # required properties
-        "id": id_,
-        "type": type_,
-        "url": url,
-        "contributors": contributors,
-        "titles": presence(titles),
-        "publisher": publisher,
-        "date": compact(date),
-        # recommended and optional properties
-        "subjects": presence(subjects),
-        "language": meta.get("language", None),
-        "alternate_identifiers": None,
-        "sizes": None,
-        "formats": None,
-        "version": meta.get("version", None),
-        "license": license_,
-        "descriptions": descriptions,
-        "geo_locations": None,
-        "funding_references": presence(funding_references),
-        "references": references,
-        # other properties
-        "files": presence(files),
-        "container": presence(container),
-        "provider": get_doi_ra(id_),
-        "state": state,
-        "schema_version": None,
-    } | read_options
+    ),
+    "container": lambda meta: presence(
+        get_container(meta, resource_type=get_resource_type(meta))
+    ),
+    "provider": lambda meta: get_doi_ra(doi_as_url(meta.get("DOI", None))),
+    "state": lambda meta: "findable" if meta else "not_found",
+    "schema_version": lambda meta: None,
+}
 
 
 def get_titles(meta):
@@ -253,7 +442,7 @@ def get_container(meta: dict, resource_type: str = "JournalArticle") -> dict:
     isbn = isbn["value"] if isbn else None
     container_title = parse_attributes(meta.get("container-title", None), first=True)
     volume = meta.get("volume", None)
-    issue = py_.get(meta, "journal-issue.issue")
+    issue = get_path(meta, "journal-issue.issue")
     if meta.get("page", None):
         pages = meta.get("page", None).split("-")
         first_page = pages[0]
@@ -1,7 +1,8 @@
 """crossref_xml reader for commonmeta-py"""
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
 from collections import defaultdict
-import requests
+from lxml import etree
 from pydash import py_
 
 from ..utils import (
@@ -19,6 +20,13 @@ from ..base_utils import (
     sanitize,
     parse_attributes,
     parse_xml,
+    element_value,
+    crossref_name,
+    CROSSREF_XML_NAMESPACES,
+    CROSSREF_XML_FORCE_LIST,
+    MISSING,
+    compile_path,
+    get_path,
 )
 from ..author_utils import get_authors
 from ..date_utils import get_date_from_crossref_parts, get_iso8601_date
@@ -28,12 +36,31 @@ from ..doi_utils import (
     crossref_xml_api_url,
     normalize_doi,
 )
+from ..http_utils import http_get, async_http_get
+from ..file_utils import open_binary_file
 from ..constants import (
     Commonmeta,
     CR_TO_CM_TRANSLATIONS,
     CROSSREF_CONTAINER_TYPES,
 )
 
+# elements holding one record in Crossref XML query results and deposits
+CROSSREF_XML_RECORD_TAGS = [
+    "{*}query",
+    "{*}doi_record",
+    "{*}journal",
+    "{*}book",
+    "{*}conference",
+    "{*}sa_component",
+    "{*}dissertation",
+    "{*}report-paper",
+    "{*}standard",
+    "{*}database",
+    "{*}posted_content",
+    "{*}peer_review",
+    "{*}pending_publication",
+]
+
 
 def get_crossref_xml(pid: str, **kwargs) -> dict:
     """Get crossref_xml metadata from a DOI"""
@@ -41,8 +68,21 @@ def get_crossref_xml(pid: str, **kwargs) -> dict:
     if doi is None:
         return {"state": "not_found"}
     url = crossref_xml_api_url(doi)
-    response = requests.get(
-        url, kwargs, headers={"Accept": "text/xml;charset=utf-8"}, timeout=10
+    response = http_get(url, kwargs, headers={"Accept": "text/xml;charset=utf-8"})
+    if response.status_code != 200:
+        return {"state": "not_found"}
+
+    return parse_xml(response.text, dialect="crossref")
+
+
+async def aget_crossref_xml(pid: str, **kwargs) -> dict:
+    """Get crossref_xml metadata from a DOI, async version"""
+    doi = doi_from_url(pid)
+    if doi is None:
+        return {"state": "not_found"}
+    url = crossref_xml_api_url(doi)
+    response = await async_http_get(
+        url, kwargs, headers={"Accept": "text/xml;charset=utf-8"}
     )
     if response.status_code != 200:
         return {"state": "not_found"}
@@ -50,17 +90,83 @@ def get_crossref_xml(pid: str, **kwargs) -> dict:
     return parse_xml(response.text, dialect="crossref")
 
 
-def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
-    """read_crossref_xml"""
+def get_crossref_xml_file(file_path: str, engine: str = "xmltodict") -> Iterator:
+    """Stream the records in a Crossref XML file (optionally gzipped), parsing
+    one record at a time with iterparse and clearing it afterwards, so that
+    memory use doesn't depend on file size. Supports query results with
+    many query elements (unixsd), doi_records (unixref) and doi_batch
+    deposits. Records are wrapped like a single query result, as expected by
+    read_crossref_xml. With engine lxml, yields the lxml elements of the
+    records instead, which must be read before the next record is parsed."""
+    with open_binary_file(file_path) as file:
+        for _, element in etree.iterparse(
+            file, events=("end",), tag=CROSSREF_XML_RECORD_TAGS, huge_tree=True
+        ):
+            parent = element.getparent()
+            tag = etree.QName(element).localname
+            parent_tag = etree.QName(parent).localname if parent is not None else None
+            if tag == "doi_record" and parent_tag == "query":
+                continue
+            if tag not in ["query", "doi_record"] and parent_tag != "body":
+                continue
+            if engine == "lxml":
+                yield element
+            else:
+                query = parse_crossref_xml_element(element)
+                if tag == "query":
+                    query = query["query"]
+                elif tag != "doi_record":
+                    # work in a doi_batch deposit
+                    query = {"doi_record": {"crossref": query}}
+                yield {"crossref_result": {"query_result": {"body": {"query": query}}}}
+            # free memory used by this and earlier records
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del parent[0]
+
+
+def parse_crossref_xml_element(element) -> dict:
+    """Parse an lxml element into a dict, in the same way as parse_xml"""
+    return parse_xml(etree.tostring(element, encoding="unicode"), dialect="crossref")
+
+
+def read_crossref_xml_file(
+    file_path: str, engine: str = "xmltodict", **kwargs
+) -> Iterator[Commonmeta]:
+    """Read a Crossref XML file and yield its records converted with
+    read_crossref_xml one at a time. With engine lxml, records are read from
+    the lxml elements without converting them into dicts first."""
+    for data in get_crossref_xml_file(file_path, engine):
+        yield read_crossref_xml(data, **kwargs)
+
+
+def read_crossref_xml(data, **kwargs) -> Commonmeta:
+    """read_crossref_xml. data is parsed with the crossref dialect of
+    parse_xml, or is the lxml element of a Crossref XML document, query,
+    doi_record or work, which is read with crossref_xml_get instead of
+    converting it into a dict first."""
     if data is None:
         return {"state": "not_found"}
-    meta = py_.get(
+    if isinstance(data, (etree._Element, etree._ElementTree)):
+        query, meta = crossref_xml_record(data)
+        return read_crossref_xml_record(
+            query, meta, get=crossref_xml_get, find=crossref_xml_find, **kwargs
+        )
+    meta = get_path(
         data, "crossref_result.query_result.body.query.doi_record.crossref", {}
     )
 
     # query contains information from outside metadata schema, e.g. publisher name
-    query = py_.get(data, "crossref_result.query_result.body.query", {})
+    query = get_path(data, "crossref_result.query_result.body.query", {})
+    return read_crossref_xml_record(query, meta, **kwargs)
 
+
+def read_crossref_xml_record(
+    query, meta, get=get_path, find=get_path, **kwargs
+) -> Commonmeta:
+    """Read the query and crossref metadata of a Crossref XML record. get
+    returns the value at a path like py_.get, find returns the value used
+    for further lookups, which is None if the value is empty."""
     # read_options = ActiveSupport::HashWithIndifferentAccess.
     # new(options.except(:doi, :id, :url,
     # :sandbox, :validate, :ra))
@@ -69,7 +175,7 @@ def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
     member_id = next(
         (
             i
-            for i in wrap(query.get("crm-item", None))
+            for i in wrap(get(query, "crm-item"))
             if i.get("name", None) == "member-id"
         ),
         {},
@@ -83,7 +189,7 @@ def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
             "name": next(
                 (
                     i
-                    for i in wrap(query.get("crm-item", None))
+                    for i in wrap(get(query, "crm-item"))
                     if i.get("name", None) == "publisher-name"
                 ),
                 {},
@@ -92,49 +198,49 @@ def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
     )
 
     # fetch metadata depending of Crossref type
-    if py_.get(meta, "journal.journal_article", None):
-        bibmeta = py_.get(meta, "journal.journal_article", {})
+    if find(meta, "journal.journal_article") is not None:
+        bibmeta = find(meta, "journal.journal_article")
         resource_type = "JournalArticle"
-    elif py_.get(meta, "journal.journal_issue", None):
-        bibmeta = py_.get(meta, "journal.journal_issue", {})
+    elif find(meta, "journal.journal_issue") is not None:
+        bibmeta = find(meta, "journal.journal_issue")
         resource_type = "JournalIssue"
-    elif py_.get(meta, "journal", None):
-        bibmeta = py_.get(meta, "journal", {})
+    elif find(meta, "journal") is not None:
+        bibmeta = find(meta, "journal")
         resource_type = "Journal"
-    elif py_.get(meta, "posted_content", None):
-        bibmeta = meta.get("posted_content", {})
+    elif find(meta, "posted_content") is not None:
+        bibmeta = find(meta, "posted_content")
         if publisher.get("name", None) is None:
-            publisher = {"name": py_.get(bibmeta, "institution.institution_name", None)}
+            publisher = {"name": get(bibmeta, "institution.institution_name")}
         resource_type = "PostedContent"
-    elif py_.get(meta, "book.content_item"):
-        bibmeta = py_.get(meta, "book.content_item")
+    elif find(meta, "book.content_item") is not None:
+        bibmeta = find(meta, "book.content_item")
         resource_type = "BookChapter"
-    elif py_.get(meta, "book.book_series_metadata"):
-        bibmeta = py_.get(meta, "book.book_series_metadata")
+    elif find(meta, "book.book_series_metadata") is not None:
+        bibmeta = find(meta, "book.book_series_metadata")
         resource_type = "BookSeries"
-    elif py_.get(meta, "book.book_set_metadata"):
-        bibmeta = py_.get(meta, "book.book_set_metadata")
+    elif find(meta, "book.book_set_metadata") is not None:
+        bibmeta = find(meta, "book.book_set_metadata")
         resource_type = "BookSet"
-    elif py_.get(meta, "book.book_metadata"):
-        bibmeta = py_.get(meta, "book.book_metadata")
+    elif find(meta, "book.book_metadata") is not None:
+        bibmeta = find(meta, "book.book_metadata")
         resource_type = "Book"
-    elif py_.get(meta, "conference", None):
-        bibmeta = py_.get(meta, "conference.conference_paper", {})
+    elif find(meta, "conference") is not None:
+        bibmeta = find(meta, "conference.conference_paper", {})
         resource_type = "ProceedingsArticle"
-    elif py_.get(meta, "sa_component", None):
-        bibmeta = py_.get(meta, "sa_component.component_list.component", {})
+    elif find(meta, "sa_component") is not None:
+        bibmeta = find(meta, "sa_component.component_list.component", {})
         resource_type = "Component"
-    elif py_.get(meta, "database", None):
-        bibmeta = py_.get(meta, "database.dataset", {})
+    elif find(meta, "database") is not None:
+        bibmeta = find(meta, "database.dataset", {})
         resource_type = "Dataset"
-    elif py_.get(meta, "report_paper", None):
-        bibmeta = py_.get(meta, "report_paper.report_paper_metadata", {})
+    elif find(meta, "report_paper") is not None:
+        bibmeta = find(meta, "report_paper.report_paper_metadata", {})
         resource_type = "Report"
-    elif py_.get(meta, "peer_review", None):
-        bibmeta = py_.get(meta, "peer_review", {})
+    elif find(meta, "peer_review") is not None:
+        bibmeta = find(meta, "peer_review")
         resource_type = "PeerReview"
-    elif py_.get(meta, "dissertation", None):
-        bibmeta = py_.get(meta, "dissertation", {})
+    elif find(meta, "dissertation") is not None:
+        bibmeta = find(meta, "dissertation")
         resource_type = "Dissertation"
     else:
         bibmeta = {}
@@ -143,32 +249,32 @@ def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
     id_ = normalize_doi(
         kwargs.get("doi", None)
         or kwargs.get("id", None)
-        or py_.get(bibmeta, "doi_data.doi")
+        or get(bibmeta, "doi_data.doi")
     )
     type_ = CR_TO_CM_TRANSLATIONS.get(resource_type, "Other")
-    url = parse_attributes(py_.get(bibmeta, "doi_data.resource"))
+    url = parse_attributes(get(bibmeta, "doi_data.resource"))
     url = normalize_url(url)
-    titles = crossref_titles(bibmeta)
-    contributors = crossref_people(bibmeta)
+    titles = crossref_titles(bibmeta, get=get)
+    contributors = crossref_people(bibmeta, get=get)
 
     date: dict = defaultdict(list)
     date["created"] = next(
         (
             i
-            for i in wrap(query.get("crm-item", None))
+            for i in wrap(get(query, "crm-item"))
             if i.get("name", None) == "created"
         ),
         {},
     ).get("#text", None)
     date["published"] = (
-        get_date_from_crossref_parts(bibmeta.get("publication_date", {}))
-        or get_date_from_crossref_parts(bibmeta.get("review_date", {}))
+        get_date_from_crossref_parts(get(bibmeta, "publication_date", {}))
+        or get_date_from_crossref_parts(get(bibmeta, "review_date", {}))
         or date["created"]
     )
     date["updated"] = next(
         (
             i
-            for i in wrap(query.get("crm-item", None))
+            for i in wrap(get(query, "crm-item"))
             if i.get("name", None) == "last-update"
         ),
         {},
@@ -177,19 +283,19 @@ def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
     # TODO: fix timestamp. Until then, remove time as this is not always stable with Crossref (different server timezones)
     date = {k: get_iso8601_date(v) for k, v in date.items()}
 
-    descriptions = crossref_description(bibmeta)
+    descriptions = crossref_description(bibmeta, get=get)
     funding = (
-        py_.get(bibmeta, "program")
-        or py_.get(bibmeta, "program.0.assertion")
-        or py_.get(bibmeta, "crossmark.custom_metadata.program.assertion")
-        or py_.get(bibmeta, "crossmark.custom_metadata.program.0.assertion")
+        get(bibmeta, "program")
+        or get(bibmeta, "program.0.assertion")
+        or get(bibmeta, "crossmark.custom_metadata.program.assertion")
+        or get(bibmeta, "crossmark.custom_metadata.program.0.assertion")
     )
     funding_references = crossref_funding(wrap(funding))
 
     license_ = (
-        py_.get(bibmeta, "program.license_ref")
-        or py_.get(bibmeta, "crossmark.custom_metadata.program.license_ref")
-        or py_.get(bibmeta, "crossmark.custom_metadata.program.1.license_ref")
+        get(bibmeta, "program.license_ref")
+        or get(bibmeta, "crossmark.custom_metadata.program.license_ref")
+        or get(bibmeta, "crossmark.custom_metadata.program.1.license_ref")
     )
     license_ = crossref_license(wrap(license_))
 
@@ -221,17 +327,18 @@ def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
     #     )
     # else:
     #     container = None
-    container = crossref_container(meta, resource_type=resource_type)
+    container = crossref_container(meta, resource_type=resource_type, get=get)
     references = [
-        crossref_reference(i) for i in wrap(py_.get(bibmeta, "citation_list.citation"))
+        crossref_reference(i) for i in wrap(get(bibmeta, "citation_list.citation"))
     ]
-    language = py_.get(meta, "journal.journal_metadata.language")
+    language = get(meta, "journal.journal_metadata.language")
 
-    files = presence(meta.get("contentUrl", None))
+    files = presence(get(meta, "contentUrl"))
 
     # TODO: consistent case for DOI registration agency
-    provider = bibmeta.get("reg-agency", None) or get_doi_ra(id_)
-    state = "findable" if meta or read_options else "not_found"
+    provider = get(bibmeta, "reg-agency") or get_doi_ra(id_)
+    found = meta is not None and not (isinstance(meta, dict) and not meta)
+    state = "findable" if found or read_options else "not_found"
 
     return {
         # required properties
@@ -267,15 +374,15 @@ def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
     } | read_options
 
 
-def crossref_titles(bibmeta):
+def crossref_titles(bibmeta, get=get_path):
     """Title information from Crossref metadata."""
-    title = parse_attributes(py_.get(bibmeta, "titles.0.title"))
-    subtitle = parse_attributes(py_.get(bibmeta, "titles.0.subtitle"))
+    title = parse_attributes(get(bibmeta, "titles.0.title"))
+    subtitle = parse_attributes(get(bibmeta, "titles.0.subtitle"))
     original_language_title = parse_attributes(
-        py_.get(bibmeta, "titles.0.original_language_title")
+        get(bibmeta, "titles.0.original_language_title")
     )
     language = parse_attributes(
-        py_.get(bibmeta, "titles.0.original_language_title"), content="language"
+        get(bibmeta, "titles.0.original_language_title"), content="language"
     )
     if title is None and original_language_title is None:
         return None
@@ -300,7 +407,7 @@ def crossref_titles(bibmeta):
         ]
 
 
-def crossref_description(bibmeta):
+def crossref_description(bibmeta, get=get_path):
     """Description information from Crossref metadata."""
 
     def format_abstract(element):
@@ -321,16 +428,14 @@ def crossref_description(bibmeta):
             }
         )
 
-    return [format_abstract(i) for i in wrap(bibmeta.get("abstract", None))]
+    return [format_abstract(i) for i in wrap(get(bibmeta, "abstract"))]
 
 
-def crossref_people(bibmeta):
+def crossref_people(bibmeta, get=get_path):
     """Person information from Crossref metadata."""
 
-    person = py_.get(bibmeta, "contributors.0.person_name") or bibmeta.get(
-        "person_name", None
-    )
-    organization = wrap(py_.get(bibmeta, "contributors.0.organization"))
+    person = get(bibmeta, "contributors.0.person_name") or get(bibmeta, "person_name")
+    organization = wrap(get(bibmeta, "contributors.0.organization"))
 
     return get_authors(from_crossref_xml(wrap(person) + wrap(organization)))
 
@@ -402,17 +507,19 @@ def crossref_reference(reference: Optional[dict]) -> Optional[dict]:
     return compact(metadata)
 
 
-def crossref_container(meta: dict, resource_type: str = "JournalArticle") -> dict:
+def crossref_container(
+    meta: dict, resource_type: str = "JournalArticle", get=get_path
+) -> dict:
     """Get container from Crossref"""
     container_type = CROSSREF_CONTAINER_TYPES.get(resource_type, None)
     issn = next(
         (
             i
             for i in wrap(
-                py_.get(meta, f"{container_type}.{container_type}_metadata.issn")
+                get(meta, f"{container_type}.{container_type}_metadata.issn")
             )
             + wrap(
-                py_.get(
+                get(
                     meta,
                     f"{container_type}.{container_type}_series_metadata.series_metadata.issn",
                 )
@@ -424,10 +531,10 @@ def crossref_container(meta: dict, resource_type: str = "JournalArticle") -> dic
         (
             i
             for i in wrap(
-                py_.get(meta, f"{container_type}.{container_type}_metadata.issn")
+                get(meta, f"{container_type}.{container_type}_metadata.issn")
             )
             + wrap(
-                py_.get(
+                get(
                     meta,
                     f"{container_type}.{container_type}_series_metadata.series_metadata.issn",
                 )
@@ -437,21 +544,21 @@ def crossref_container(meta: dict, resource_type: str = "JournalArticle") -> dic
         {},
     )
     issn = normalize_issn(issn) if issn else None
-    isbn = py_.get(meta, f"conference.{container_type}_metadata.isbn.#text")
+    isbn = get(meta, f"conference.{container_type}_metadata.isbn.#text")
     container_title = (
-        py_.get(meta, f"{container_type}.{container_type}_metadata.full_title")
-        or py_.get(meta, f"{container_type}.{container_type}_metadata.titles.0.title")
-        or py_.get(meta, f"conference.{container_type}_metadata.{container_type}_title")
-        or py_.get(
+        get(meta, f"{container_type}.{container_type}_metadata.full_title")
+        or get(meta, f"{container_type}.{container_type}_metadata.titles.0.title")
+        or get(meta, f"conference.{container_type}_metadata.{container_type}_title")
+        or get(
             meta,
             f"{container_type}.{container_type}_series_metadata.series_metadata.titles.0.title",
         )
     )
-    volume = py_.get(
+    volume = get(
         meta,
         f"{container_type}.{container_type}_issue.{container_type}_volume.volume",
     )
-    issue = py_.get(meta, f"{container_type}.{container_type}_issue.issue")
+    issue = get(meta, f"{container_type}.{container_type}_issue.issue")
     return compact(
         {
             "type": py_.pascal_case(container_type) if container_type else None,
@@ -460,18 +567,18 @@ def crossref_container(meta: dict, resource_type: str = "JournalArticle") -> dic
             "title": container_title,
             "volume": volume,
             "issue": issue,
-            "firstPage": py_.get(
+            "firstPage": get(
                 meta, f"{container_type}.{container_type}_article.pages.first_page"
             )
-            or py_.get(meta, f"{container_type}.content_item.pages.first_page")
-            or py_.get(meta, "conference.conference_paper.pages.first_page"),
-            "lastPage": py_.get(
+            or get(meta, f"{container_type}.content_item.pages.first_page")
+            or get(meta, "conference.conference_paper.pages.first_page"),
+            "lastPage": get(
                 meta, f"{container_type}.{container_type}_article.pages.last_page"
             )
-            or py_.get(meta, f"{container_type}.content_item.pages.last_page")
-            or py_.get(meta, "conference.conference_paper.pages.last_page"),
-            "location": py_.get(meta, "conference.event_metadata.conference_location"),
-            "series": py_.get(meta, "conference.event_metadata.conference_acronym"),
+            or get(meta, f"{container_type}.content_item.pages.last_page")
+            or get(meta, "conference.conference_paper.pages.last_page"),
+            "location": get(meta, "conference.event_metadata.conference_location"),
+            "series": get(meta, "conference.event_metadata.conference_acronym"),
         }
     )
 
@@ -492,3 +599,124 @@ def crossref_license(licenses: list) -> dict:
 
     # return only the first license found
     return next((map_element(i) for i in licenses), None)
+
+
+def crossref_xml_record(element) -> Tuple[object, object]:
+    """Query and crossref metadata of an lxml element of a Crossref XML
+    document, query, doi_record or work, as used by read_crossref_xml_record"""
+    if isinstance(element, etree._ElementTree):
+        element = element.getroot()
+    tag = crossref_name(element.tag)
+    if tag == "crossref_result":
+        query = crossref_xml_find(element, "query_result.body.query", {})
+    elif tag in ["query", "doi_record"]:
+        query = element
+    else:
+        # work in a doi_batch deposit
+        return {}, {tag: element}
+    meta = crossref_xml_find(
+        query, "crossref" if tag == "doi_record" else "doi_record.crossref", {}
+    )
+    return query, meta
+
+
+@lru_cache(maxsize=None)
+def compile_crossref_xml_path(path: str) -> Tuple[tuple, ...]:
+    """Compile a py_.get path into steps of key, names of matching elements
+    and attributes, and list index"""
+    steps = []
+    for key, index in compile_path(path):
+        names: tuple = ()
+        if key != "#text" and index is None:
+            names = (key,) + tuple(
+                f"{{{uri}}}{key}" for uri in CROSSREF_XML_NAMESPACES
+            )
+        steps.append((key, names, index))
+    return tuple(steps)
+
+
+def crossref_xml_path(element, path: str):
+    """Follow path from an lxml element like py_.get on the dict parsed with
+    the crossref dialect of parse_xml, without converting elements. Returns
+    an element, a list, an attribute or text, or MISSING."""
+    node = element
+    for key, names, index in compile_crossref_xml_path(path):
+        if isinstance(node, etree._Element):
+            node = crossref_xml_child(node, key, names, index)
+        elif isinstance(node, dict):
+            node = node.get(key, MISSING)
+        elif isinstance(node, (list, str)) and index is not None:
+            node = node[index] if -len(node) <= index < len(node) else MISSING
+        else:
+            return MISSING
+        if node is MISSING:
+            return MISSING
+    return node
+
+
+def crossref_xml_child(element, key: str, names: tuple, index: Optional[int]):
+    """Value of key in the dict of an lxml element, without converting
+    elements. Elements with only text are text, as in parse_xml."""
+    if not (element.attrib or has_child_elements(element)):
+        text = crossref_xml_text(element)
+        if text is None or index is None or not -len(text) <= index < len(text):
+            return MISSING
+        return text[index]
+    if key == "#text":
+        text = crossref_xml_text(element)
+        return MISSING if text is None else text
+    if not names:
+        return MISSING
+    attrib = element.attrib
+    attributes = [attrib[name] for name in names if name in attrib]
+    children = list(element.iterchildren(*names))
+    values = attributes + children
+    if not values:
+        return MISSING
+    if len(values) == 1 and not (children and key in CROSSREF_XML_FORCE_LIST):
+        return values[0]
+    return values
+
+
+def crossref_xml_text(element) -> Optional[str]:
+    """Text of an lxml element, including text between child elements"""
+    text = [element.text or ""] + [child.tail or "" for child in element]
+    return "".join(text).strip() or None
+
+
+def crossref_xml_value(node):
+    """Convert the result of crossref_xml_path like parse_xml"""
+    if isinstance(node, list):
+        return [crossref_xml_value(i) for i in node]
+    if isinstance(node, etree._Element):
+        parent = node.getparent()
+        return element_value(
+            node, parent.nsmap if parent is not None else None, "crossref"
+        )
+    return node
+
+
+def crossref_xml_get(element, path: str, default=None):
+    """Get the value at path from an lxml element, the same as py_.get on the
+    dict parsed with the crossref dialect of parse_xml. Only the value found
+    is converted."""
+    node = crossref_xml_path(element, path)
+    return default if node is MISSING else crossref_xml_value(node)
+
+
+def crossref_xml_find(element, path: str, default=None):
+    """Like crossref_xml_get, but returns elements instead of their values,
+    and None for empty elements"""
+    node = crossref_xml_path(element, path)
+    if node is MISSING:
+        return default
+    if isinstance(node, etree._Element) and not (
+        node.attrib or has_child_elements(node) or crossref_xml_text(node)
+    ):
+        return None
+    return node
+
+
+def has_child_elements(element) -> bool:
+    """Whether an lxml element has child elements, ignoring comments"""
+    return next(element.iterchildren(etree.Element), None) is not None
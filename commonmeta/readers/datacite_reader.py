@@ -1,6 +1,10 @@
 """datacite reader for Commonmeta"""
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterator, Optional
 import requests
+import httpx
 from pydash import py_
 
 from ..utils import (
@@ -14,11 +18,15 @@ from ..base_utils import compact, wrap, presence
 from ..author_utils import get_authors
 from ..date_utils import normalize_date_dict
 from ..doi_utils import doi_as_url, doi_from_url, datacite_api_url
+from ..http_utils import http_get, async_http_get, submit_in_context
 from ..constants import (
     DC_TO_CM_TRANSLATIONS,
     Commonmeta,
 )
 
+DATACITE_DOIS_URL = "https://api.datacite.org/dois"
+DATACITE_PAGE_SIZE = 1000
+
 
 def get_datacite(pid: str, **kwargs) -> dict:
     """get_datacite"""
@@ -27,7 +35,7 @@ def get_datacite(pid: str, **kwargs) -> dict:
         return {"state": "not_found"}
     url = datacite_api_url(doi)
     try:
-        response = requests.get(url, kwargs, timeout=10)
+        response = http_get(url, kwargs)
         if response.status_code != 200:
             return {"state": "not_found"}
         return py_.get(response.json(), "data.attributes", {})
@@ -35,6 +43,86 @@ def get_datacite(pid: str, **kwargs) -> dict:
         return {"state": "timeout"}
 
 
+async def aget_datacite(pid: str, **kwargs) -> dict:
+    """get_datacite, async version"""
+    doi = doi_from_url(pid)
+    if doi is None:
+        return {"state": "not_found"}
+    url = datacite_api_url(doi)
+    try:
+        response = await async_http_get(url, kwargs)
+        if response.status_code != 200:
+            return {"state": "not_found"}
+        return py_.get(response.json(), "data.attributes", {})
+    except httpx.ReadTimeout:
+        return {"state": "timeout"}
+
+
+def get_datacite_dois(
+    client_id: Optional[str] = None,
+    provider_id: Optional[str] = None,
+    query: Optional[str] = None,
+    page_size: int = DATACITE_PAGE_SIZE,
+    url: str = DATACITE_DOIS_URL,
+    prefetch: bool = True,
+    **kwargs,
+) -> Iterator[dict]:
+    """Walk the DataCite dois API with cursor pagination and yield the
+    attributes of one DOI at a time. Optional filters by client id, provider
+    id and query, other kwargs are passed as query parameters. With prefetch,
+    the next page is fetched in the background while the current page is
+    consumed."""
+    params = compact(
+        {
+            "client-id": client_id,
+            "provider-id": provider_id,
+            "query": query,
+            "page[size]": page_size,
+            "page[cursor]": 1,
+        }
+    ) | kwargs
+
+    def get_page(page_url: str, page_params: Optional[dict] = None) -> dict:
+        response = http_get(page_url, page_params)
+        response.raise_for_status()
+        return response.json()
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = get_page(url, params)
+        while page is not None:
+            data = page.get("data", [])
+            next_url = py_.get(page, "links.next") if data else None
+            if next_url is None:
+                next_page = None
+            elif executor is not None:
+                next_page = submit_in_context(executor, get_page, next_url)
+            else:
+                next_page = next_url
+
+            # release each DOI once it has been consumed
+            data.reverse()
+            while data:
+                yield data.pop().get("attributes", {})
+
+            if next_page is None:
+                page = None
+            elif executor is not None:
+                page = next_page.result()
+            else:
+                page = get_page(next_page)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def read_datacite_dois(**kwargs) -> Iterator[Commonmeta]:
+    """Harvest DOIs from the DataCite dois API, see get_datacite_dois for
+    options, and yield them converted with read_datacite one at a time"""
+    for item in get_datacite_dois(**kwargs):
+        yield read_datacite(item)
+
+
 def read_datacite(data: dict, **kwargs) -> Commonmeta:
     """read_datacite"""
     meta = data
@@ -43,9 +131,23 @@ def read_datacite(data: dict, **kwargs) -> Commonmeta:
 
     read_options = kwargs or {}
 
-    id_ = doi_as_url(meta.get("doi", None))
+    return {
+        key: read_field(meta) for key, read_field in DATACITE_FIELDS.items()
+    } | read_options
+
+
+def get_types(meta: dict) -> tuple:
+    """commonmeta type and additional type from DataCite types"""
     resource_type_general = py_.get(meta, "types.resourceTypeGeneral")
     resource_type = py_.get(meta, "types.resourceType")
+    return translate_types(resource_type_general, resource_type)
+
+
+@lru_cache(maxsize=1024)
+def translate_types(resource_type_general, resource_type) -> tuple:
+    """commonmeta type and additional type from DataCite resourceTypeGeneral
+    and resourceType, cached as type and additional_type are read from the
+    same types of each record"""
     type_ = DC_TO_CM_TRANSLATIONS.get(resource_type_general, "Other")
     additional_type = DC_TO_CM_TRANSLATIONS.get(resource_type, None)
     # if resource_type is one of the new resource_type_general types introduced in schema 4.3, use it
@@ -54,60 +156,87 @@ def read_datacite(data: dict, **kwargs) -> Commonmeta:
         additional_type = None
     else:
         additional_type = resource_type
+    return type_, additional_type
+
 
+def get_contributors(meta: dict) -> list:
+    """Creators and contributors from DataCite metadata"""
     contributors = get_authors(wrap(meta.get("creators", None)))
     contrib = get_authors(wrap(meta.get("contributors", None)))
     if contrib:
         contributors = contributors + contrib
+    return contributors
+
 
-    publisher = meta.get("publisher", None)
+def parse_publisher(publisher) -> Optional[dict]:
+    """Publisher from DataCite publisher string or dict"""
     if isinstance(publisher, str):
-        publisher = {"name": publisher}
-    elif isinstance(publisher, dict):
-        publisher = get_publisher(publisher)
-    date = get_dates(wrap(meta.get("dates", None)), meta.get("publicationYear", None))
-    container = meta.get("container", None)
+        return {"name": publisher}
+    if isinstance(publisher, dict):
+        return get_publisher(publisher)
+    return publisher
+
+
+def get_license(meta: dict):
+    """License from DataCite rightsList"""
     license_ = meta.get("rightsList", [])
     if len(license_) > 0:
         license_ = normalize_cc_url(license_[0].get("rightsUri", None))
         license_ = dict_to_spdx({"url": license_}) if license_ else None
+    return presence(license_)
 
-    files = [get_file(i) for i in wrap(meta.get("content_url"))]
-    references = get_references(
-        wrap(meta.get("relatedItems", None) or meta.get("relatedIdentifiers", None))
-    )
-    descriptions = get_descriptions(wrap(meta.get("descriptions", None)))
 
-    return {
-        # required properties
-        "id": id_,
-        "type": type_,
-        "doi": doi_from_url(id_) if id_ else None,
-        "url": normalize_url(meta.get("url", None)),
-        "contributors": contributors,
-        "titles": compact(meta.get("titles", None)),
-        "publisher": publisher,
-        "date": compact(date),
-        # recommended and optional properties
-        "additional_type": additional_type,
-        "subjects": presence(meta.get("subjects", None)),
-        "language": meta.get("language", None),
-        "alternate_identifiers": presence(meta.get("alternateIdentifiers", None)),
-        "sizes": presence(meta.get("sizes", None)),
-        "formats": presence(meta.get("formats", None)),
-        "version": meta.get("version", None),
-        "license": presence(license_),
-        "descriptions": descriptions,
-        "geo_locations": wrap(meta.get("geoLocations", None)),
-        "funding_references": presence(meta.get("fundingReferences", None)),
-        "references": presence(references),
-        # other properties
-        "files": presence(files),
-        "container": presence(container),
-        "provider": "DataCite",
-        "state": "findable",
-        "schema_version": meta.get("schemaVersion", None),
-    } | read_options
+# functions reading one commonmeta property each from DataCite metadata, so
+# that properties can also be read on demand
+DATACITE_FIELDS = {
+    # required properties
+    "id": lambda meta: doi_as_url(meta.get("doi", None)),
+    "type": lambda meta: get_types(meta)[0],
+    "doi": lambda meta: doi_from_url(doi_as_url(meta["doi"]))
+    if meta.get("doi", None) is not None
+    else None,
+    "url": lambda meta: normalize_url(meta.get("url", None)),
+    "contributors": get_contributors,
+    "titles": lambda meta: compact(meta.get("titles", None)),
+    "publisher": lambda meta: parse_publisher(meta.get("publisher", None)),
+    "date": lambda meta: compact(
+        get_dates(wrap(meta.get("dates", None)), meta.get("publicationYear", None))
+    ),
+    # recommended and optional properties
+    "additional_type": lambda meta: get_types(meta)[1],
+    "subjects": lambda meta: presence(meta.get("subjects", None)),
+    "language": lambda meta: meta.get("language", None),
+    "alternate_identifiers": lambda meta: presence(
+        meta.get("alternateIdentifiers", None)
+    ),
+    "sizes": lambda meta: presence(meta.get("sizes", None)),
+    "formats": lambda meta: presence(meta.get("formats", None)),
+    "version": lambda meta: meta.get("version", None),
+    "license": get_license,
+    "descriptions": lambda meta: get_descriptions(
+        wrap(meta.get("descriptions", None))
+    ),
+    "geo_locations": lambda meta: wrap(meta.get("geoLocations", None)),
+    "funding_references": lambda meta: presence(
+        meta.get("fundingReferences", None)
+    ),
+    "references": lambda meta: presence(
+        get_references(
+            wrap(
+                meta.get("relatedItems", None)
+                or meta.get("relatedIdentifiers", None)
+            )
+        )
+    ),
+    # other properties
+    "files": lambda meta: presence(
+        [get_file(i) for i in wrap(meta.get("content_url"))]
+    ),
+    "container": lambda meta: presence(meta.get("container", None)),
+    "provider": lambda meta: "DataCite",
+    "state": lambda meta: "findable",
+    "schema_version": lambda meta: meta.get("schemaVersion", None),
+}
 
 
 def get_references(references: list) -> list:
@@ -1,13 +1,23 @@
 """datacite_xml reader for Commonmeta"""
 from collections import defaultdict
-import requests
+from typing import Generator, Iterable, Iterator, Optional
+from lxml import etree
 from pydash import py_
 
-from ..base_utils import compact, wrap, presence, sanitize, parse_attributes
+from ..base_utils import (
+    compact,
+    wrap,
+    presence,
+    sanitize,
+    parse_attributes,
+    element_value,
+)
 from ..author_utils import get_authors
 from ..date_utils import strip_milliseconds, normalize_date_dict
 from ..doi_utils import doi_from_url, doi_as_url, datacite_api_url, normalize_doi
 from ..utils import normalize_url, normalize_cc_url, dict_to_spdx
+from ..http_utils import http_get, async_http_get
+from ..file_utils import open_binary_file
 from ..constants import DC_TO_CM_TRANSLATIONS, Commonmeta
 
 
@@ -17,12 +27,87 @@ def get_datacite_xml(pid: str, **kwargs) -> dict:
     if doi is None:
         return {"state": "not_found"}
     url = datacite_api_url(doi)
-    response = requests.get(url, kwargs, timeout=10)
+    response = http_get(url, kwargs)
     if response.status_code != 200:
         return {"state": "not_found"}
     return py_.get(response.json(), "data.attributes", {})
 
 
+async def aget_datacite_xml(pid: str, **kwargs) -> dict:
+    """get_datacite_xml, async version"""
+    doi = doi_from_url(pid)
+    if doi is None:
+        return {"state": "not_found"}
+    url = datacite_api_url(doi)
+    response = await async_http_get(url, kwargs)
+    if response.status_code != 200:
+        return {"state": "not_found"}
+    return py_.get(response.json(), "data.attributes", {})
+
+
+def get_datacite_oai_file(file_path: str) -> Generator[dict, None, Optional[str]]:
+    """Stream the DataCite resources in an OAI-PMH ListRecords response file
+    (optionally gzipped), one record at a time, skipping deleted records.
+    Each resource subtree is converted into the dict read_datacite_xml
+    expects, without converting the whole document. Returns the resumption
+    token of the response, if any."""
+    token = None
+    with open_binary_file(file_path) as file:
+        for _, element in etree.iterparse(
+            file, events=("end",), tag=["{*}record", "{*}resumptionToken"]
+        ):
+            if etree.QName(element).localname == "resumptionToken":
+                token = (element.text or "").strip() or None
+                continue
+            header = element.find("{*}header")
+            resource = element.find(".//{*}resource")
+            if resource is not None and (
+                header is None or header.get("status", None) != "deleted"
+            ):
+                parent = resource.getparent()
+                yield {"resource": element_value(resource, parent.nsmap)}
+            # free memory used by this and earlier records
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+    return token
+
+
+def get_oai_request_token(file_path: str) -> Optional[str]:
+    """Resumption token of the request of an OAI-PMH response file, read
+    from the request element at the start of the file"""
+    with open_binary_file(file_path) as file:
+        for _, element in etree.iterparse(file, events=("end",), tag="{*}request"):
+            return element.get("resumptionToken", None)
+    return None
+
+
+def get_datacite_oai_files(file_paths: Iterable[str]) -> Iterator[dict]:
+    """Stream the DataCite resources in a set of OAI-PMH ListRecords response
+    files, e.g. a local dump of a harvest. Files are read in harvest order,
+    starting with the response to the initial request and following the
+    resumption token of each response to the file with the response to
+    that token."""
+    files = {get_oai_request_token(i): i for i in file_paths}
+    file_path = files.get(None, None)
+    if file_path is None:
+        raise ValueError("No response to the initial ListRecords request found")
+    while file_path is not None:
+        token = yield from get_datacite_oai_file(file_path)
+        if token is None:
+            return
+        file_path = files.get(token, None)
+        if file_path is None:
+            raise ValueError(f"No response for resumption token {token} found")
+
+
+def read_datacite_oai_files(file_paths: Iterable[str], **kwargs) -> Iterator[Commonmeta]:
+    """Read a set of OAI-PMH ListRecords response files and yield the
+    resources converted with read_datacite_xml one at a time"""
+    for data in get_datacite_oai_files(file_paths):
+        yield read_datacite_xml(data, **kwargs)
+
+
 def read_datacite_xml(data: dict, **kwargs) -> Commonmeta:
     """read_datacite_xml"""
     if data is None:
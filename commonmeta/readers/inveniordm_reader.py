@@ -1,6 +1,5 @@
 """InvenioRDM reader for Commonmeta"""
 from collections import defaultdict
-import requests
 from pydash import py_
 
 from ..utils import (
@@ -10,10 +9,11 @@ from ..utils import (
     name_to_fos,
     from_inveniordm,
 )
-from ..base_utils import compact, wrap, presence, sanitize
+from ..base_utils import compact, wrap, presence, sanitize, get_path
 from ..author_utils import get_authors
 from ..date_utils import strip_milliseconds
 from ..doi_utils import doi_as_url, doi_from_url
+from ..http_utils import http_get, async_http_get
 from ..constants import (
     INVENIORDM_TO_CM_TRANSLATIONS,
     COMMONMETA_RELATION_TYPES,
@@ -26,7 +26,18 @@ def get_inveniordm(pid: str, **kwargs) -> dict:
     if pid is None:
         return {"state": "not_found"}
     url = normalize_url(pid)
-    response = requests.get(url, kwargs, timeout=10)
+    response = http_get(url, kwargs)
+    if response.status_code != 200:
+        return {"state": "not_found"}
+    return response.json()
+
+
+async def aget_inveniordm(pid: str, **kwargs) -> dict:
+    """get_inveniordm, async version"""
+    if pid is None:
+        return {"state": "not_found"}
+    url = normalize_url(pid)
+    response = await async_http_get(url, kwargs)
     if response.status_code != 200:
         return {"state": "not_found"}
     return response.json()
@@ -38,10 +49,10 @@ def read_inveniordm(data: dict, **kwargs) -> Commonmeta:
     read_options = kwargs or {}
 
     id_ = doi_as_url(meta.get("doi", None))
-    resource_type = py_.get(meta, "metadata.resource_type.type")
+    resource_type = get_path(meta, "metadata.resource_type.type")
     type_ = INVENIORDM_TO_CM_TRANSLATIONS.get(resource_type, "Other")
     contributors = get_authors(
-        from_inveniordm(wrap(py_.get(meta, "metadata.creators")))
+        from_inveniordm(wrap(get_path(meta, "metadata.creators")))
     )
     # contrib = get_authors(wrap(meta.get("metadata.contributors", None)))
     # if contrib:
@@ -49,11 +60,11 @@ def read_inveniordm(data: dict, **kwargs) -> Commonmeta:
 
     publisher = {"name": meta.get("publisher", None) or "Zenodo"}
 
-    title = py_.get(meta, "metadata.title")
+    title = get_path(meta, "metadata.title")
     titles = [{"title": sanitize(title)}] if title else None
 
     date: dict = {}
-    date["published"] = py_.get(meta, ("metadata.publication_date"))
+    date["published"] = get_path(meta, ("metadata.publication_date"))
     date["updated"] = strip_milliseconds(meta.get("updated", None))
     container = compact(
         {
@@ -62,22 +73,22 @@ def read_inveniordm(data: dict, **kwargs) -> Commonmeta:
             "title": "Zenodo",
         }
     )
-    license_ = py_.get(meta, "metadata.license.id")
+    license_ = get_path(meta, "metadata.license.id")
     if license_:
         license_ = dict_to_spdx({"id": license_})
 
     descriptions = format_descriptions(
         [
-            py_.get(meta, "metadata.description"),
-            py_.get(meta, "metadata.notes"),
+            get_path(meta, "metadata.description"),
+            get_path(meta, "metadata.notes"),
         ]
     )
-    language = py_.get(meta, "metadata.language")
-    subjects = [name_to_fos(i) for i in wrap(py_.get(meta, "metadata.keywords"))]
+    language = get_path(meta, "metadata.language")
+    subjects = [name_to_fos(i) for i in wrap(get_path(meta, "metadata.keywords"))]
 
-    references = get_references(wrap(py_.get(meta, "metadata.related_identifiers")))
+    references = get_references(wrap(get_path(meta, "metadata.related_identifiers")))
     related_identifiers = get_related_identifiers(
-        wrap(py_.get(meta, "metadata.related_identifiers"))
+        wrap(get_path(meta, "metadata.related_identifiers"))
     )
     if meta.get("conceptdoi", None):
         related_identifiers.append(
@@ -95,7 +106,7 @@ def read_inveniordm(data: dict, **kwargs) -> Commonmeta:
         "id": id_,
         "type": type_,
         "doi": doi_from_url(id_) if id_ else None,
-        "url": normalize_url(py_.get(meta, "links.self_html")),
+        "url": normalize_url(get_path(meta, "links.self_html")),
         "contributors": contributors,
         "titles": titles,
         "publisher": publisher,
@@ -107,7 +118,7 @@ def read_inveniordm(data: dict, **kwargs) -> Commonmeta:
         # "alternate_identifiers": presence(meta.get("alternateIdentifiers", None)),
         "sizes": None,
         "formats": None,
-        "version": py_.get(meta, "metadata.version"),
+        "version": get_path(meta, "metadata.version"),
         "license": presence(license_),
         "descriptions": descriptions,
         "geo_locations": None,
@@ -163,7 +174,7 @@ def get_file(file: dict) -> str:
             "bucket": file.get("bucket", None),
             "key": file.get("key", None),
             "checksum": file.get("checksum", None),
-            "url": py_.get(file, "links.self"),
+            "url": get_path(file, "links.self"),
             "size": file.get("size", None),
             "mimeType": "application/" + type_ if type_ else None,
         }
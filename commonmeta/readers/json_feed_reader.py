@@ -1,7 +1,9 @@
 """JSON Feed reader for commonmeta-py"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-import requests
 from pydash import py_
+import requests
 
 from ..utils import (
     compact,
@@ -13,18 +15,47 @@ from ..utils import (
     validate_url,
 )
 from ..author_utils import get_authors
-from ..base_utils import presence, sanitize, parse_attributes
+from ..base_utils import presence, sanitize, parse_attributes, get_path
 from ..date_utils import get_date_from_unix_timestamp
 from ..doi_utils import normalize_doi, validate_prefix, validate_doi, doi_from_url, is_rogue_scholar_doi
+from ..http_utils import (
+    OfflineError,
+    http_get,
+    http_head,
+    async_http_get,
+    is_offline,
+    submit_in_context,
+)
+from ..cache_utils import LRUCache
 from ..constants import Commonmeta
 
+# maximum number of references of a post resolved concurrently
+MAX_REFERENCE_WORKERS = 8
+# status codes of references that don't exist, cached as not resolving
+NOT_FOUND_STATUS_CODES = [404, 410]
+# resolved references by DOI or URL, False if the reference doesn't resolve
+_reference_cache = LRUCache(maxsize=10000, ttl=24 * 60 * 60)
+
+logger = logging.getLogger(__name__)
+
 
 def get_json_feed_item(pid: str, **kwargs) -> dict:
     """get_json_feed_item"""
     if pid is None:
         return {"state": "not_found"}
     url = normalize_url(pid)
-    response = requests.get(url, kwargs, timeout=10)
+    response = http_get(url, kwargs)
+    if response.status_code != 200:
+        return {"state": "not_found"}
+    return response.json()
+
+
+async def aget_json_feed_item(pid: str, **kwargs) -> dict:
+    """get_json_feed_item, async version"""
+    if pid is None:
+        return {"state": "not_found"}
+    url = normalize_url(pid)
+    response = await async_http_get(url, kwargs)
     if response.status_code != 200:
         return {"state": "not_found"}
     return response.json()
@@ -49,7 +80,7 @@ def read_json_feed_item(data: Optional[dict], **kwargs) -> Commonmeta:
     title = parse_attributes(meta.get("title", None))
     titles = [{"title": sanitize(title)}] if title else None
 
-    publisher = py_.get(meta, "blog.title", None)
+    publisher = get_path(meta, "blog.title", None)
     if publisher is not None:
         publisher = {"name": publisher}
 
@@ -65,16 +96,16 @@ def read_json_feed_item(data: Optional[dict], **kwargs) -> Commonmeta:
         else None
     )
 
-    license_ = py_.get(meta, "blog.license", None)
+    license_ = get_path(meta, "blog.license", None)
     if license_ is not None:
         license_ = dict_to_spdx({"url": license_})
 
     container = compact(
         {
             "type": "Periodical",
-            "title": py_.get(meta, "blog.title", None),
-            "identifier": py_.get(meta, "blog.issn", None),
-            "identifierType": "ISSN" if py_.get(meta, "blog.issn", None) else None,
+            "title": get_path(meta, "blog.title", None),
+            "identifier": get_path(meta, "blog.issn", None),
+            "identifierType": "ISSN" if get_path(meta, "blog.issn", None) else None,
         }
     )
 
@@ -85,7 +116,7 @@ def read_json_feed_item(data: Optional[dict], **kwargs) -> Commonmeta:
         ]
     else:
         descriptions = None
-    category = py_.get(meta, "blog.category", None)
+    category = get_path(meta, "blog.category", None)
     if category is not None:
         subjects = [name_to_fos(py_.human_case(category))]
     references = get_references(wrap(meta.get("reference", None)))
@@ -129,56 +160,58 @@ def read_json_feed_item(data: Optional[dict], **kwargs) -> Commonmeta:
 
 
 def get_references(references: list) -> list:
-    """get json feed references."""
+    """get json feed references.
+    References are resolved concurrently, and each distinct DOI or URL only
+    once. Resolved references are cached across posts."""
 
-    def get_reference(reference: dict) -> Optional[dict]:
+    def reference_key(reference: dict) -> Optional[str]:
+        """DOI or URL used to resolve the reference"""
         if reference is None or not isinstance(reference, dict):
             return None
-        try:
-            if reference.get("doi", None) and validate_doi(reference.get("doi")):
-                doi = normalize_doi(reference.get("doi"))
-                response = requests.get(
-                    doi,
-                    headers={"Accept": "application/vnd.citationstyles.csl+json"},
-                    timeout=10,
-                )
-                if response.status_code not in [200, 301, 302]:
-                    return None
-                csl = response.json()
-                publication_year = py_.get(csl, "issued.date-parts.0.0", None)
-                return compact(
-                    {
-                        "doi": doi,
-                        "title": csl.get("title", None),
-                        "publicationYear": str(publication_year)
-                        if publication_year
-                        else None,
-                        "url": reference.get("url", None),
-                    }
-                )
+        if reference.get("doi", None) and validate_doi(reference.get("doi")):
+            return normalize_doi(reference.get("doi"))
+        if reference.get("url", None) and validate_url(reference.get("url")) == "URL":
+            return reference.get("url")
+        return None
 
-            elif (
-                reference.get("url", None)
-                and validate_url(reference.get("url")) == "URL"
-            ):
-                response = requests.head(reference.get("url", None), timeout=10)
-                # check that URL resolves.
-                # TODO: check for redirects
-                if response.status_code in [404]:
-                    return None
-                return {
-                    "url": reference.get("url"),
-                }
-        except Exception as error:
-            print(error)
+    def format_reference(reference: dict, key: Optional[str]) -> Optional[dict]:
+        """combine resolved reference with reference metadata"""
+        resolved = resolved_references.get(key, None)
+        if not resolved:
             return None
+        if resolved.get("doi", None):
+            return compact(
+                {
+                    "doi": resolved["doi"],
+                    "title": resolved.get("title", None),
+                    "publicationYear": resolved.get("publicationYear", None),
+                    "url": reference.get("url", None),
+                }
+            )
+        return {
+            "url": reference.get("url"),
+        }
 
     def number_reference(reference: dict, index: int) -> dict:
         """number reference"""
         reference["key"] = f"ref{index +1}"
         return reference
 
-    references = [get_reference(i) for i in references]
+    keys = [reference_key(i) for i in references]
+    distinct_keys = list(dict.fromkeys(i for i in keys if i is not None))
+    resolved_references = {}
+    if distinct_keys:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_REFERENCE_WORKERS, len(distinct_keys))
+        ) as executor:
+            futures = [
+                submit_in_context(executor, resolve_reference, i)
+                for i in distinct_keys
+            ]
+            resolved_references = {
+                key: future.result() for key, future in zip(distinct_keys, futures)
+            }
+    references = [format_reference(i, key) for i, key in zip(references, keys)]
     return [
         number_reference(i, index)
         for index, i in enumerate(references)
@@ -186,6 +219,68 @@ def get_references(references: list) -> list:
     ]
 
 
+def resolve_reference(pid: str) -> Optional[dict]:
+    """Resolve a reference DOI via content negotiation, or check that a
+    reference URL resolves. Returns None if the reference doesn't resolve
+    or the request fails. Only references that don't exist are cached as
+    not resolving, failed requests are tried again for the next post."""
+    cached = _reference_cache.get(pid, None)
+    if cached is not None:
+        return cached or None
+    if is_offline():
+        # use the reference as given, without checking that it resolves
+        return {"doi": pid} if validate_doi(pid) else {"url": pid}
+    try:
+        if validate_doi(pid):
+            response = http_get(
+                pid,
+                headers={"Accept": "application/vnd.citationstyles.csl+json"},
+            )
+            if response.status_code in NOT_FOUND_STATUS_CODES:
+                _reference_cache.set(pid, False)
+                return None
+            if response.status_code not in [200, 301, 302]:
+                logger.warning(
+                    "Could not resolve reference %s: status %s",
+                    pid,
+                    response.status_code,
+                )
+                return None
+            csl = response.json()
+            publication_year = get_path(csl, "issued.date-parts.0.0", None)
+            resolved = compact(
+                {
+                    "doi": pid,
+                    "title": csl.get("title", None),
+                    "publicationYear": str(publication_year)
+                    if publication_year
+                    else None,
+                }
+            )
+        else:
+            response = http_head(pid)
+            # check that URL resolves.
+            if response.status_code in NOT_FOUND_STATUS_CODES:
+                _reference_cache.set(pid, False)
+                return None
+            resolved = {"url": pid}
+            if response.status_code == 429 or response.status_code >= 500:
+                # keep the reference, but check it again for the next post
+                logger.warning(
+                    "Could not check reference %s: status %s",
+                    pid,
+                    response.status_code,
+                )
+                return resolved
+        _reference_cache.set(pid, resolved)
+        return resolved
+    except OfflineError:
+        raise
+    except (requests.exceptions.RequestException, ValueError) as error:
+        logger.warning("Could not resolve reference %s: %s", pid, error)
+        return None
+
+
 def get_funding_references(meta: Optional[dict]) -> Optional[list]:
     """get json feed funding references.
     Check that relationships resolve and have type "HasAward" or
@@ -209,7 +304,7 @@ def get_funding_references(meta: Optional[dict]) -> Optional[list]:
         if i.get("type", None) == "HasAward"
         and validate_prefix(i.get("url", None)) == "10.3030"
     ]
-    funding = py_.get(meta, "blog.funding", None)
+    funding = get_path(meta, "blog.funding", None)
     if funding is not None:
         awards += [
             {
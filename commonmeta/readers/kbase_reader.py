@@ -6,7 +6,7 @@ from collections import defaultdict
 from pydash import py_
 
 from ..utils import normalize_url, normalize_doi, from_curie, from_kbase
-from ..base_utils import compact, wrap, presence, sanitize
+from ..base_utils import compact, wrap, presence, sanitize, get_path
 from ..author_utils import get_authors
 from ..date_utils import normalize_date_dict
 from ..doi_utils import doi_from_url, validate_doi
@@ -89,7 +89,7 @@ def read_kbase(data: dict, **kwargs) -> Commonmeta:
         "alternate_identifiers": None,
         "sizes": None,
         "formats": None,
-        "version": py_.get(meta, "metadata.version"),
+        "version": get_path(meta, "metadata.version"),
         "license": presence(license_),
         "descriptions": descriptions,
         "geo_locations": None,
@@ -101,7 +101,7 @@ def read_kbase(data: dict, **kwargs) -> Commonmeta:
         "container": container,
         "provider": "KBase",
         "state": state,
-        "schema_version": py_.get(data, "credit_metadata_schema_version"),
+        "schema_version": get_path(data, "credit_metadata_schema_version"),
     } | read_options
 
 
@@ -182,7 +182,7 @@ def get_funding_references(funding_references: list) -> list:
 
     def map_funding_reference(funding_reference: dict) -> dict:
         """map_funding_reference"""
-        funder_identifier = py_.get(funding_reference, "funder.organization_id", None)
+        funder_identifier = get_path(funding_reference, "funder.organization_id", None)
         funder_identifier_type = (
             funder_identifier.split(":")[0] if funder_identifier else None
         )
@@ -190,7 +190,7 @@ def get_funding_references(funding_references: list) -> list:
             {
                 "funderIdentifier": from_curie(funder_identifier),
                 "funderIdentifierType": funder_identifier_type,
-                "funderName": py_.get(
+                "funderName": get_path(
                     funding_reference, "funder.organization_name", None
                 ),
                 "awardNumber": funding_reference.get("grant_id", None),
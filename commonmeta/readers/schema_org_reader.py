@@ -2,7 +2,6 @@
 from typing import Optional
 import json
 from collections import defaultdict
-import requests
 from pydash import py_
 from bs4 import BeautifulSoup
 
@@ -16,10 +15,18 @@ from ..utils import (
     normalize_url,
     name_to_fos,
 )
-from ..base_utils import wrap, compact, presence, parse_attributes, sanitize
+from ..base_utils import (
+    wrap,
+    compact,
+    presence,
+    parse_attributes,
+    sanitize,
+    get_path,
+)
 from ..author_utils import get_authors
 from ..date_utils import get_iso8601_date, strip_milliseconds
 from ..doi_utils import doi_from_url, get_doi_ra
+from ..http_utils import http_get, async_http_get
 from ..constants import (
     SO_TO_CM_TRANSLATIONS,
     SO_TO_DC_RELATION_TYPES,
@@ -33,11 +40,26 @@ def get_schema_org(pid: str, **kwargs) -> dict:
     if pid is None:
         return {"state": "not_found"}
     url = pid
-    response = requests.get(url, kwargs, timeout=10)
+    response = http_get(url, kwargs)
     if response.status_code != 200:
         return {"state": "not_found"}
+    return get_schema_org_from_html(response.text)
+
+
+async def aget_schema_org(pid: str, **kwargs) -> dict:
+    """get_schema_org, async version"""
+    if pid is None:
+        return {"state": "not_found"}
+    url = pid
+    response = await async_http_get(url, kwargs)
+    if response.status_code != 200:
+        return {"state": "not_found"}
+    return get_schema_org_from_html(response.text)
+
 
-    soup = BeautifulSoup(response.text, "html.parser")
+def get_schema_org_from_html(html: str) -> dict:
+    """Get schema.org metadata embedded in a HTML page"""
+    soup = BeautifulSoup(html, "html.parser")
     # workaround for metadata not included with schema.org but in html meta tags
     data = get_html_meta(soup)
     # load schema.org metadata
@@ -133,12 +155,12 @@ def read_schema_org(data: Optional[dict], **kwargs) -> Commonmeta:
             }
         )
     elif type_ == "Article":
-        issn = py_.get(meta, "isPartOf.issn")
-        url = py_.get(meta, "publisher.url")
+        issn = get_path(meta, "isPartOf.issn")
+        url = get_path(meta, "publisher.url")
         container = compact(
             {
                 "type": "Periodical",
-                "title": py_.get(meta, "isPartOf.name"),
+                "title": get_path(meta, "isPartOf.name"),
                 "identifier": issn
                 if issn is not None
                 else url
@@ -176,9 +198,9 @@ def read_schema_org(data: Optional[dict], **kwargs) -> Commonmeta:
     if isinstance(meta.get("inLanguage"), str):
         language = meta.get("inLanguage")
     elif isinstance(meta.get("inLanguage"), list):
-        language = py_.get(meta, "inLanguage.0")
+        language = get_path(meta, "inLanguage.0")
     elif isinstance(meta.get("inLanguage"), dict):
-        language = py_.get(meta, "inLanguage.alternateName") or py_.get(
+        language = get_path(meta, "inLanguage.alternateName") or get_path(
             meta, "inLanguage.name"
         )
     else:
@@ -235,7 +257,7 @@ def schema_org_related_item(meta, relation_type=None):
 def schema_org_reverse_related_item(meta, relation_type=None):
     """Reverse related items"""
     normalize_ids(
-        ids=wrap(py_.get(meta, f"@reverse.{relation_type}")),
+        ids=wrap(get_path(meta, f"@reverse.{relation_type}")),
         relation_type=SO_TO_DC_REVERSE_RELATION_TYPES.get(relation_type),
     )
 
@@ -290,9 +312,9 @@ def schema_org_geolocation(geo_location: Optional[dict]) -> Optional[dict]:
     if not isinstance(geo_location, dict):
         return None
 
-    type_ = py_.get(geo_location, "geo.@type")
-    longitude = py_.get(geo_location, "geo.longitude")
-    latitude = py_.get(geo_location, "geo.latitude")
+    type_ = get_path(geo_location, "geo.@type")
+    longitude = get_path(geo_location, "geo.longitude")
+    latitude = get_path(geo_location, "geo.latitude")
 
     if type_ == "GeoCoordinates":
         return {
@@ -0,0 +1,74 @@
+"""Schema utils for commonmeta-py"""
+import importlib.util
+import json
+import re
+from functools import lru_cache
+from os import path
+from typing import Callable, Iterable, List, Optional
+import fastjsonschema
+from fastjsonschema import JsonSchemaException
+
+COMMONMETA_SCHEMA = path.join(
+    path.dirname(__file__), "resources", "commonmeta_v0.10.6.json"
+)
+# validator module generated ahead of time by generate_commonmeta_validator
+COMMONMETA_VALIDATOR = path.join(
+    path.dirname(__file__), "resources", "commonmeta_v0.10.6.py"
+)
+
+
+@lru_cache(maxsize=None)
+def get_commonmeta_validator() -> Callable:
+    """Return the commonmeta JSON schema validator, compiled once per process.
+    Uses the validator module generated by generate_commonmeta_validator if
+    it exists, so that the schema doesn't have to be compiled at runtime."""
+    if path.exists(COMMONMETA_VALIDATOR):
+        spec = importlib.util.spec_from_file_location(
+            "commonmeta_validator", COMMONMETA_VALIDATOR
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.validate
+    with open(COMMONMETA_SCHEMA, encoding="utf-8") as file:
+        schema = json.load(file)
+    return fastjsonschema.compile(schema)
+
+
+def generate_commonmeta_validator(file_path: str = COMMONMETA_VALIDATOR) -> str:
+    """Generate Python code for the commonmeta JSON schema validator and write
+    it to file_path. Returns file_path."""
+    with open(COMMONMETA_SCHEMA, encoding="utf-8") as file:
+        schema = json.load(file)
+    code = fastjsonschema.compile_to_code(schema)
+    # the first function generated validates the schema root
+    name = re.search(r"^def (\w+)\(", code, re.MULTILINE).group(1)
+    code += f"\n\nvalidate = {name}\n"
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(code)
+    get_commonmeta_validator.cache_clear()
+    return file_path
+
+
+def validate_commonmeta(data: dict) -> Optional[str]:
+    """Validate commonmeta dict against JSON schema. Returns the error
+    message, or None if valid"""
+    try:
+        get_commonmeta_validator()(data)
+        return None
+    except JsonSchemaException as error:
+        return error.message
+
+
+def validate_many(records: Iterable[dict]) -> List[Optional[str]]:
+    """Validate many commonmeta dicts against JSON schema, reusing the
+    compiled validator. Returns the error message or None per record"""
+    validate = get_commonmeta_validator()
+
+    def validate_one(data: dict) -> Optional[str]:
+        try:
+            validate(data)
+            return None
+        except JsonSchemaException as error:
+            return error.message
+
+    return [validate_one(i) for i in records]
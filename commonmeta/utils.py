@@ -2,9 +2,11 @@
 import os
 import json
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 from urllib.parse import urlparse
 import yaml
+from lxml import etree
 from furl import furl
 import bibtexparser
 from bs4 import BeautifulSoup
@@ -13,7 +15,15 @@ import base32_lib as base32
 import pycountry
 
 from .base_utils import wrap, compact, parse_attributes
-from .doi_utils import normalize_doi, doi_from_url, get_doi_ra, validate_doi, doi_as_url
+from .doi_utils import (
+    IDENTIFIER_CACHE_SIZE,
+    normalize_doi,
+    doi_from_url,
+    get_doi_ra,
+    aget_doi_ra,
+    validate_doi,
+    doi_as_url,
+)
 from .constants import DATACITE_CONTRIBUTOR_TYPES
 
 NORMALIZED_LICENSES = {
@@ -71,9 +81,33 @@ UNKNOWN_INFORMATION = {
     ":etal": "too numerous to list (et alia)",
 }
 
+# number of characters looked at to find the format of a string
+SNIFF_SIZE = 64 * 1024
+SNIFF_CHUNK_SIZE = 4096
+WHITESPACE_AND_BOM = " \t\n\r\ufeff"
+
 HTTP_SCHEME = "http://"
 HTTPS_SCHEME = "https://"
 
+ROR_REGEX = re.compile(r"\A(?:(?:http|https)://ror\.org/)?([0-9a-z]{7}\d{2})\Z")
+ORCID_REGEX = re.compile(
+    r"\A(?:(?:http|https)://(?:(?:www|sandbox)?\.)?orcid\.org/)?(\d{4}[ -]\d{4}[ -]\d{4}[ -]\d{3}[0-9X]+)\Z"  # noqa: E501
+)
+ISNI_REGEX = re.compile(
+    r"\A(?:(?:http|https)://isni\.org/isni/)?(\d{4}([ -])?\d{4}([ -])?\d{4}([ -])?\d{3}[0-9X]+)\Z"  # noqa: E501
+)
+ISSN_REGEX = re.compile(r"\A(ISSN|eISSN) (\d{4}-\d{3}[0-9X]+)\Z")
+GITHUB_REGEX = re.compile(
+    r"\Ahttps://(github|raw\.githubusercontent)\.com/(.+)(?:/)?(.+)?(?:/tree/)?(.*)\Z"
+)
+GITHUB_CFF_REGEX = re.compile(r"\A(http|https):/(/)?github\.com/(.+)/CITATION.cff\Z")
+GITHUB_CODEMETA_REGEX = re.compile(
+    r"\A(http|https):/(/)?github\.com/(.+)/codemeta.json\Z"
+)
+GITHUB_URL_REGEX = re.compile(r"\A(http|https):/(/)?github\.com/(.+)\Z")
+ROGUE_SCHOLAR_REGEX = re.compile(r"\Ahttps:/(/)?api\.rogue-scholar\.org/posts/(.+)\Z")
+ZENODO_REGEX = re.compile(r"\Ahttps:/(/)?zenodo\.org/api/records/(.+)\Z")
+
 
 def normalize_id(pid: Optional[str], **kwargs) -> Optional[str]:
     """Check for valid DOI or HTTP(S) URL"""
@@ -84,8 +118,13 @@ def normalize_id(pid: Optional[str], **kwargs) -> Optional[str]:
     if isinstance(pid, (bytes, bytearray)):
         pid = pid.decode()
 
+    return _normalize_id(pid, kwargs.get("sandbox", False))
+
+
+@lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
+def _normalize_id(pid: str, sandbox: bool) -> Optional[str]:
     # check for valid DOI
-    doi = normalize_doi(pid, **kwargs)
+    doi = normalize_doi(pid, sandbox=sandbox)
     if doi is not None:
         return doi
 
@@ -164,10 +203,12 @@ def validate_ror(ror: Optional[str]) -> Optional[str]:
     """Validate ROR"""
     if ror is None or not isinstance(ror, str):
         return None
-    match = re.search(
-        r"\A(?:(?:http|https)://ror\.org/)?([0-9a-z]{7}\d{2})\Z",
-        ror,
-    )
+    return _validate_ror(ror)
+
+
+@lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
+def _validate_ror(ror: str) -> Optional[str]:
+    match = ROR_REGEX.search(ror)
     if match is None:
         return None
     ror = match.group(1).replace(" ", "-")
@@ -177,15 +218,17 @@ def validate_ror(ror: Optional[str]) -> Optional[str]:
 def validate_url(url: str) -> Optional[str]:
     if url is None:
         return None
-    elif validate_doi(url):
+    return _validate_url(url)
+
+
+@lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
+def _validate_url(url: str) -> Optional[str]:
+    if validate_doi(url):
         return "DOI"
     f = furl(url)
     if f and f.scheme in ["http", "https"]:
         return "URL"
-    match = re.search(
-        r"\A(ISSN|eISSN) (\d{4}-\d{3}[0-9X]+)\Z",
-        url,
-    )
+    match = ISSN_REGEX.search(url)
     if match is not None:
         return "ISSN"
     return None
@@ -205,10 +248,12 @@ def validate_orcid(orcid: Optional[str]) -> Optional[str]:
     """Validate ORCID"""
     if orcid is None or not isinstance(orcid, str):
         return None
-    match = re.search(
-        r"\A(?:(?:http|https)://(?:(?:www|sandbox)?\.)?orcid\.org/)?(\d{4}[ -]\d{4}[ -]\d{4}[ -]\d{3}[0-9X]+)\Z",
-        orcid,
-    )
+    return _validate_orcid(orcid)
+
+
+@lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
+def _validate_orcid(orcid: str) -> Optional[str]:
+    match = ORCID_REGEX.search(orcid)
     if match is None:
         return None
     orcid = match.group(1).replace(" ", "-")
@@ -219,10 +264,12 @@ def validate_isni(isni: Optional[str]) -> Optional[str]:
     """Validate ISNI"""
     if isni is None or not isinstance(isni, str):
         return None
-    match = re.search(
-        r"\A(?:(?:http|https)://isni\.org/isni/)?(\d{4}([ -])?\d{4}([ -])?\d{4}([ -])?\d{3}[0-9X]+)\Z",
-        isni,
-    )
+    return _validate_isni(isni)
+
+
+@lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
+def _validate_isni(isni: str) -> Optional[str]:
+    match = ISNI_REGEX.search(isni)
     if match is None:
         return None
     isni = match.group(1).replace(" ", "")
@@ -307,23 +354,39 @@ def normalize_issn(string, **kwargs):
     return None
 
 
-def dict_to_spdx(dct: dict) -> dict:
-    """Convert a dict to SPDX"""
-    dct.update({"url": normalize_cc_url(dct.get("url", None))})
+@lru_cache(maxsize=None)
+def get_spdx_licenses() -> tuple:
+    """Load SPDX licenses once per process, and index them by case-folded
+    licenseId and by their first seeAlso URL. Returns the list of licenses
+    and the two indexes, which map to positions in the list."""
     file_path = os.path.join(
         os.path.dirname(__file__), "resources", "spdx", "licenses.json"
     )
     with open(file_path, encoding="utf-8") as json_file:
         spdx = json.load(json_file).get("licenses")
-    license_ = next(
-        (
-            lic
-            for lic in spdx
-            if lic["licenseId"].casefold() == dct.get("id", "").casefold()
-            or lic["seeAlso"][0] == dct.get("url", None)
-        ),
-        None,
-    )
+    by_id: dict = {}
+    by_url: dict = {}
+    for index, lic in enumerate(spdx):
+        by_id.setdefault(lic["licenseId"].casefold(), index)
+        if lic["seeAlso"]:
+            by_url.setdefault(lic["seeAlso"][0], index)
+    return spdx, by_id, by_url
+
+
+def dict_to_spdx(dct: dict) -> dict:
+    """Convert a dict to SPDX"""
+    dct.update({"url": normalize_cc_url(dct.get("url", None))})
+    spdx, by_id, by_url = get_spdx_licenses()
+    # use the first license in the list matching either id or url
+    indexes = [
+        i
+        for i in [
+            by_id.get(dct.get("id", "").casefold(), None),
+            by_url.get(dct.get("url", None), None),
+        ]
+        if i is not None
+    ]
+    license_ = spdx[min(indexes)] if indexes else None
     if license_ is None:
         return dct
     #   license = spdx.find do |l|
@@ -594,21 +657,28 @@ def find_from_format_by_id(pid: str) -> Optional[str]:
     doi = validate_doi(pid)
     if doi and (registration_agency := get_doi_ra(doi)) is not None:
         return registration_agency.lower()
-    if (
-        re.match(r"\A(http|https):/(/)?github\.com/(.+)/CITATION.cff\Z", pid)
-        is not None
-    ):
+    return find_from_format_by_url(pid)
+
+
+async def afind_from_format_by_id(pid: str) -> Optional[str]:
+    """Find reader from format by id, async version"""
+    doi = validate_doi(pid)
+    if doi and (registration_agency := await aget_doi_ra(doi)) is not None:
+        return registration_agency.lower()
+    return find_from_format_by_url(pid)
+
+
+def find_from_format_by_url(pid: str) -> Optional[str]:
+    """Find reader from format by url"""
+    if GITHUB_CFF_REGEX.match(pid) is not None:
         return "cff"
-    if (
-        re.match(r"\A(http|https):/(/)?github\.com/(.+)/codemeta.json\Z", pid)
-        is not None
-    ):
+    if GITHUB_CODEMETA_REGEX.match(pid) is not None:
         return "codemeta"
-    if re.match(r"\A(http|https):/(/)?github\.com/(.+)\Z", pid) is not None:
+    if GITHUB_URL_REGEX.match(pid) is not None:
         return "cff"
-    if re.match(r"\Ahttps:/(/)?api\.rogue-scholar\.org/posts/(.+)\Z", pid) is not None:
+    if ROGUE_SCHOLAR_REGEX.match(pid) is not None:
         return "json_feed_item"
-    if re.match(r"\Ahttps:/(/)?zenodo\.org/api/records/(.+)\Z", pid) is not None:
+    if ZENODO_REGEX.match(pid) is not None:
         return "inveniordm"
     return "schema_org"
 
@@ -624,33 +694,87 @@ def find_from_format_by_ext(ext: str) -> Optional[str]:
 
 def find_from_format_by_string(string: str) -> Optional[str]:
     """Find reader from format by string"""
+    return sniff_format(string)[0]
+
+
+def sniff_format(string: str) -> Tuple[Optional[str], Any]:
+    """Find reader from format by string, looking at the first characters
+    before parsing. Returns the format and the parsed JSON or YAML, if the
+    whole string had to be parsed to find the format, so that it doesn't
+    have to be parsed again."""
     if string is None:
-        return None
+        return None, None
+    start = string[:SNIFF_SIZE].lstrip(WHITESPACE_AND_BOM)
+    if start.startswith(("{", "[")):
+        try:
+            data = json.loads(string)
+            return find_from_format_by_json(data), data
+        except json.JSONDecodeError:
+            pass
+    if start.startswith("<"):
+        via = find_from_format_by_xml(string)
+        if via is not None:
+            return via, None
+
+    if string.startswith("TY  - "):
+        return "ris", None
+    if any(string.startswith(f"@{t}") for t in bibtexparser.bibdatabase.STANDARD_TYPES):
+        return "bibtex", None
+    if "cff-version" in string:
+        try:
+            data = yaml.safe_load(string)
+            if data.get("cff-version", None):
+                return "cff", data
+        except (yaml.YAMLError, AttributeError):
+            pass
+
+    # no format found
+    return None, None
+
+
+def find_from_format_by_json(data) -> Optional[str]:
+    """Find reader from format by parsed JSON"""
+    if data.get("schema_version", "").startswith("https://commonmeta.org"):
+        return "commonmeta"
+    if data.get("@context", None) == "http://schema.org":
+        return "schema_org"
+    if data.get("@context", None) in [
+        "https://raw.githubusercontent.com/codemeta/codemeta/master/codemeta.jsonld"
+    ]:
+        return "codemeta"
+    if py_.get(data, "blog.version", None) == "https://jsonfeed.org/version/1.1":
+        return "json_feed_item"
+    if data.get("schemaVersion", "").startswith("http://datacite.org/schema/kernel"):
+        return "datacite"
+    if data.get("source", None) == "Crossref":
+        return "crossref"
+    if py_.get(data, "issued.date-parts") is not None:
+        return "csl"
+    if py_.get(data, "conceptdoi") is not None:
+        return "inveniordm"
+    if py_.get(data, "credit_metadata") is not None:
+        return "kbase"
+    if data.get("cff-version", None):
+        return "cff"
+    return None
+
+
+def find_from_format_by_xml(string: str) -> Optional[str]:
+    """Find reader from format by XML string, parsing it incrementally until
+    a doi_record or resource element is found. Falls back to parsing the
+    whole string if neither is found in the first SNIFF_SIZE characters, or
+    if the XML is not well-formed."""
+    parser = etree.XMLPullParser(events=("start",), recover=False)
     try:
-        data = json.loads(string)
-        if data.get("schema_version", "").startswith("https://commonmeta.org"):
-            return "commonmeta"
-        if data.get("@context", None) == "http://schema.org":
-            return "schema_org"
-        if data.get("@context", None) in [
-            "https://raw.githubusercontent.com/codemeta/codemeta/master/codemeta.jsonld"
-        ]:
-            return "codemeta"
-        if py_.get(data, "blog.version", None) == "https://jsonfeed.org/version/1.1":
-            return "json_feed_item"
-        if data.get("schemaVersion", "").startswith(
-            "http://datacite.org/schema/kernel"
-        ):
-            return "datacite"
-        if data.get("source", None) == "Crossref":
-            return "crossref"
-        if py_.get(data, "issued.date-parts") is not None:
-            return "csl"
-        if py_.get(data, "conceptdoi") is not None:
-            return "inveniordm"
-        if py_.get(data, "credit_metadata") is not None:
-            return "kbase"
-    except json.JSONDecodeError:
+        for i in range(0, min(len(string), SNIFF_SIZE), SNIFF_CHUNK_SIZE):
+            parser.feed(string[i : i + SNIFF_CHUNK_SIZE].encode("utf-8"))
+            for _, element in parser.read_events():
+                tag = etree.QName(element).localname
+                if tag == "doi_record":
+                    return "crossref_xml"
+                if tag == "resource":
+                    return "datacite_xml"
+    except etree.XMLSyntaxError:
         pass
     try:
         data = BeautifulSoup(string, "xml")
@@ -660,21 +784,9 @@ def find_from_format_by_string(string: str) -> Optional[str]:
             return "datacite_xml"
     except ValueError:
         pass
-    try:
-        data = yaml.safe_load(string)
-        if data.get("cff-version", None):
-            return "cff"
-    except (yaml.YAMLError, AttributeError):
-        pass
-
-    if string.startswith("TY  - "):
-        return "ris"
-    if any(string.startswith(f"@{t}") for t in bibtexparser.bibdatabase.STANDARD_TYPES):
-        return "bibtex"
-
-    # no format found
     return None
 
+
     # if Maremma.from_xml(string).to_h.dig('crossref_result', 'query_result', 'body', 'query',
     #                                        'doi_record', 'crossref').present?
     #     'crossref_xml'
@@ -782,11 +894,12 @@ def from_schema_org_creators(elements: list) -> list:
 
 def github_from_url(url: str) -> dict:
     """Get github owner, repo, release and path from url"""
+    return dict(_github_from_url(url))
 
-    match = re.match(
-        r"\Ahttps://(github|raw\.githubusercontent)\.com/(.+)(?:/)?(.+)?(?:/tree/)?(.*)\Z",
-        url,
-    )
+
+@lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
+def _github_from_url(url: str) -> dict:
+    match = GITHUB_REGEX.match(url)
     if match is None:
         return {}
     words = urlparse(url).path.lstrip("/").split("/")
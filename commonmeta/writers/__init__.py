@@ -1,9 +1,13 @@
 """Writers for different metadata formats"""
-from .commonmeta_writer import write_commonmeta
-from .bibtex_writer import write_bibtex
+from .commonmeta_writer import write_commonmeta, write_commonmeta_many, to_commonmeta
+from .bibtex_writer import write_bibtex, write_bibtex_many
 from .citation_writer import write_citation
-from .crossref_xml_writer import write_crossref_xml
-from .csl_writer import write_csl
-from .ris_writer import write_ris
-from .schema_org_writer import write_schema_org
-from .datacite_writer import write_datacite
+from .crossref_xml_writer import (
+    write_crossref_xml,
+    write_crossref_xml_many,
+    write_crossref_xml_batches,
+)
+from .csl_writer import write_csl, write_csl_many
+from .ris_writer import write_ris, write_ris_many
+from .schema_org_writer import write_schema_org, write_schema_org_many
+from .datacite_writer import write_datacite, write_datacite_many
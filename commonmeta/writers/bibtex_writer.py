@@ -1,4 +1,5 @@
 """Bibtex writer for commonmeta-py"""
+from typing import IO, Iterable
 from bibtexparser.bwriter import BibTexWriter
 from bibtexparser.bibdatabase import BibDatabase
 from bibtexparser.customization import page_double_hyphen
@@ -8,6 +9,7 @@ from ..base_utils import compact
 from ..author_utils import authors_as_string
 from ..date_utils import get_month_from_date, get_iso8601_date, MONTH_SHORT_NAMES
 from ..doi_utils import doi_from_url
+from ..file_utils import write_records
 from ..constants import CM_TO_BIB_TRANSLATIONS, Commonmeta
 
 
@@ -119,3 +121,10 @@ def write_bibtex(metadata: Commonmeta) -> str:
     for month_name in MONTH_SHORT_NAMES:
         bibtex_str = bibtex_str.replace(f"{{{month_name}}}", month_name)
     return bibtex_str
+
+
+def write_bibtex_many(metadata_list: Iterable[Commonmeta], file: IO[str]) -> int:
+    """Write a bibtex database of many records to file, one record at a time.
+    Returns the number of records written."""
+    records = (write_bibtex(i) for i in metadata_list if i is not None)
+    return write_records(records, file, separator="\n")
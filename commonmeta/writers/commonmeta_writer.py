@@ -1,15 +1,22 @@
 """Commonmeta writer for commonmeta-py"""
 import json
+from typing import IO, Iterable
 
 from ..base_utils import compact
+from ..file_utils import write_json_lines, write_json_array
+from ..constants import Commonmeta
 
 
 def write_commonmeta(metadata):
     """Write commonmeta"""
     if metadata is None:
         return None
+    return json.dumps(to_commonmeta(metadata), indent=4)
 
-    data = compact(
+
+def to_commonmeta(metadata) -> dict:
+    """Convert metadata into commonmeta dict"""
+    return compact(
         {
             # required properties
             "id": metadata.id,
@@ -38,4 +45,14 @@ def write_commonmeta(metadata):
             "provider": metadata.provider,
         }
     )
-    return json.dumps(data, indent=4)
+
+
+def write_commonmeta_many(
+    metadata_list: Iterable[Commonmeta], file: IO[str], jsonl: bool = True
+) -> int:
+    """Write commonmeta for many records to file, one record at a time, as
+    JSON Lines or as a JSON array. Returns the number of records written."""
+    items = (to_commonmeta(i) for i in metadata_list if i is not None)
+    if jsonl:
+        return write_json_lines(items, file)
+    return write_json_array(items, file)
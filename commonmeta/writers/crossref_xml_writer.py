@@ -1,8 +1,32 @@
 """Crossref XML writer for commonmeta-py"""
-from typing import Optional
+from typing import IO, Iterable, List, Optional
 from ..constants import Commonmeta
-from ..crossref_utils import generate_crossref_xml
+from ..crossref_utils import (
+    generate_crossref_xml,
+    generate_crossref_xml_batch,
+    generate_crossref_xml_batches,
+    CROSSREF_MAX_BATCH_SIZE,
+)
 
 def write_crossref_xml(metadata: Commonmeta) -> Optional[str]:
     """Write Crossref XML"""
     return generate_crossref_xml(metadata)
+
+
+def write_crossref_xml_many(
+    metadata_list: Iterable[Optional[Commonmeta]], file: IO[bytes], **kwargs
+) -> int:
+    """Write Crossref XML for many works as one doi_batch to a binary file,
+    one work at a time. Returns the number of works written."""
+    return generate_crossref_xml_batch(metadata_list, file, **kwargs)
+
+
+def write_crossref_xml_batches(
+    metadata_list: Iterable[Optional[Commonmeta]],
+    file_path: str,
+    max_size: int = CROSSREF_MAX_BATCH_SIZE,
+    **kwargs,
+) -> List[str]:
+    """Write Crossref XML for many works to doi_batch files of at most
+    max_size bytes. Returns the file paths written."""
+    return generate_crossref_xml_batches(metadata_list, file_path, max_size, **kwargs)
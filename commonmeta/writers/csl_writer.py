@@ -1,15 +1,22 @@
 """CSL-JSON writer for commonmeta-py"""
 import json
+from typing import IO, Iterable
 
 from ..utils import pages_as_string, to_csl
 from ..base_utils import wrap, presence, parse_attributes, compact
 from ..date_utils import get_date_parts
 from ..doi_utils import doi_from_url
+from ..file_utils import write_json_lines, write_json_array
 from ..constants import CM_TO_CSL_TRANSLATIONS, Commonmeta
 
 
 def write_csl(metadata: Commonmeta) -> str:
     """Write CSL-JSON"""
+    return json.dumps(to_csl_dict(metadata), indent=4)
+
+
+def to_csl_dict(metadata: Commonmeta) -> dict:
+    """Convert metadata into CSL-JSON dict"""
     if len(wrap(metadata.contributors)) == 0:
         author = None
     else:
@@ -52,4 +59,15 @@ def write_csl(metadata: Commonmeta) -> str:
             "version": metadata.version,
         }
     )
-    return json.dumps(data, indent=4)
+    return data
+
+
+def write_csl_many(
+    metadata_list: Iterable[Commonmeta], file: IO[str], jsonl: bool = True
+) -> int:
+    """Write CSL-JSON for many records to file, one record at a time, as
+    JSON Lines or as a JSON array. Returns the number of records written."""
+    items = (to_csl_dict(i) for i in metadata_list if i is not None)
+    if jsonl:
+        return write_json_lines(items, file)
+    return write_json_array(items, file)
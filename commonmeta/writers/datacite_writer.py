@@ -1,14 +1,20 @@
 """DataCite writer for commonmeta-py"""
 import json
-from typing import Optional
+from typing import IO, Iterable, Optional
 
 from ..base_utils import wrap, compact
 from ..doi_utils import doi_from_url
+from ..file_utils import write_json_lines, write_json_array
 from ..constants import (CM_TO_BIB_TRANSLATIONS, CM_TO_CSL_TRANSLATIONS, CM_TO_CR_TRANSLATIONS, CM_TO_DC_TRANSLATIONS, CM_TO_RIS_TRANSLATIONS, CM_TO_SO_TRANSLATIONS, Commonmeta)
 
 
 def write_datacite(metadata: Commonmeta) -> Optional[str]:
     """Write datacite"""
+    return json.dumps(to_datacite_dict(metadata), indent=4)
+
+
+def to_datacite_dict(metadata: Commonmeta) -> dict:
+    """Convert metadata into datacite dict"""
     creators = [to_datacite_creator(i) for i in wrap(metadata.contributors) if i.get('contributorRoles', None) == ['Author']]
     contributors = [to_datacite_creator(i) for i in wrap(metadata.contributors) if i.get('contributorRoles', None) == ['Author']]
     related_items = [to_datacite_related_item(i) for i in wrap(metadata.references)]
@@ -67,7 +73,7 @@ def write_datacite(metadata: Commonmeta) -> Optional[str]:
             "fundingReferences": metadata.funding_references,
         }
     )
-    return json.dumps(data, indent=4)
+    return data
 
 
 def to_datacite_creator(creator: dict) -> dict:
@@ -111,3 +117,14 @@ def to_datacite_related_item(reference: dict) -> dict:
             "relationType": "References",
         }
     )
+
+
+def write_datacite_many(
+    metadata_list: Iterable[Commonmeta], file: IO[str], jsonl: bool = True
+) -> int:
+    """Write datacite for many records to file, one record at a time, as
+    JSON Lines or as a JSON array. Returns the number of records written."""
+    items = (to_datacite_dict(i) for i in metadata_list if i is not None)
+    if jsonl:
+        return write_json_lines(items, file)
+    return write_json_array(items, file)
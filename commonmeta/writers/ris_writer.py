@@ -1,7 +1,9 @@
 """RIS writer for commonmeta-py"""
+from typing import IO, Iterable
 from ..utils import to_ris
 from ..base_utils import compact, wrap, presence, parse_attributes
 from ..doi_utils import doi_from_url
+from ..file_utils import write_records
 from ..constants import CM_TO_RIS_TRANSLATIONS
 
 
@@ -46,3 +48,10 @@ def write_ris(metadata):
         else:
             string.append(f"{key}  - {val}")
     return "\r\n".join(string)
+
+
+def write_ris_many(metadata_list: Iterable, file: IO[str]) -> int:
+    """Write a RIS file of many records to file, one record at a time.
+    Returns the number of records written."""
+    records = (write_ris(i) + "\r\n" for i in metadata_list if i is not None)
+    return write_records(records, file, separator="")
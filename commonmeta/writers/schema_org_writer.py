@@ -1,12 +1,19 @@
 """Schema.org writer for commonmeta-py"""
 import json
+from typing import IO, Iterable
 from ..utils import to_schema_org, to_schema_org_creators, github_as_repo_url
 from ..base_utils import compact, wrap, presence, parse_attributes
-from ..constants import CM_TO_SO_TRANSLATIONS
+from ..file_utils import write_json_lines, write_json_array
+from ..constants import CM_TO_SO_TRANSLATIONS, Commonmeta
 
 
 def write_schema_org(metadata):
     """Write schema.org"""
+    return json.dumps(to_schema_org_dict(metadata), indent=4)
+
+
+def to_schema_org_dict(metadata) -> dict:
+    """Convert metadata into schema.org dict"""
     container = metadata.container
     if metadata.type == "Dataset" and metadata.files is not None:
         media_objects = [
@@ -139,4 +146,15 @@ def write_schema_org(metadata):
             else None,
         }
     )
-    return json.dumps(data, indent=4)
+    return data
+
+
+def write_schema_org_many(
+    metadata_list: Iterable[Commonmeta], file: IO[str], jsonl: bool = True
+) -> int:
+    """Write schema.org for many records to file, one record at a time, as
+    JSON Lines or as a JSON array. Returns the number of records written."""
+    items = (to_schema_org_dict(i) for i in metadata_list if i is not None)
+    if jsonl:
+        return write_json_lines(items, file)
+    return write_json_array(items, file)
@@ -27,7 +27,8 @@ setup(
     url="https://github.com/front-matter/commonmeta-py",
     license="MIT",
     packages=find_packages(exclude=["test*"]),
-    install_requires=["requests>=2.7.0", "tqdm"],
+    install_requires=["requests>=2.7.0", "httpx", "tqdm", "click"],
+    entry_points={"console_scripts": ["commonmeta=commonmeta.cli:cli"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Science/Research",
@@ -7,6 +7,7 @@ from commonmeta.author_utils import (
     get_authors,
     get_affiliations,
     is_personal_name,
+    split_name,
 )
 from commonmeta.base_utils import wrap
 
@@ -322,3 +323,17 @@ def test_is_personal_name():
     assert False is is_personal_name(
         "International Genetics of Ankylosing Spondylitis Consortium (IGAS)"
     )
+
+
+def test_split_name():
+    """split name, parsed once per name"""
+    split_name.cache_clear()
+    assert ("Martin", "Fenner") == split_name("Fenner, Martin")
+    assert ("John K.", "Smith") == split_name("John K. Smith")
+    assert (None, None) == split_name("Dr.")
+    author = get_one_author({"name": "Fenner, Martin"})
+    assert "Person" == author["type"]
+    assert "Martin" == author["givenName"]
+    info = split_name.cache_info()
+    assert info.misses == 3
+    assert info.hits == 2
@@ -3,6 +3,7 @@
 import pytest  # noqa: F401
 from os import path
 import pydash as py_
+from lxml import etree
 
 from commonmeta.base_utils import (
     parse_attributes,
@@ -12,6 +13,8 @@ from commonmeta.base_utils import (
     unwrap,
     sanitize,
     parse_xml,
+    etree_to_dict,
+    get_path,
 )
 
 
@@ -53,6 +56,20 @@ def test_compact():
     assert None is compact(None)
 
 
+def test_get_path():
+    "get_path, same as py_.get"
+    data = {"issued": {"date-time": "2014-02-11"}, "title": ["Test"], "id": None}
+    assert "2014-02-11" == get_path(data, "issued.date-time")
+    assert "Test" == get_path(data, "title.0")
+    assert "Test" == get_path(data, "title.-1")
+    assert "T" == get_path(data, "title.0.0")
+    assert None is get_path(data, "title.name")
+    assert None is get_path(data, "id", "default")
+    assert "default" == get_path(data, "issued.missing", "default")
+    for key in ["issued", "title.1", "title.0.x", "id.x", "issued.date-time.-1"]:
+        assert get_path(data, key, {}) == py_.get(data, key, {})
+
+
 def test_parse_attributes():
     "parse_attributes"
     # string
@@ -101,6 +118,13 @@ def test_parse_xml():
     assert py_.get(data, "crossref_result.xmlns") == "http://www.crossref.org/qrschema/3.0"
     
     
+def test_etree_to_dict():
+    "convert lxml element, same as parse_xml"
+    for file_name in ["crossref.xml", "datacite.xml", "datacite-xml-lang.xml"]:
+        string = path.join(path.dirname(__file__), "fixtures", file_name)
+        assert etree_to_dict(etree.parse(string).getroot()) == parse_xml(string)
+
+
 def test_parse_xml_crossref():
     "parse Crossref XML"
     string = path.join(path.dirname(__file__), "fixtures", "crossref.xml")
@@ -1,7 +1,9 @@
 """Bibtex writer tests"""
+import io
 from os import path
 import pytest
 from commonmeta import Metadata
+from commonmeta.writers import write_bibtex_many
 
 
 @pytest.mark.vcr
@@ -437,3 +439,13 @@ def test_kbase_gulf_of_mexico():
 """
     )
 
+
+def test_write_bibtex_many():
+    "write many records as one bibtex database"
+    fixtures = path.join(path.dirname(__file__), "fixtures")
+    metadata_list = [
+        Metadata(path.join(fixtures, i)) for i in ["datacite.json", "codemeta.json"]
+    ]
+    file = io.StringIO()
+    assert write_bibtex_many(metadata_list, file) == 2
+    assert file.getvalue() == "\n".join(i.bibtex() for i in metadata_list)
@@ -0,0 +1,78 @@
+# pylint: disable=invalid-name
+"""Test cache_utils module for commonmeta-py"""
+import json
+import time
+
+from commonmeta.cache_utils import LRUCache
+
+
+def test_lru_cache():
+    "get and set"
+    cache = LRUCache(maxsize=2)
+    cache.set("10.7554", "Crossref")
+    cache.set("10.5061", "DataCite")
+    assert cache.get("10.7554") == "Crossref"
+    assert "10.5061" in cache
+    assert cache.get("10.1234") is None
+    assert cache.get("10.1234", "unknown") == "unknown"
+    assert len(cache) == 2
+
+
+def test_lru_cache_stats():
+    "hits and misses are counted"
+    cache = LRUCache()
+    cache.set("4374", {"name": "eLife Sciences Publications, Ltd"})
+    cache.get("4374")
+    cache.get("4374")
+    cache.get("301")
+    assert "301" not in cache
+    assert cache.stats() == {"hits": 2, "misses": 1, "size": 1}
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 0}
+
+
+def test_lru_cache_eviction():
+    "least recently used entry is evicted"
+    cache = LRUCache(maxsize=2)
+    cache.set("10.7554", "Crossref")
+    cache.set("10.5061", "DataCite")
+    cache.get("10.7554")
+    cache.set("10.1392", "mEDRA")
+    assert cache.get("10.5061") is None
+    assert cache.get("10.7554") == "Crossref"
+    assert cache.get("10.1392") == "mEDRA"
+
+
+def test_lru_cache_ttl(monkeypatch):
+    "entries expire after ttl"
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache = LRUCache(ttl=60)
+    cache.set("10.7554", "Crossref")
+    monkeypatch.setattr(time, "time", lambda: now + 30)
+    assert cache.get("10.7554") == "Crossref"
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get("10.7554") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_persistent(tmp_path):
+    "entries are persisted to sqlite database"
+    path = str(tmp_path / "cache.db")
+    cache = LRUCache(path=path)
+    cache.update({"10.7554": "Crossref", "10.5061": "DataCite"})
+    cache = LRUCache(path=path)
+    assert len(cache) == 0
+    assert cache.get("10.7554") == "Crossref"
+    assert len(cache) == 1
+    cache.clear()
+    assert LRUCache(path=path).get("10.5061") is None
+
+
+def test_lru_cache_load(tmp_path):
+    "pre-seed cache from JSON file"
+    path = tmp_path / "ra.json"
+    path.write_text(json.dumps({"10.7554": "Crossref", "10.5061": "DataCite"}))
+    cache = LRUCache()
+    cache.load(str(path))
+    assert cache.get("10.5061") == "DataCite"
@@ -0,0 +1,105 @@
+# pylint: disable=invalid-name
+"""Test command line interface for commonmeta-py"""
+from os import path
+import gzip
+import json
+import pytest
+from click.testing import CliRunner
+
+from commonmeta.cli import cli
+
+FIXTURES = path.join(path.dirname(__file__), "fixtures")
+
+
+@pytest.mark.block_network
+def test_convert_files():
+    "convert files to commonmeta JSON Lines"
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "convert",
+            path.join(FIXTURES, "datacite.json"),
+            path.join(FIXTURES, "crossref.json"),
+            "--workers",
+            "1",
+            "--offline",
+            "--no-progress",
+        ],
+    )
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["id"] == "https://doi.org/10.5438/4k3m-nyvg"
+    assert json.loads(lines[1])["id"] == "https://doi.org/10.7554/elife.01567"
+    assert "Converted 2 records (0 errors)" in result.stderr
+
+
+@pytest.mark.block_network
+def test_convert_gzipped_file(tmp_path):
+    "convert gzipped single-record files"
+    input_paths = []
+    for filename in ["datacite.json", "crossref.xml"]:
+        input_path = tmp_path / (filename + ".gz")
+        with open(path.join(FIXTURES, filename), "rb") as file:
+            input_path.write_bytes(gzip.compress(file.read()))
+        input_paths.append(str(input_path))
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["convert", *input_paths, "--workers", "1", "--offline", "--no-progress"]
+    )
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["id"] == "https://doi.org/10.5438/4k3m-nyvg"
+    assert json.loads(lines[1])["id"] == "https://doi.org/10.7554/elife.01567"
+    assert "Converted 2 records (0 errors)" in result.stderr
+
+
+@pytest.mark.block_network
+def test_convert_jsonl(tmp_path):
+    "convert JSON Lines payloads to BibTeX in worker processes"
+    payloads = []
+    for filename in ["datacite.json", "crossref.json"]:
+        with open(path.join(FIXTURES, filename), encoding="utf-8") as file:
+            payloads.append(json.dumps(json.load(file)))
+    input_path = tmp_path / "payloads.jsonl"
+    input_path.write_text("\n".join(payloads + ["not metadata"]) + "\n")
+    output_path = tmp_path / "output.bib"
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "convert",
+            str(input_path),
+            "--to",
+            "bibtex",
+            "--output",
+            str(output_path),
+            "--workers",
+            "2",
+            "--offline",
+            "--no-progress",
+        ],
+    )
+    assert result.exit_code == 0
+    output = output_path.read_text()
+    assert output.startswith("@article{10.5438/4k3m-nyvg")
+    assert output.count("@article{") == 2
+    assert "Error converting not metadata" in result.stderr
+    assert "Converted 2 records (1 errors)" in result.stderr
+
+
+@pytest.mark.block_network
+def test_convert_stdin():
+    "convert payload from stdin, as JSON Lines of strings for non-JSON formats"
+    with open(path.join(FIXTURES, "datacite.json"), encoding="utf-8") as file:
+        payload = json.dumps(json.load(file))
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["convert", "--to", "ris", "--jsonl", "-w", "1", "--offline"],
+        input=payload + "\n",
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.stdout).startswith("TY  - JOUR")
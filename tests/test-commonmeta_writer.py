@@ -1,9 +1,12 @@
 # pylint: disable=invalid-name
 """Commonmeta writer tests"""
+import io
 import json
+from os import path
 import pytest
 
 from commonmeta import Metadata
+from commonmeta.writers import write_commonmeta_many
 
 
 @pytest.mark.vcr
@@ -62,3 +65,31 @@ def test_journal_article_crossref_xml():
     }
     assert commonmeta["license"] == {'id': 'CC-BY-3.0', 'url': 'https://creativecommons.org/licenses/by/3.0/legalcode'}
     assert commonmeta["provider"] == "Crossref"
+
+
+def test_write_commonmeta_many():
+    "write many records as JSON Lines and as JSON array"
+    fixtures = path.join(path.dirname(__file__), "fixtures")
+    metadata_list = [
+        Metadata(path.join(fixtures, "datacite.json")),
+        None,
+        Metadata(path.join(fixtures, "codemeta.json")),
+    ]
+    file = io.StringIO()
+    assert write_commonmeta_many(metadata_list, file) == 2
+    lines = file.getvalue().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0]) == json.loads(metadata_list[0].commonmeta())
+    assert json.loads(lines[1])["id"] == "https://doi.org/10.5063/f1m61h5x"
+
+    file = io.StringIO()
+    assert write_commonmeta_many(metadata_list, file, jsonl=False) == 2
+    data = json.loads(file.getvalue())
+    assert [i["id"] for i in data] == [
+        "https://doi.org/10.5438/4k3m-nyvg",
+        "https://doi.org/10.5063/f1m61h5x",
+    ]
+
+    file = io.StringIO()
+    assert write_commonmeta_many(iter([]), file, jsonl=False) == 0
+    assert json.loads(file.getvalue()) == []
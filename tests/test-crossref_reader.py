@@ -1,14 +1,30 @@
 # pylint: disable=invalid-name,too-many-lines
 """Crossref reader tests"""
 from os import path
+from urllib.parse import parse_qs, urlparse
+import gzip
 import json
 import pytest
+import requests
+from requests.adapters import BaseAdapter
 
 from commonmeta import Metadata
+from commonmeta.cache_utils import LRUCache
+from commonmeta.http_utils import set_session
+from commonmeta.doi_utils import (
+    get_member_cache,
+    set_member_cache,
+    get_ra_cache,
+    set_ra_cache,
+)
 from commonmeta.readers.crossref_reader import (
     get_crossref,
     read_crossref,
     get_reference,
+    get_crossref_works,
+    read_crossref_works,
+    read_crossref_file,
+    read_crossref_files,
 )
 
 
@@ -1344,3 +1360,163 @@ def test_get_reference():
         "containerTitle": "IBM Technical Disclosure Bulletin",
     } == get_reference(unstructured_metadata)
     assert None is get_reference(None)
+
+
+class CrossrefWorksAdapter(BaseAdapter):
+    """Adapter standing in for the Crossref works API, serving recorded
+    pages keyed by cursor"""
+
+    def __init__(self, pages: dict):
+        super().__init__()
+        self.pages = pages
+        self.requests: list = []
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        "serve the page for the requested cursor"
+        query = parse_qs(urlparse(request.url).query)
+        self.requests.append(query)
+        page = self.pages.get(query["cursor"][0], None)
+        body = json.dumps({"status": "ok", "message": page}).encode("utf-8")
+        response = requests.Response()
+        response.status_code = 200 if page is not None else 400
+        response._content = body
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def empty_caches():
+    "use empty registration agency and member caches"
+    ra_cache, member_cache = get_ra_cache(), get_member_cache()
+    set_ra_cache(LRUCache())
+    set_member_cache(LRUCache())
+    yield
+    set_ra_cache(ra_cache)
+    set_member_cache(member_cache)
+
+
+@pytest.fixture
+def crossref_works_api(empty_caches):  # pylint: disable=unused-argument
+    "route requests to the Crossref works API stand-in with pages of two works"
+    file_path = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    with open(file_path, encoding="utf-8") as file:
+        work = json.load(file)
+    works = [work | {"DOI": f"10.7554/elife.{i:05d}"} for i in range(5)]
+    adapter = CrossrefWorksAdapter(
+        {
+            "*": {"next-cursor": "page2", "items": works[0:2]},
+            "page2": {"next-cursor": "page3", "items": works[2:4]},
+            "page3": {"next-cursor": "page4", "items": works[4:5]},
+        }
+    )
+    get_member_cache().set(
+        "4374",
+        {
+            "id": "https://api.crossref.org/members/4374",
+            "name": "eLife Sciences Publications, Ltd",
+        },
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    set_session(session)
+    yield adapter
+    set_session(None)
+
+
+@pytest.mark.block_network
+def test_get_crossref_works(crossref_works_api):
+    "walk all pages with deep paging cursors"
+    works = get_crossref_works(member="4374", from_update_date="2022-01-01", rows=2)
+    assert [i["DOI"] for i in works] == [
+        "10.7554/elife.00000",
+        "10.7554/elife.00001",
+        "10.7554/elife.00002",
+        "10.7554/elife.00003",
+        "10.7554/elife.00004",
+    ]
+    queries = crossref_works_api.requests
+    assert [i["cursor"][0] for i in queries] == ["*", "page2", "page3"]
+    assert queries[0]["filter"] == ["member:4374,from-update-date:2022-01-01"]
+    assert queries[0]["rows"] == ["2"]
+
+
+@pytest.mark.block_network
+def test_read_crossref_works(crossref_works_api):
+    "convert harvested works one at a time without further network requests"
+    works = read_crossref_works(prefix="10.7554", rows=2)
+    subject = next(works)
+    assert subject["id"] == "https://doi.org/10.7554/elife.00000"
+    assert subject["type"] == "JournalArticle"
+    assert subject["publisher"] == {
+        "id": "https://api.crossref.org/members/4374",
+        "name": "eLife Sciences Publications, Ltd",
+    }
+    assert subject["provider"] == "Crossref"
+    assert len(crossref_works_api.requests) == 1
+    assert len(list(works)) == 4
+    assert crossref_works_api.requests[0]["filter"] == ["prefix:10.7554"]
+
+
+@pytest.fixture
+def crossref_data_files(tmp_path, empty_caches):  # pylint: disable=unused-argument
+    "Crossref public data file shards, as JSON with items array and JSON Lines"
+    file_path = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    with open(file_path, encoding="utf-8") as file:
+        work = json.load(file)
+    works = [
+        work | {"DOI": f"10.7554/elife.{i:05d}", "member": "99999", "publisher": "P"}
+        for i in range(6)
+    ]
+    shards = [str(tmp_path / "0.json.gz"), str(tmp_path / "1.jsonl.gz")]
+    with gzip.open(shards[0], "wt", encoding="utf-8") as file:
+        json.dump({"items": works[0:3]}, file)
+    with gzip.open(shards[1], "wt", encoding="utf-8") as file:
+        for i in works[3:6]:
+            file.write(json.dumps({"status": "ok", "message": i}) + "\n")
+    return shards
+
+
+@pytest.mark.block_network
+def test_read_crossref_file(crossref_data_files):
+    "read shards without network requests"
+    subjects = list(read_crossref_file(crossref_data_files[0]))
+    subjects += list(read_crossref_file(crossref_data_files[1]))
+    assert [i["id"] for i in subjects] == [
+        f"https://doi.org/10.7554/elife.{i:05d}" for i in range(6)
+    ]
+    assert subjects[0]["type"] == "JournalArticle"
+    assert subjects[0]["publisher"] == {
+        "id": "https://api.crossref.org/members/99999",
+        "name": "P",
+    }
+    assert subjects[0]["provider"] == "Crossref"
+    # the publisher in the works isn't cached as the member's name
+    assert "99999" not in get_member_cache()
+
+
+@pytest.mark.block_network
+def test_read_crossref_files(crossref_data_files):
+    "read shards in a process pool, in the order of the shards"
+    subjects = list(read_crossref_files(crossref_data_files, max_workers=2))
+    assert [i["id"] for i in subjects] == [
+        f"https://doi.org/10.7554/elife.{i:05d}" for i in range(6)
+    ]
+    assert subjects[5]["provider"] == "Crossref"
+
+
+@pytest.mark.block_network
+def test_read_crossref_offline(empty_caches):  # pylint: disable=unused-argument
+    "read Crossref payload without network requests"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    subject = Metadata(string, offline=True)
+    assert subject.id == "https://doi.org/10.7554/elife.01567"
+    assert subject.publisher == {
+        "id": "https://api.crossref.org/members/4374",
+        "name": "eLife Sciences Publications, Ltd",
+    }
+    assert subject.provider is None
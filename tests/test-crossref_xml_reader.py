@@ -1,8 +1,20 @@
 # pylint: disable=invalid-name,too-many-lines
 """Crossref XML reader tests"""
 from os import path
+import gzip
 import pytest
+from lxml import etree
+from pydash import py_
 from commonmeta import Metadata
+from commonmeta.base_utils import parse_xml
+from commonmeta.http_utils import offline
+from commonmeta.readers import (
+    get_crossref_xml_file,
+    read_crossref_xml,
+    read_crossref_xml_file,
+)
+from commonmeta.readers.crossref_xml_reader import crossref_xml_get
+from commonmeta.writers import write_crossref_xml_many
 
 
 @pytest.mark.vcr
@@ -1217,3 +1229,106 @@ def test_proceedings_article():
     assert subject.descriptions is None
     assert subject.version is None
     assert subject.provider == "Crossref"
+
+
+def crossref_xml_queries(count):
+    """Crossref XML query result with count copies of the fixture query"""
+    with open(
+        path.join(path.dirname(__file__), "fixtures", "crossref.xml"), encoding="utf-8"
+    ) as file:
+        xml = file.read()
+    start = xml.index("<query ")
+    end = xml.index("</query>") + len("</query>")
+    return xml[:start] + xml[start:end] * count + xml[end:]
+
+
+def test_get_crossref_xml_file():
+    "stream single query result, same as parsing the whole file"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.xml")
+    records = list(get_crossref_xml_file(string))
+    assert len(records) == 1
+    with offline():
+        assert read_crossref_xml(records[0]) == read_crossref_xml(
+            parse_xml(string, dialect="crossref")
+        )
+
+
+def test_read_crossref_xml_file_many_queries(tmp_path):
+    "stream gzipped query result with many records"
+    file_path = tmp_path / "crossref.xml.gz"
+    with gzip.open(file_path, "wt", encoding="utf-8") as file:
+        file.write(crossref_xml_queries(3))
+    with offline():
+        subjects = list(read_crossref_xml_file(str(file_path)))
+    assert len(subjects) == 3
+    assert [i["id"] for i in subjects] == ["https://doi.org/10.7554/elife.01567"] * 3
+    assert subjects[0]["publisher"] == {
+        "id": "https://api.crossref.org/members/4374",
+        "name": "eLife Sciences Publications, Ltd",
+    }
+    assert len(subjects[2]["references"]) == 27
+
+
+def test_read_crossref_xml_file_doi_batch(tmp_path):
+    "stream works in a doi_batch deposit"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.xml")
+    subject = Metadata(string, via="crossref_xml", offline=True)
+    file_path = tmp_path / "deposit.xml"
+    with open(file_path, "wb") as file:
+        write_crossref_xml_many([subject, subject], file)
+    with offline():
+        subjects = list(read_crossref_xml_file(str(file_path)))
+    assert len(subjects) == 2
+    assert subjects[1]["id"] == "https://doi.org/10.7554/elife.01567"
+    assert subjects[1]["type"] == "JournalArticle"
+    assert subjects[1]["titles"] == subject.titles
+
+
+def test_read_crossref_xml_lxml():
+    "read lxml element, same as reading the parsed dict"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.xml")
+    with offline():
+        assert read_crossref_xml(etree.parse(string)) == read_crossref_xml(
+            parse_xml(string, dialect="crossref")
+        )
+
+
+def test_crossref_xml_get():
+    "same values as py_.get on the parsed dict"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.xml")
+    data = parse_xml(string, dialect="crossref")["crossref_result"]
+    root = etree.parse(string).getroot()
+    prefix = "query_result.body.query.doi_record.crossref.journal.journal_article"
+    for key in [
+        "version",
+        "query_result.body.query.crm-item",
+        "query_result.body.query.crm-item.0.#text",
+        "query_result.body.query.crm-item.-1.name",
+        f"{prefix}.titles",
+        f"{prefix}.titles.0.title",
+        f"{prefix}.titles.title",
+        f"{prefix}.contributors.0.person_name.1",
+        f"{prefix}.publication_date",
+        f"{prefix}.doi_data.doi.0",
+        f"{prefix}.citation_list.citation.3",
+        f"{prefix}.missing",
+    ]:
+        assert crossref_xml_get(root, key, "default") == py_.get(data, key, "default")
+
+
+def test_read_crossref_xml_file_lxml(tmp_path):
+    "stream query result and doi_batch deposit with lxml engine"
+    file_path = tmp_path / "crossref.xml"
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(crossref_xml_queries(3))
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.xml")
+    subject = Metadata(string, via="crossref_xml", offline=True)
+    deposit_path = tmp_path / "deposit.xml"
+    with open(deposit_path, "wb") as file:
+        write_crossref_xml_many([subject, subject], file)
+    with offline():
+        for xml_path in [file_path, deposit_path]:
+            subjects = list(read_crossref_xml_file(str(xml_path), engine="lxml"))
+            assert subjects == list(read_crossref_xml_file(str(xml_path)))
+    assert len(subjects) == 2
+    assert subjects[1]["id"] == "https://doi.org/10.7554/elife.01567"
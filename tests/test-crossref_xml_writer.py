@@ -1,10 +1,12 @@
 """Test crossref_xml_writer module for commonmeta-py"""
+import io
 import pytest
 from os import path
 import pydash as py_
 
 from commonmeta import Metadata
 from commonmeta.base_utils import parse_xml, wrap
+from commonmeta.writers import write_crossref_xml_many, write_crossref_xml_batches
 
 
 def test_write_crossref_xml_header():
@@ -497,3 +499,60 @@ def test_json_feed_item_with_anonymous_author():
         "surname": "Göbel",
     }
     assert crossref_xml.get("group_title") == "Computer and information sciences"
+
+
+def test_write_crossref_xml_many():
+    """Write many works as one doi_batch"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.xml")
+    subject = Metadata(string, via="crossref_xml", offline=True)
+    file = io.BytesIO()
+    assert (
+        write_crossref_xml_many([subject, None, subject], file, depositor="Front Matter")
+        == 2
+    )
+    crossref_xml = parse_xml(file.getvalue(), dialect="crossref")
+    assert py_.get(crossref_xml, "doi_batch.head.depositor.depositor_name") == (
+        "Front Matter"
+    )
+    assert py_.get(crossref_xml, "doi_batch.head.registrant") == "test"
+    journals = wrap(py_.get(crossref_xml, "doi_batch.body.journal"))
+    assert len(journals) == 2
+    assert [py_.get(i, "journal_article.doi_data.doi") for i in journals] == [
+        "10.7554/elife.01567",
+        "10.7554/elife.01567",
+    ]
+
+
+def test_write_crossref_xml_batches(tmp_path):
+    """Write many works split into doi_batch files by size"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.xml")
+    subject = Metadata(string, via="crossref_xml", offline=True)
+    size = len(subject.crossref_xml())
+    file_paths = write_crossref_xml_batches(
+        (subject for _ in range(5)), str(tmp_path / "deposit.xml"), max_size=2 * size
+    )
+    assert [path.basename(i) for i in file_paths] == [
+        "deposit-1.xml",
+        "deposit-2.xml",
+        "deposit-3.xml",
+    ]
+    counts = []
+    batch_ids = set()
+    for file_path in file_paths:
+        assert path.getsize(file_path) <= 2 * size
+        with open(file_path, "rb") as file:
+            crossref_xml = parse_xml(file.read(), dialect="crossref")
+        counts.append(len(wrap(py_.get(crossref_xml, "doi_batch.body.journal"))))
+        batch_ids.add(py_.get(crossref_xml, "doi_batch.head.doi_batch_id"))
+    assert counts == [2, 2, 1]
+    assert len(batch_ids) == 3
+
+
+def test_write_crossref_xml_batches_oversized_work(tmp_path):
+    """A work larger than max_size gets a file of its own"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.xml")
+    subject = Metadata(string, via="crossref_xml", offline=True)
+    file_paths = write_crossref_xml_batches(
+        [subject, subject], str(tmp_path / "deposit"), max_size=1000
+    )
+    assert [path.basename(i) for i in file_paths] == ["deposit-1.xml", "deposit-2.xml"]
@@ -1,9 +1,12 @@
 # pylint: disable=invalid-name
 """Citeproc writer tests"""
+import io
 import json
+from os import path
 import pytest
 
 from commonmeta import Metadata
+from commonmeta.writers import write_csl_many
 
 
 @pytest.mark.vcr
@@ -358,3 +361,16 @@ def test_organization_author():
 #       expect(json['type']).to eq('article')
 #       expect(json['DOI']).to eq('10.34747/g6yb-3412')
 #       expect(json['issued']).to eq('date-parts' => [[2019]])
+
+
+def test_write_csl_many():
+    "write many records as CSL-JSON array"
+    fixtures = path.join(path.dirname(__file__), "fixtures")
+    metadata_list = (
+        Metadata(path.join(fixtures, i)) for i in ["datacite.json", "codemeta.json"]
+    )
+    file = io.StringIO()
+    assert write_csl_many(metadata_list, file, jsonl=False) == 2
+    data = json.loads(file.getvalue())
+    assert [i["DOI"] for i in data] == ["10.5438/4k3m-nyvg", "10.5063/f1m61h5x"]
+    assert data[0]["type"] == "article"
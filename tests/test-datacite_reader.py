@@ -1,9 +1,22 @@
 # pylint: disable=invalid-name,too-many-lines
 """DataCite reader tests"""
 from os import path
+from urllib.parse import parse_qs, urlparse
+import json
+import threading
 import pytest
+import requests
+from requests.adapters import BaseAdapter
 from commonmeta import Metadata
-from commonmeta.readers.datacite_reader import get_datacite, read_datacite
+from commonmeta.http_utils import set_session
+from commonmeta.readers.datacite_reader import (
+    DATACITE_DOIS_URL,
+    get_datacite,
+    read_datacite,
+    get_datacite_dois,
+    read_datacite_dois,
+    translate_types,
+)
 
 
 @pytest.mark.vcr
@@ -2056,3 +2069,124 @@ def test_read_datacite():
     data = get_datacite("10.6084/m9.figshare.1449060")
     meta = read_datacite(data)
     assert meta.get("doi", None) == "10.6084/m9.figshare.1449060"
+
+
+def test_read_datacite_types_once():
+    "type and additional type are translated once per record"
+    data = {
+        "doi": "10.5438/0000",
+        "types": {"resourceTypeGeneral": "Text", "resourceType": "ProjectReport"},
+    }
+    translate_types.cache_clear()
+    meta = read_datacite(data)
+    assert meta["type"] == "Document"
+    assert meta["additional_type"] == "ProjectReport"
+    assert translate_types.cache_info().misses == 1
+
+
+class DataciteDoisAdapter(BaseAdapter):
+    """Adapter standing in for the DataCite dois API, serving recorded
+    pages keyed by cursor"""
+
+    def __init__(self, pages: dict):
+        super().__init__()
+        self.pages = pages
+        self.requests: list = []
+        self.page_requested = {str(i): threading.Event() for i in range(4)}
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        "serve the page for the requested cursor, with a link to the next page"
+        query = parse_qs(urlparse(request.url).query)
+        self.requests.append(query)
+        cursor = query["page[cursor]"][0]
+        data = self.pages.get(cursor, [])
+        next_cursor = str(int(cursor) + 1)
+        links = {}
+        if next_cursor in self.pages:
+            links["next"] = (
+                f"{DATACITE_DOIS_URL}?page%5Bcursor%5D={next_cursor}&page%5Bsize%5D=2"
+            )
+        body = json.dumps({"data": data, "links": links}).encode("utf-8")
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        self.page_requested.setdefault(cursor, threading.Event()).set()
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def datacite_dois_api():
+    "route requests to the DataCite dois API stand-in with pages of two DOIs"
+    file_path = path.join(path.dirname(__file__), "fixtures", "datacite.json")
+    with open(file_path, encoding="utf-8") as file:
+        attributes = json.load(file)
+    dois = [
+        {
+            "id": f"10.5438/{i:04d}",
+            "type": "dois",
+            "attributes": attributes | {"doi": f"10.5438/{i:04d}"},
+        }
+        for i in range(5)
+    ]
+    adapter = DataciteDoisAdapter({"1": dois[0:2], "2": dois[2:4], "3": dois[4:5]})
+    session = requests.Session()
+    session.mount("https://", adapter)
+    set_session(session)
+    yield adapter
+    set_session(None)
+
+
+@pytest.mark.block_network
+def test_get_datacite_dois(datacite_dois_api):
+    "walk all pages with cursor pagination"
+    dois = get_datacite_dois(
+        client_id="datacite.datacite",
+        query="climate",
+        page_size=2,
+    )
+    assert [i["doi"] for i in dois] == [
+        "10.5438/0000",
+        "10.5438/0001",
+        "10.5438/0002",
+        "10.5438/0003",
+        "10.5438/0004",
+    ]
+    queries = datacite_dois_api.requests
+    assert [i["page[cursor]"][0] for i in queries] == ["1", "2", "3"]
+    assert queries[0]["client-id"] == ["datacite.datacite"]
+    assert queries[0]["query"] == ["climate"]
+    assert queries[0]["page[size]"] == ["2"]
+
+
+@pytest.mark.block_network
+def test_get_datacite_dois_prefetch(datacite_dois_api):
+    "the next page is requested while the current page is consumed"
+    dois = get_datacite_dois(provider_id="datacite", page_size=2)
+    assert next(dois)["doi"] == "10.5438/0000"
+    assert datacite_dois_api.page_requested["2"].wait(timeout=5)
+    dois.close()
+
+
+@pytest.mark.block_network
+def test_get_datacite_dois_without_prefetch(datacite_dois_api):
+    "pages are only requested when needed"
+    dois = get_datacite_dois(page_size=2, prefetch=False)
+    assert next(dois)["doi"] == "10.5438/0000"
+    assert not datacite_dois_api.page_requested["2"].wait(timeout=0.1)
+    assert len(list(dois)) == 4
+
+
+@pytest.mark.block_network
+def test_read_datacite_dois(datacite_dois_api):  # pylint: disable=unused-argument
+    "convert harvested DOIs one at a time"
+    subjects = list(read_datacite_dois(page_size=2))
+    assert len(subjects) == 5
+    assert subjects[0]["id"] == "https://doi.org/10.5438/0000"
+    assert subjects[0]["type"] == "Article"
+    assert subjects[0]["publisher"] == {"name": "DataCite"}
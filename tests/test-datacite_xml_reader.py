@@ -1,10 +1,18 @@
 # pylint: disable=invalid-name
 """Test datacite_xml reader"""
 from os import path
+import gzip
 
 import pytest
 
 from commonmeta import Metadata
+from commonmeta.base_utils import parse_xml
+from commonmeta.readers import (
+    get_datacite_oai_file,
+    get_datacite_oai_files,
+    read_datacite_oai_files,
+    read_datacite_xml,
+)
 
 
 def test_missing_resource_type_general():
@@ -120,3 +128,75 @@ def test_blog_posting():
     assert subject.descriptions[0]["descriptionType"] == "Abstract"
     assert subject.provider == "DataCite"
     assert subject.schema_version == "http://datacite.org/schema/kernel-4"
+
+
+def oai_response(file_names, token=None, resumption_token=None):
+    """OAI-PMH ListRecords response with the resources in file_names"""
+    records = []
+    for file_name in file_names:
+        if file_name is None:
+            records.append(
+                '<record><header status="deleted"><identifier>doi:10.5438/deleted'
+                "</identifier></header></record>"
+            )
+            continue
+        with open(
+            path.join(path.dirname(__file__), "fixtures", file_name), encoding="utf-8"
+        ) as file:
+            resource = file.read().split("?>", 1)[1]
+        records.append(
+            "<record><header><identifier>doi</identifier></header><metadata>"
+            '<oai_datacite xmlns="http://schema.datacite.org/oai/oai-1.1/">'
+            f"<payload>{resource}</payload></oai_datacite></metadata></record>"
+        )
+    request = f' resumptionToken="{token}"' if token else ""
+    resumption = (
+        f"<resumptionToken>{resumption_token}</resumptionToken>"
+        if resumption_token
+        else "<resumptionToken/>"
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+        f'<request verb="ListRecords"{request}>https://oai.datacite.org/oai</request>'
+        f"<ListRecords>{''.join(records)}{resumption}</ListRecords></OAI-PMH>"
+    )
+
+
+def test_get_datacite_oai_file(tmp_path):
+    "resources in OAI-PMH response are the same as in DataCite XML files"
+    file_names = ["datacite.xml", "datacite-example-dissertation-v4.4.xml"]
+    file_path = tmp_path / "response.xml.gz"
+    with gzip.open(file_path, "wt", encoding="utf-8") as file:
+        file.write(oai_response(file_names, resumption_token="abc"))
+    records = get_datacite_oai_file(str(file_path))
+    for file_name in file_names:
+        data = next(records)
+        expected = parse_xml(path.join(path.dirname(__file__), "fixtures", file_name))
+        assert data == expected
+        assert read_datacite_xml(data) == read_datacite_xml(expected)
+    with pytest.raises(StopIteration) as excinfo:
+        next(records)
+    assert excinfo.value.value == "abc"
+
+
+def test_read_datacite_oai_files(tmp_path):
+    "follow resumption tokens through a local set of OAI-PMH responses"
+    responses = {
+        "3.xml": oai_response(["datacite.xml"], token="second"),
+        "1.xml": oai_response(["datacite_dataset.xml", None], resumption_token="first"),
+        "2.xml": oai_response(
+            ["datacite-example-dissertation-v4.4.xml"], token="first", resumption_token="second"
+        ),
+    }
+    for file_name, response in responses.items():
+        (tmp_path / file_name).write_text(response, encoding="utf-8")
+    file_paths = [str(tmp_path / i) for i in responses]
+    subjects = list(read_datacite_oai_files(file_paths))
+    assert [i["id"] for i in subjects] == [
+        "https://doi.org/10.5061/dryad.8515",
+        "https://doi.org/10.5072/100044",
+        "https://doi.org/10.5438/4k3m-nyvg",
+    ]
+    with pytest.raises(ValueError, match="resumption token second"):
+        list(get_datacite_oai_files(file_paths[1:]))
@@ -1,5 +1,9 @@
 """Test doi_utils module for commonmeta-py"""
+import gzip
+import json
 import pytest
+from commonmeta.cache_utils import LRUCache
+from commonmeta.http_utils import offline
 from commonmeta.doi_utils import (
     doi_as_url,
     doi_from_url,
@@ -7,6 +11,12 @@ from commonmeta.doi_utils import (
     normalize_doi,
     validate_prefix,
     get_doi_ra,
+    get_ra_cache,
+    set_ra_cache,
+    get_crossref_member,
+    get_member_cache,
+    set_member_cache,
+    load_crossref_members,
     doi_resolver,
     crossref_api_url,
     datacite_api_url,
@@ -61,6 +71,18 @@ def test_normalize_doi():
     )
 
 
+def test_normalize_doi_memoized():
+    "normalize_doi is memoized per DOI and sandbox option"
+    doi = "https://doi.org/10.5438/MCNV-GA6N"
+    validate_doi.cache_clear()
+    assert normalize_doi(doi) == "https://doi.org/10.5438/mcnv-ga6n"
+    assert normalize_doi(doi) == "https://doi.org/10.5438/mcnv-ga6n"
+    assert normalize_doi(doi, sandbox=True) == (
+        "https://handle.stage.datacite.org/10.5438/mcnv-ga6n"
+    )
+    assert validate_doi.cache_info().misses == 1
+
+
 def test_validate_prefix():
     "validate_prefix"
     assert "10.1371" == validate_prefix("10.1371/journal.pone.0042793")
@@ -83,6 +105,66 @@ def test_get_doi_ra():
     assert None is get_doi_ra("https://doi.org/10.99999/dryad.8515x")
 
 
+def test_get_doi_ra_from_cache():
+    "get_doi_ra from pre-seeded cache, without network request"
+    cache = get_ra_cache()
+    set_ra_cache(LRUCache())
+    try:
+        get_ra_cache().update({"10.1371": "Crossref", "10.5061": "DataCite"})
+        assert "Crossref" == get_doi_ra("10.1371/journal.pone.0042793")
+        assert "DataCite" == get_doi_ra("https://doi.org/10.5061/dryad.8515")
+        assert None is get_doi_ra("https://doi.org/10.a/dryad.8515x")
+    finally:
+        set_ra_cache(cache)
+
+
+def test_get_crossref_member_from_cache(tmp_path):
+    "get_crossref_member from members dump file, without network request"
+    cache = get_member_cache()
+    set_member_cache(LRUCache())
+    try:
+        path = str(tmp_path / "members.json.gz")
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "status": "ok",
+                    "message-type": "member-list",
+                    "message": {
+                        "items": [
+                            {"id": 4374, "primary-name": "eLife Sciences Publications, Ltd"},
+                            {"id": 340, "primary-name": "Public Library of Science (PLoS)"},
+                        ]
+                    },
+                },
+                file,
+            )
+        assert 2 == load_crossref_members(path)
+        assert {
+            "id": "https://api.crossref.org/members/4374",
+            "name": "eLife Sciences Publications, Ltd",
+        } == get_crossref_member("4374")
+        assert "Public Library of Science (PLoS)" == get_crossref_member("340")["name"]
+        assert {"hits": 2, "misses": 0, "size": 2} == get_member_cache().stats()
+    finally:
+        set_member_cache(cache)
+
+
+def test_load_crossref_members_json_lines(tmp_path):
+    "load members dump in JSON Lines format"
+    cache = get_member_cache()
+    set_member_cache(LRUCache())
+    try:
+        path = tmp_path / "members.jsonl"
+        path.write_text(
+            '{"id": 4374, "primary-name": "eLife Sciences Publications, Ltd"}\n'
+            '{"id": 340, "primary-name": "Public Library of Science (PLoS)"}\n'
+        )
+        assert 2 == load_crossref_members(str(path))
+        assert "eLife Sciences Publications, Ltd" == get_crossref_member("4374")["name"]
+    finally:
+        set_member_cache(cache)
+
+
 def test_doi_resolver():
     "doi_resolver"
     assert "https://doi.org/" == doi_resolver("10.5061/DRYAD.8515")
@@ -170,3 +252,24 @@ def test_is_rogue_scholar():
     """Check if doi is from Rogue Scholar"""
     assert True is is_rogue_scholar_doi("10.53731/cjx855h-hn5jtq8")
     assert False is is_rogue_scholar_doi("10.1371/journal.pone.0000030")
+
+
+@pytest.mark.block_network
+def test_offline_lookups():
+    "only cached registration agencies and members are used in offline mode"
+    ra_cache, member_cache = get_ra_cache(), get_member_cache()
+    set_ra_cache(LRUCache())
+    set_member_cache(LRUCache())
+    try:
+        get_ra_cache().set("10.5438", "DataCite")
+        get_member_cache().set("78", {"id": "https://api.crossref.org/members/78"})
+        with offline():
+            assert get_doi_ra("10.5438/mcnv-ga6n") == "DataCite"
+            assert get_doi_ra("10.7554/elife.01567") is None
+            assert get_crossref_member("78") == {
+                "id": "https://api.crossref.org/members/78"
+            }
+            assert get_crossref_member("4374") is None
+    finally:
+        set_ra_cache(ra_cache)
+        set_member_cache(member_cache)
@@ -0,0 +1,70 @@
+"""Test file_utils module for commonmeta-py"""
+import gzip
+import io
+import json
+import pytest
+
+from commonmeta.file_utils import open_file, iter_json_items, iter_json_lines
+
+
+def test_iter_json_items():
+    "decode items of an items array in small chunks"
+    items = [
+        {"DOI": f"10.7554/elife.{i:05d}", "title": ["A [title], {x}"]}
+        for i in range(20)
+    ]
+    file = io.StringIO(json.dumps({"status": "ok", "items": items}, indent=2))
+    assert list(iter_json_items(file, chunk_size=7)) == items
+
+
+def test_iter_json_items_top_level_array():
+    "decode items of a top-level array"
+    items = [{"DOI": "10.7554/elife.01567"}, {"DOI": "10.5438/4k3m-nyvg"}]
+    file = io.StringIO(json.dumps(items))
+    assert list(iter_json_items(file, chunk_size=3)) == items
+
+
+def test_iter_json_items_nested_key():
+    "key in nested objects and other values is skipped"
+    text = '{"facets":{"items":2},"other":[{"x":1}],"items":[{"a":1}]}'
+    for chunk_size in [1, 5, 1024]:
+        file = io.StringIO(text)
+        assert list(iter_json_items(file, chunk_size=chunk_size)) == [{"a": 1}]
+    text = '{"total": 12345, "note": "\\"items\\": [1]", "items": [7]}'
+    file = io.StringIO(text)
+    assert list(iter_json_items(file, chunk_size=2)) == [7]
+
+
+def test_iter_json_items_empty():
+    "empty array and file"
+    assert list(iter_json_items(io.StringIO('{"items": []}'))) == []
+    assert list(iter_json_items(io.StringIO(""))) == []
+
+
+def test_iter_json_items_truncated():
+    "truncated file"
+    with pytest.raises(ValueError):
+        file = io.StringIO('{"items": [{"DOI": "10.7554/')
+        list(iter_json_items(file, chunk_size=4))
+
+
+def test_iter_json_lines():
+    "decode JSON Lines, skipping empty lines"
+    file = io.StringIO(
+        '{"DOI": "10.7554/elife.01567"}\n\n{"DOI": "10.5438/4k3m-nyvg"}\n'
+    )
+    assert list(iter_json_lines(file)) == [
+        {"DOI": "10.7554/elife.01567"},
+        {"DOI": "10.5438/4k3m-nyvg"},
+    ]
+
+
+def test_open_file(tmp_path):
+    "open plain and gzipped files"
+    with gzip.open(tmp_path / "works.jsonl.gz", "wt", encoding="utf-8") as file:
+        file.write('{"DOI": "10.7554/elife.01567"}\n')
+    (tmp_path / "works.jsonl").write_text('{"DOI": "10.5438/4k3m-nyvg"}\n')
+    with open_file(str(tmp_path / "works.jsonl.gz")) as file:
+        assert file.read() == '{"DOI": "10.7554/elife.01567"}\n'
+    with open_file(str(tmp_path / "works.jsonl")) as file:
+        assert file.read() == '{"DOI": "10.5438/4k3m-nyvg"}\n'
@@ -0,0 +1,183 @@
+# pylint: disable=invalid-name
+"""Test http_utils module for commonmeta-py"""
+import asyncio
+import json
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+
+import pytest
+from commonmeta.http_utils import (
+    OfflineError,
+    is_offline,
+    offline,
+    set_offline,
+    create_session,
+    get_session,
+    set_session,
+    http_get,
+    set_async_client,
+    async_http_get,
+)
+from commonmeta.readers.crossref_reader import get_crossref
+from commonmeta.readers.datacite_reader import aget_datacite
+
+
+class StubAdapter(BaseAdapter):
+    """Adapter returning a canned JSON response and recording requests"""
+
+    def __init__(self, body, status_code=200):
+        super().__init__()
+        self.body = body
+        self.status_code = status_code
+        self.requests = []
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        self.requests.append((request, kwargs))
+        response = requests.Response()
+        response.status_code = self.status_code
+        response._content = json.dumps(self.body).encode("utf-8")
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def stub_session(adapter):
+    """session routing all requests to adapter"""
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def test_get_session():
+    "shared session is created once and reused"
+    set_session(None)
+    session = get_session()
+    assert isinstance(session, requests.Session)
+    assert get_session() is session
+    adapter = session.get_adapter("https://api.crossref.org")
+    assert adapter.max_retries.total == 3
+    assert 429 in adapter.max_retries.status_forcelist
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_create_session():
+    "session with custom pool size and retries"
+    session = create_session(pool_size=50, retries=5, backoff_factor=1)
+    adapter = session.get_adapter("https://api.datacite.org")
+    assert adapter._pool_maxsize == 50
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.backoff_factor == 1
+
+
+def test_http_get_with_injected_session():
+    "requests are routed through the injected session"
+    adapter = StubAdapter({"message": {"DOI": "10.7554/elife.01567"}})
+    set_session(stub_session(adapter), timeout=5)
+    try:
+        response = http_get("https://api.crossref.org/works", {"rows": 1})
+        assert response.json() == {"message": {"DOI": "10.7554/elife.01567"}}
+        request, kwargs = adapter.requests[0]
+        assert request.url == "https://api.crossref.org/works?rows=1"
+        assert kwargs["timeout"] == 5
+    finally:
+        set_session(None)
+
+
+def test_reader_uses_shared_session():
+    "get_crossref uses the shared session"
+    adapter = StubAdapter({"message": {"DOI": "10.7554/elife.01567"}})
+    set_session(stub_session(adapter))
+    try:
+        assert get_crossref("10.7554/elife.01567") == {"DOI": "10.7554/elife.01567"}
+        request, kwargs = adapter.requests[0]
+        assert request.url == "https://api.crossref.org/works/10.7554/elife.01567"
+        assert kwargs["timeout"] == 10
+    finally:
+        set_session(None)
+
+
+def test_async_http_get_retries(monkeypatch):
+    "async requests are retried on 429 and 5xx"
+    statuses = [429, 503, 200]
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        return httpx.Response(statuses.pop(0), json={"status": "ok"})
+
+    async def no_sleep(_delay):
+        pass
+
+    async def get():
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        try:
+            return await async_http_get("https://api.crossref.org/works", {"rows": 1})
+        finally:
+            set_async_client(None)
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    response = asyncio.run(get())
+    assert response.status_code == 200
+    assert requested == ["https://api.crossref.org/works?rows=1"] * 3
+
+
+def test_async_reader():
+    "aget_datacite keeps query parameters of the API url"
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        return httpx.Response(
+            200, json={"data": {"attributes": {"doi": "10.5438/4k3m-nyvg"}}}
+        )
+
+    async def get():
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        try:
+            return await aget_datacite("10.5438/4k3m-nyvg")
+        finally:
+            set_async_client(None)
+
+    assert asyncio.run(get()) == {"doi": "10.5438/4k3m-nyvg"}
+    assert requested == [
+        "https://api.datacite.org/dois/10.5438/4k3m-nyvg?include=media,client"
+    ]
+
+
+def test_offline():
+    "offline mode per context and process-wide"
+    assert is_offline() is False
+    with offline():
+        assert is_offline() is True
+        with offline(False):
+            assert is_offline() is False
+        with offline(None):
+            assert is_offline() is True
+        with pytest.raises(OfflineError):
+            http_get("https://api.crossref.org/works")
+    assert is_offline() is False
+    set_offline()
+    try:
+        assert is_offline() is True
+        with offline(False):
+            assert is_offline() is False
+    finally:
+        set_offline(False)
+    assert is_offline() is False
+
+
+def test_offline_async():
+    "async requests raise in offline mode"
+
+    async def get():
+        with offline():
+            return await async_http_get("https://api.crossref.org/works")
+
+    with pytest.raises(OfflineError):
+        asyncio.run(get())
@@ -1,12 +1,18 @@
 # pylint: disable=invalid-name,too-many-lines
 """JSON Feed reader tests"""
 from os import path
+import json
+import logging
 import pytest
+import requests
+from requests.adapters import BaseAdapter
 
 from commonmeta import Metadata
+from commonmeta.http_utils import set_session, offline
 from commonmeta.readers.json_feed_reader import (
     get_json_feed_item,
     read_json_feed_item,
+    get_references,
 )
 
 
@@ -283,3 +289,138 @@ def test_blog_post_without_doi():
         "contributorRoles": ["Author"],
         "name": "Leiden Madtrics",
     }
+
+
+class ReferenceAdapter(BaseAdapter):
+    """Adapter answering reference lookups and recording requested urls"""
+
+    def __init__(self):
+        super().__init__()
+        self.requested = []
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        self.requested.append(request.url)
+        if "timeout" in request.url:
+            raise requests.exceptions.ConnectTimeout("timed out", request=request)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if "missing" in request.url:
+            response.status_code = 404
+        elif "invalid" in request.url:
+            response.status_code = 200
+            response._content = b"<html></html>"
+        elif "ratelimited" in request.url:
+            response.status_code = 429
+        elif request.method == "HEAD":
+            response.status_code = 200
+        else:
+            response.status_code = 200
+            response._content = json.dumps(
+                {"title": "Title " + request.url[-4:], "issued": {"date-parts": [[2014]]}}
+            ).encode("utf-8")
+        return response
+
+    def close(self):
+        pass
+
+
+def test_get_references():
+    "references are resolved once per DOI or URL and keep their numbering"
+    adapter = ReferenceAdapter()
+    session = requests.Session()
+    session.mount("https://", adapter)
+    set_session(session)
+    try:
+        references = [
+            {"doi": "10.5555/ref-0001"},
+            {"url": "https://example.org/missing"},
+            {"doi": "https://doi.org/10.5555/REF-0001", "url": "https://example.org/a"},
+            {"url": "https://example.org/paper"},
+            {"key": "no identifier"},
+            {"doi": "10.5555/ref-0002"},
+        ]
+        assert get_references(references) == [
+            {
+                "doi": "https://doi.org/10.5555/ref-0001",
+                "title": "Title 0001",
+                "publicationYear": "2014",
+                "key": "ref1",
+            },
+            {
+                "doi": "https://doi.org/10.5555/ref-0001",
+                "title": "Title 0001",
+                "publicationYear": "2014",
+                "url": "https://example.org/a",
+                "key": "ref3",
+            },
+            {"url": "https://example.org/paper", "key": "ref4"},
+            {
+                "doi": "https://doi.org/10.5555/ref-0002",
+                "title": "Title 0002",
+                "publicationYear": "2014",
+                "key": "ref6",
+            },
+        ]
+        assert sorted(adapter.requested) == [
+            "https://doi.org/10.5555/ref-0001",
+            "https://doi.org/10.5555/ref-0002",
+            "https://example.org/missing",
+            "https://example.org/paper",
+        ]
+        # resolved references are cached across posts
+        get_references([{"doi": "10.5555/ref-0002"}])
+        assert len(adapter.requested) == 4
+    finally:
+        set_session(None)
+
+
+def test_get_references_failed(caplog):
+    "failed lookups are logged and not cached, missing references are cached"
+    adapter = ReferenceAdapter()
+    session = requests.Session()
+    session.mount("https://", adapter)
+    set_session(session)
+    try:
+        references = [
+            {"doi": "10.5555/ref-invalid"},
+            {"doi": "10.5555/ref-ratelimited"},
+            {"url": "https://example.org/timeout"},
+            {"url": "https://example.org/ratelimited"},
+            {"doi": "10.5555/ref-missing"},
+        ]
+        with caplog.at_level(logging.WARNING):
+            assert get_references(references) == [
+                {"url": "https://example.org/ratelimited", "key": "ref4"}
+            ]
+        assert sorted(i.args[0] for i in caplog.records) == [
+            "https://doi.org/10.5555/ref-invalid",
+            "https://doi.org/10.5555/ref-ratelimited",
+            "https://example.org/ratelimited",
+            "https://example.org/timeout",
+        ]
+        # failed requests are made again, missing references are cached
+        get_references(references)
+        assert len(adapter.requested) == 9
+        assert adapter.requested.count("https://doi.org/10.5555/ref-missing") == 1
+    finally:
+        set_session(None)
+
+
+@pytest.mark.block_network
+def test_get_references_offline():
+    "references are not resolved in offline mode, cached references are used"
+    references = [
+        {"doi": "10.5555/ref-0002"},
+        {"doi": "10.5555/ref-offline", "url": "https://example.org/b"},
+        {"url": "https://example.org/offline"},
+    ]
+    with offline():
+        assert get_references(references)[1:] == [
+            {
+                "doi": "https://doi.org/10.5555/ref-offline",
+                "url": "https://example.org/b",
+                "key": "ref2",
+            },
+            {"url": "https://example.org/offline", "key": "ref3"},
+        ]
@@ -0,0 +1,301 @@
+# pylint: disable=invalid-name
+"""Metadata tests"""
+from os import path
+import asyncio
+import json
+import threading
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+
+from commonmeta import Metadata, CompactMetadata
+from commonmeta.http_utils import (
+    OfflineError,
+    offline,
+    set_async_client,
+    set_session,
+)
+
+
+class StubAdapter(BaseAdapter):
+    """Adapter returning a canned JSON response, and recording requests and
+    the threads they were made in"""
+
+    def __init__(self, body):
+        super().__init__()
+        self.body = body
+        self.requests = []
+        self.threads = []
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        self.requests.append(request)
+        self.threads.append(threading.get_ident())
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(self.body).encode("utf-8")
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def test_from_many():
+    "convert many files in input order"
+    strings = [
+        path.join(path.dirname(__file__), "fixtures", "datacite.json"),
+        path.join(path.dirname(__file__), "fixtures", "codemeta.json"),
+        path.join(path.dirname(__file__), "fixtures", "commonmeta.json"),
+    ]
+    subjects = list(Metadata.from_many(strings, max_workers=2))
+    assert len(subjects) == 3
+    assert [i.id for i in subjects] == [
+        "https://doi.org/10.5438/4k3m-nyvg",
+        "https://doi.org/10.5063/f1m61h5x",
+        "https://doi.org/10.7554/elife.01567",
+    ]
+    assert [i.type for i in subjects] == ["Article", "Software", "JournalArticle"]
+
+
+def test_from_many_unordered():
+    "convert many files in completion order"
+    strings = [
+        path.join(path.dirname(__file__), "fixtures", "datacite.json"),
+        path.join(path.dirname(__file__), "fixtures", "codemeta.json"),
+    ] * 10
+    subjects = list(Metadata.from_many(strings, max_workers=4, ordered=False))
+    assert len(subjects) == 20
+    assert sorted({i.id for i in subjects}) == [
+        "https://doi.org/10.5063/f1m61h5x",
+        "https://doi.org/10.5438/4k3m-nyvg",
+    ]
+
+
+def test_from_many_with_errors():
+    "errors are returned per item"
+    strings = [
+        path.join(path.dirname(__file__), "fixtures", "datacite.json"),
+        None,
+        "not a pid or metadata",
+    ]
+    subjects = list(Metadata.from_many(strings))
+    assert subjects[0].id == "https://doi.org/10.5438/4k3m-nyvg"
+    assert isinstance(subjects[1], ValueError)
+    assert str(subjects[1]) == "No input found"
+    assert isinstance(subjects[2], ValueError)
+    assert str(subjects[2]) == "No input format found"
+
+
+def test_from_many_offline():
+    "offline mode set for the caller applies to the worker threads"
+    with offline():
+        subjects = list(Metadata.from_many(["10.7554/elife.01567"]))
+    assert isinstance(subjects[0], OfflineError)
+
+
+def test_aload():
+    "async constructor with non-blocking HTTP client"
+    responses = {
+        "/ra/10.7554": [{"DOI": "10.7554", "RA": "Crossref"}],
+        "/works/10.7554/elife.01567": {
+            "message": {
+                "DOI": "10.7554/elife.01567",
+                "type": "journal-article",
+                "title": [
+                    "Automated quantitative histology reveals vascular morphodynamics during Arabidopsis hypocotyl secondary growth"
+                ],
+                "member": "4374",
+                "resource": {"primary": {"URL": "https://elifesciences.org/articles/01567"}},
+                "issued": {"date-parts": [[2014, 2, 11]]},
+            }
+        },
+        "/members/4374": {
+            "message": {"id": 4374, "primary-name": "eLife Sciences Publications, Ltd"}
+        },
+    }
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        return httpx.Response(200, json=responses[request.url.path])
+
+    async def aload():
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        try:
+            return await Metadata.aload("10.7554/elife.01567")
+        finally:
+            set_async_client(None)
+
+    subject = asyncio.run(aload())
+    assert subject.id == "https://doi.org/10.7554/elife.01567"
+    assert subject.type == "JournalArticle"
+    assert subject.url == "https://elifesciences.org/articles/01567"
+    assert subject.publisher == {
+        "id": "https://api.crossref.org/members/4374",
+        "name": "eLife Sciences Publications, Ltd",
+    }
+    assert subject.provider == "Crossref"
+    assert subject.date == {"published": "2014-02-11"}
+    assert "/works/10.7554/elife.01567" in requested
+
+
+def test_aload_reads_in_thread():
+    "requests made by readers don't run on the event loop thread"
+    responses = {
+        "/ra/10.7554": [{"DOI": "10.7554", "RA": "Crossref"}],
+        "/works/10.7554/elife.01568": {
+            "message": {
+                "DOI": "10.7554/elife.01568",
+                "type": "journal-article",
+                "title": ["Title"],
+                "member": "98765",
+                "issued": {"date-parts": [[2014, 2, 11]]},
+            }
+        },
+    }
+
+    def handler(request):
+        if request.url.path not in responses:
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json=responses[request.url.path])
+
+    adapter = StubAdapter({"message": {"id": 98765, "primary-name": "Publisher"}})
+    session = requests.Session()
+    session.mount("https://", adapter)
+
+    async def aload():
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        try:
+            return await Metadata.aload("10.7554/elife.01568"), threading.get_ident()
+        finally:
+            set_async_client(None)
+
+    set_session(session)
+    try:
+        subject, loop_thread = asyncio.run(aload())
+    finally:
+        set_session(None)
+    # the async member lookup failed, the reader looked it up again
+    assert subject.publisher["name"] == "Publisher"
+    assert [i.url for i in adapter.requests] == [
+        "https://api.crossref.org/members/98765"
+    ]
+    assert loop_thread not in adapter.threads
+
+
+def test_aload_string():
+    "async constructor with metadata string"
+    string = path.join(path.dirname(__file__), "fixtures", "datacite.json")
+    subject = asyncio.run(Metadata.aload(string))
+    assert subject.id == "https://doi.org/10.5438/4k3m-nyvg"
+
+
+def test_aload_string_in_thread(monkeypatch):
+    "async constructor reads metadata strings outside the event loop"
+    threads = []
+    read_metadata = Metadata.read_metadata
+
+    def record_thread(data, via, /, **kwargs):
+        threads.append(threading.get_ident())
+        return read_metadata(data, via, **kwargs)
+
+    monkeypatch.setattr(Metadata, "read_metadata", staticmethod(record_thread))
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    subject = asyncio.run(Metadata.aload(string, offline=True))
+    assert subject.id == "https://doi.org/10.7554/elife.01567"
+    assert threads and threading.get_ident() not in threads
+
+
+def test_is_valid():
+    "validate against commonmeta JSON schema"
+    string = path.join(path.dirname(__file__), "fixtures", "codemeta.json")
+    subject = Metadata(string)
+    assert subject.is_valid() is True
+    assert subject.validation_error() is None
+
+
+def test_is_not_valid():
+    "report first JSON schema error"
+    string = path.join(path.dirname(__file__), "fixtures", "datacite.json")
+    subject = Metadata(string)
+    assert subject.is_valid() is False
+    assert subject.validation_error() == "data must contain ['url'] properties"
+
+
+def test_validate_many():
+    "validate many records with the same compiled validator"
+    valid = Metadata(path.join(path.dirname(__file__), "fixtures", "codemeta.json"))
+    invalid = Metadata(path.join(path.dirname(__file__), "fixtures", "datacite.json"))
+    assert Metadata.validate_many([valid, invalid, valid]) == [
+        None,
+        "data must contain ['url'] properties",
+        None,
+    ]
+
+
+def test_lazy():
+    "read properties on first access"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    subject = Metadata(string, lazy=True, offline=True)
+    assert "contributors" not in vars(subject)
+    assert subject.id == "https://doi.org/10.7554/elife.01567"
+    assert subject.titles == [
+        {
+            "title": "Automated quantitative histology reveals vascular morphodynamics during Arabidopsis hypocotyl secondary growth"
+        }
+    ]
+    assert "contributors" not in vars(subject)
+    assert len(subject.contributors) == 5
+    assert subject.contributors is subject.contributors
+    assert subject.commonmeta() == Metadata(string, offline=True).commonmeta()
+
+
+def test_lazy_with_via():
+    "lazy mode with explicit input format"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    subject = Metadata(string, via="crossref", lazy=True, offline=True)
+    assert "id" not in vars(subject)
+    assert subject.id == "https://doi.org/10.7554/elife.01567"
+    subject = asyncio.run(
+        Metadata.aload(string, via="crossref", lazy=True, offline=True)
+    )
+    assert subject.id == "https://doi.org/10.7554/elife.01567"
+
+
+def test_lazy_without_field_readers():
+    "formats without field readers are read in full on first access"
+    string = path.join(path.dirname(__file__), "fixtures", "codemeta.json")
+    subject = Metadata(string, lazy=True)
+    assert "id" not in vars(subject)
+    assert subject.id == "https://doi.org/10.5063/f1m61h5x"
+    assert "contributors" in vars(subject)
+    assert subject.commonmeta() == Metadata(string).commonmeta()
+
+
+def test_compact_metadata():
+    "slotted copy of Metadata with interned keys"
+    string = path.join(path.dirname(__file__), "fixtures", "datacite.json")
+    subject = Metadata(string)
+    compact = CompactMetadata.from_metadata(subject)
+    assert not hasattr(compact, "__dict__")
+    assert compact.id == "https://doi.org/10.5438/4k3m-nyvg"
+    assert compact.commonmeta() == subject.commonmeta()
+    assert compact.bibtex() == subject.bibtex()
+    assert compact.validation_error() == subject.validation_error()
+    # keys of subjects are taken from the parsed JSON of each record
+    other = Metadata(string)
+    assert next(iter(subject.subjects[0])) is not next(iter(other.subjects[0]))
+    other = CompactMetadata.from_metadata(other)
+    assert next(iter(compact.subjects[0])) is next(iter(other.subjects[0]))
+    # strings in lists of values are interned as well
+    string = path.join(path.dirname(__file__), "fixtures", "commonmeta.json")
+    subject, other = Metadata(string), Metadata(string)
+    roles = subject.contributors[0]["contributorRoles"]
+    assert roles[0] is not other.contributors[0]["contributorRoles"][0]
+    compact = CompactMetadata.from_metadata(subject)
+    other = CompactMetadata.from_metadata(other)
+    assert compact.contributors[0]["contributorRoles"] == roles
+    role = compact.contributors[0]["contributorRoles"][0]
+    assert role is other.contributors[0]["contributorRoles"][0]
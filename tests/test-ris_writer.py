@@ -1,8 +1,11 @@
 # pylint: disable=invalid-name
 """RIS writer tests"""
+import io
+from os import path
 import pytest
 
 from commonmeta import Metadata
+from commonmeta.writers import write_ris_many
 
 
 @pytest.mark.vcr
@@ -222,3 +225,18 @@ def test_with_pages():
 #     end
 #   end
 # end
+
+
+def test_write_ris_many():
+    "write many records as one RIS file"
+    fixtures = path.join(path.dirname(__file__), "fixtures")
+    metadata_list = (
+        Metadata(path.join(fixtures, i)) for i in ["datacite.json", "codemeta.json"]
+    )
+    file = io.StringIO(newline="")
+    assert write_ris_many(metadata_list, file) == 2
+    records = file.getvalue().split("ER  - \r\n")
+    assert len(records) == 3
+    assert records[0].startswith("TY  - JOUR\r\n")
+    assert "DO  - 10.5063/f1m61h5x" in records[1]
+    assert records[2] == ""
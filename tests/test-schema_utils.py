@@ -0,0 +1,65 @@
+# pylint: disable=invalid-name
+"""Test schema_utils module for commonmeta-py"""
+from commonmeta.schema_utils import (
+    get_commonmeta_validator,
+    generate_commonmeta_validator,
+    validate_commonmeta,
+    validate_many,
+)
+import commonmeta.schema_utils as schema_utils
+
+VALID = {
+    "id": "https://doi.org/10.5438/4k3m-nyvg",
+    "type": "Article",
+    "url": "https://blog.datacite.org/eating-your-own-dog-food",
+    "contributors": [
+        {
+            "type": "Person",
+            "contributorRoles": ["Author"],
+            "givenName": "Martin",
+            "familyName": "Fenner",
+        }
+    ],
+    "titles": [{"title": "Eating your own Dog Food"}],
+    "publisher": {"name": "DataCite"},
+    "date": {"published": "2016-12-20"},
+}
+
+
+def test_get_commonmeta_validator():
+    "validator is compiled once and reused"
+    assert get_commonmeta_validator() is get_commonmeta_validator()
+
+
+def test_validate_commonmeta():
+    "validate commonmeta dict"
+    assert validate_commonmeta(VALID) is None
+    assert validate_commonmeta({**VALID, "type": "Blog"}).startswith(
+        "data.type must be one of ['Article', 'Audiovisual', 'BookChapter',"
+    )
+
+
+def test_validate_many():
+    "validate many commonmeta dicts"
+    invalid = {k: v for k, v in VALID.items() if k != "url"}
+    assert validate_many([VALID, invalid]) == [
+        None,
+        "data must contain ['url'] properties",
+    ]
+
+
+def test_generate_commonmeta_validator(tmp_path, monkeypatch):
+    "generated validator module is used instead of compiling the schema"
+    file_path = str(tmp_path / "commonmeta_validator.py")
+    monkeypatch.setattr(schema_utils, "COMMONMETA_VALIDATOR", file_path)
+    try:
+        assert generate_commonmeta_validator(file_path) == file_path
+        validate = get_commonmeta_validator()
+        assert validate.__module__ == "commonmeta_validator"
+        assert validate_commonmeta(VALID) is None
+        assert validate_commonmeta({"id": VALID["id"]}) == (
+            "data must contain ['contributors', 'date', 'publisher', 'titles', "
+            "'type', 'url'] properties"
+        )
+    finally:
+        get_commonmeta_validator.cache_clear()
@@ -6,6 +6,7 @@ import pytest  # noqa: F401
 
 from commonmeta.utils import (
     dict_to_spdx,
+    get_spdx_licenses,
     normalize_orcid,
     validate_orcid,
     normalize_ror,
@@ -21,6 +22,7 @@ from commonmeta.utils import (
     find_from_format_by_string,
     find_from_format_by_filename,
     find_from_format_by_ext,
+    sniff_format,
     from_schema_org,
     from_schema_org_creators,
     pages_as_string,
@@ -65,6 +67,27 @@ def test_dict_to_spdx_url():
     } == dict_to_spdx({"url": "https://creativecommons.org/licenses/by/4.0/legalcode"})
 
 
+def test_dict_to_spdx_case_insensitive_id():
+    "dict_to_spdx id matched case-insensitively"
+    assert {
+        "id": "MIT",
+        "url": "https://opensource.org/licenses/MIT",
+    } == dict_to_spdx({"id": "mit"})
+
+
+def test_get_spdx_licenses():
+    "spdx licenses are loaded and indexed once"
+    spdx, by_id, by_url = get_spdx_licenses()
+    assert get_spdx_licenses()[0] is spdx
+    assert spdx[by_id["cc-by-4.0"]]["licenseId"] == "CC-BY-4.0"
+    assert (
+        spdx[by_url["https://creativecommons.org/licenses/by/4.0/legalcode"]][
+            "licenseId"
+        ]
+        == "CC-BY-4.0"
+    )
+
+
 def test_dict_to_spdx_not_found():
     "dict_to_spdx not found"
     assert {"url": "info:eu-repo/semantics/openAccess"} == dict_to_spdx(
@@ -383,6 +406,43 @@ def test_find_from_format_by_ext():
     assert None is find_from_format_by_ext(".docx")
 
 
+def test_find_from_format_by_string():
+    """find_from_format_by_string"""
+    fixtures = path.join(path.dirname(__file__), "fixtures")
+    for file_name, via in [
+        ("crossref.json", "crossref"),
+        ("datacite.json", "datacite"),
+        ("codemeta.json", "codemeta"),
+        ("citeproc.json", "csl"),
+        ("crossref.xml", "crossref_xml"),
+        ("datacite.xml", "datacite_xml"),
+        ("CITATION.cff", "cff"),
+        ("crossref.ris", "ris"),
+        ("crossref.bib", "bibtex"),
+    ]:
+        with open(path.join(fixtures, file_name), encoding="utf-8") as file:
+            assert via == find_from_format_by_string(file.read())
+    assert None is find_from_format_by_string("<html><body>text</body></html>")
+    assert None is find_from_format_by_string("text")
+
+
+def test_sniff_format():
+    """sniff_format returns parsed JSON and YAML"""
+    assert sniff_format(' {"source": "Crossref"}') == (
+        "crossref",
+        {"source": "Crossref"},
+    )
+    via, data = sniff_format("cff-version: 1.2.0\ntitle: commonmeta-py\n")
+    assert via == "cff"
+    assert data == {"cff-version": "1.2.0", "title": "commonmeta-py"}
+    # XML is only parsed up to the first doi_record or resource element
+    assert sniff_format('\ufeff<resource xmlns="http://datacite.org/schema/kernel-4">') == (
+        "datacite_xml",
+        None,
+    )
+    assert sniff_format("TY  - JOUR\nER  - ") == ("ris", None)
+
+
 def test_find_from_format_by_string():
     """find_from_format_by_string"""
     # datacite